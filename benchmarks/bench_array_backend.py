@@ -0,0 +1,52 @@
+"""
+Benchmark the numpy backend against the Python backend on the English Bible.
+
+Run from the repository root:
+    python benchmarks/bench_array_backend.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import array_backend
+from caesar_encrypt import caesar_encrypt
+from vigenere_cipher import vigenere_encrypt, vigenere_decrypt
+
+from bench_utils import best_time
+
+
+BIBLE_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'bible_en.txt')
+
+
+def main():
+    if not array_backend.is_available():
+        print("NumPy is not installed; nothing to benchmark.")
+        return
+
+    with open(BIBLE_PATH, 'r', encoding='utf-8') as file:
+        text = file.read()
+    keyword = "Jerusalem"
+
+    print(f"Input: {BIBLE_PATH} ({len(text)} chars), keyword '{keyword}'")
+    print("=" * 70)
+    print(f"{'Function':<20} {'python (s)':>12} {'numpy (s)':>12} {'Speedup':>10}")
+    print("-" * 70)
+
+    cases = [
+        ("caesar_encrypt", caesar_encrypt, ("english", text, 3)),
+        ("vigenere_encrypt", vigenere_encrypt, ("english", text, keyword)),
+        ("vigenere_decrypt", vigenere_decrypt, ("english", text, keyword)),
+    ]
+    for name, func, args in cases:
+        python_time, python_result = best_time(func, *args, backend="python")
+        numpy_time, numpy_result = best_time(func, *args, backend="numpy")
+        assert numpy_result == python_result, f"{name}: numpy output differs from python output"
+        print(f"{name:<20} {python_time:>12.4f} {numpy_time:>12.4f} {python_time / numpy_time:>9.1f}x")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark the batch encryption functions against a loop over the single-message functions.
+
+Run from the repository root:
+    python benchmarks/bench_batch_api.py [--records N]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import array_backend
+from caesar_encrypt import caesar_encrypt, caesar_encrypt_many
+from vigenere_cipher import vigenere_encrypt, vigenere_encrypt_many
+
+from bench_utils import best_time
+
+
+BIBLE_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'bible_en.txt')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000, help="number of records (default: 20000)")
+    args = parser.parse_args()
+
+    with open(BIBLE_PATH, 'r', encoding='utf-8') as file:
+        lines = [line for line in file.read().splitlines() if line]
+    records = (lines * (args.records // len(lines) + 1))[:args.records]
+    keyword = "Jerusalem"
+
+    print(f"{len(records)} records, {sum(map(len, records)) // len(records)} chars on average, keyword '{keyword}'")
+    print("=" * 70)
+    print(f"{'Path':<40} {'Records/s':>14} {'Speedup':>9}")
+    print("-" * 70)
+
+    groups = [
+        ("vigenere_encrypt",
+         lambda: [vigenere_encrypt("english", text, keyword) for text in records],
+         [("vigenere_encrypt_many", lambda backend: vigenere_encrypt_many("english", records, keyword, backend))]),
+        ("caesar_encrypt",
+         lambda: [caesar_encrypt("english", text, 3) for text in records],
+         [("caesar_encrypt_many", lambda backend: caesar_encrypt_many("english", records, 3, backend))]),
+    ]
+    backends = ["python"] + (["numpy"] if array_backend.is_available() else [])
+    for name, loop, batch_funcs in groups:
+        loop_time, expected = best_time(loop)
+        print(f"{'loop over ' + name:<40} {len(records) / loop_time:>14,.0f} {1.0:>8.1f}x")
+        for batch_name, batch in batch_funcs:
+            for backend in backends:
+                batch_time, result = best_time(batch, backend)
+                assert result == expected, f"{batch_name} ({backend}) differs from {name}"
+                label = f"{batch_name} ({backend})"
+                print(f"{label:<40} {len(records) / batch_time:>14,.0f} {loop_time / batch_time:>8.1f}x")
+        print("-" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark the bytes-level cipher against decoding, encrypting the str and re-encoding.
+
+Run from the repository root:
+    python benchmarks/bench_bytes_cipher.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import array_backend
+import bytes_cipher
+from caesar_encrypt import caesar_encrypt_many
+from vigenere_cipher import vigenere_encrypt
+
+from bench_utils import best_time
+
+
+BIBLE_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'bible_en.txt')
+
+
+def main():
+    with open(BIBLE_PATH, 'rb') as file:
+        data = file.read()
+    keyword = "Jerusalem"
+    out = bytearray(len(data))
+    available = array_backend.is_available
+    backends = ["python", "numpy"] if available() else ["python"]
+
+    print(f"Input: {BIBLE_PATH} ({len(data)} bytes), keyword '{keyword}'")
+    print("=" * 70)
+    print(f"{'Path':<40} {'Time (s)':>10} {'MB/s':>9} {'Speedup':>9}")
+    print("-" * 70)
+
+    cases = [
+        ("vigenere", lambda: vigenere_encrypt("english", data.decode('utf-8'), keyword).encode('utf-8'),
+         lambda: bytes_cipher.vigenere_encrypt_bytes("english", data, keyword),
+         lambda: bytes_cipher.vigenere_encrypt_bytes("english", data, keyword, out=out)),
+        ("caesar", lambda: caesar_encrypt_many("english", [data.decode('utf-8')], 3)[0].encode('utf-8'),
+         lambda: bytes_cipher.caesar_encrypt_bytes("english", data, 3),
+         lambda: bytes_cipher.caesar_encrypt_bytes("english", data, 3, out=out)),
+    ]
+    for name, via_str, to_bytes, into_buffer in cases:
+        str_time, expected = best_time(via_str)
+        rows = [(f"{name}: decode + str cipher + encode", str_time)]
+        for label in backends:
+            if label == "python":
+                array_backend.is_available = lambda: False
+            try:
+                bytes_time, result = best_time(to_bytes)
+                assert result == expected, f"{name} bytes path ({label}) differs from the str path"
+                out_time, _ = best_time(into_buffer)
+            finally:
+                array_backend.is_available = available
+            assert bytes(out) == expected, f"{name} bytes path ({label}, out=) differs from the str path"
+            rows += [(f"{name}: bytes ({label})", bytes_time), (f"{name}: bytes into buffer ({label})", out_time)]
+        for label, elapsed in rows:
+            print(f"{label:<40} {elapsed:>10.4f} {len(data) / elapsed / 1e6:>9.1f} {str_time / elapsed:>8.1f}x")
+        print("-" * 70)
+
+
+if __name__ == "__main__":
+    main()
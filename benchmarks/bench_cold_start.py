@@ -0,0 +1,72 @@
+"""
+Benchmark the cold-start time of short command-line invocations.
+
+Each command runs in a fresh interpreter, the way a shell pipeline runs it,
+and is compared with an interpreter that does nothing. The slowest imports
+of the encrypt path are then listed from python -X importtime.
+
+Run from the repository root:
+    python benchmarks/bench_cold_start.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+CLI = os.path.join(ROOT, 'src', 'cli.py')
+MESSAGE = b"Meet me at the north gate at noon.\n"
+
+COMMANDS = [
+    ("python -c pass", [sys.executable, "-c", "pass"]),
+    ("cli encrypt (vigenere)", [sys.executable, CLI, "encrypt", "-k", "lemon"]),
+    ("cli encrypt (caesar)", [sys.executable, CLI, "encrypt", "--cipher", "caesar", "-s", "3"]),
+    ("cli analyze", [sys.executable, CLI, "analyze"]),
+    ("cli crib", [sys.executable, CLI, "crib", "--crib", "meet"]),
+]
+
+
+def run_time(command, runs):
+    """Return the median wall time of running command in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, input=MESSAGE, stdout=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def slowest_imports(command, limit=10):
+    """Return the (cumulative microseconds, module) pairs of the slowest imports of a command."""
+    result = subprocess.run([command[0], "-X", "importtime"] + command[1:], input=MESSAGE,
+                            capture_output=True, check=True)
+    imports = []
+    for line in result.stderr.decode().splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imports.append((int(cumulative), name.rstrip()))
+    return sorted(imports, reverse=True)[:limit]
+
+
+def main():
+    runs = 20
+    print(f"{'Command':<26} {'Median (ms)':>12} {'Over bare python':>17}")
+    print("-" * 57)
+    baseline = None
+    for name, command in COMMANDS:
+        elapsed = run_time(command, runs)
+        if baseline is None:
+            baseline = elapsed
+        print(f"{name:<26} {elapsed:>12.1f} {elapsed - baseline:>16.1f}")
+
+    print("\nSlowest imports of 'cli encrypt' (cumulative):")
+    for cumulative, name in slowest_imports(COMMANDS[1][1]):
+        print(f"  {cumulative / 1000:>7.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark the memory use of crib search aggregation.
+
+The English Bible is encrypted with 'Jerusalem' and searched for a few
+cribs three ways: the full result list aggregated by analyze_crib_results,
+the compact matches of compact_crib_search, and the streaming top-k counts
+of top_crib_fragments (what print_crib_analysis uses). For each, the peak
+memory allocated during the call, the memory still held by its result and
+the wall time are reported.
+
+Run from the repository root:
+    python benchmarks/bench_crib_memory.py [--cribs the,jerusalem] [--length N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cyber_tools import analyze_crib_results, compact_crib_search, top_crib_fragments, vigenere_crib_search
+from instrumentation import trace_memory
+from vigenere_cipher import vigenere_encrypt
+
+
+BIBLE_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'bible_en.txt')
+KEYWORD = "Jerusalem"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cribs", default="the,jerusalem,in the beginning god",
+                        help="comma-separated cribs")
+    parser.add_argument("--length", type=int, help="characters of the Bible to encrypt (default: all)")
+    args = parser.parse_args()
+
+    with open(BIBLE_PATH, 'r', encoding='utf-8') as file:
+        text = file.read(args.length) if args.length else file.read()
+    ciphertext = vigenere_encrypt('english', text, KEYWORD)
+    print(f"Ciphertext: {len(ciphertext)} characters\n")
+
+    methods = [
+        ("analyze_crib_results", lambda crib: analyze_crib_results(vigenere_crib_search(ciphertext, crib))),
+        ("compact_crib_search", lambda crib: compact_crib_search(ciphertext, crib)),
+        ("top_crib_fragments", lambda crib: top_crib_fragments(ciphertext, crib)),
+    ]
+    print(f"{'Crib':<24} {'Method':<22} {'Peak MB':>9} {'Kept MB':>9} {'Seconds':>9}")
+    for crib in args.cribs.split(","):
+        for name, method in methods:
+            start = time.perf_counter()
+            method(crib)
+            seconds = time.perf_counter() - start
+            result, memory = trace_memory(method, crib)
+            del result
+            print(f"{crib:<24} {name:<22} {memory['peak'] / 1e6:>9.1f} {memory['current'] / 1e6:>9.1f} "
+                  f"{seconds:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
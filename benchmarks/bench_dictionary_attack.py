@@ -0,0 +1,88 @@
+"""
+Benchmark the Vigenère dictionary attack against fully decrypting every candidate.
+
+A wordlist of random candidate keywords is written to a temporary file, with
+the real keyword planted near the end, and streamed through
+dictionary_attack with 1 to N worker processes. The baseline decrypts the
+whole ciphertext with every candidate and scores it with the n-gram model,
+timed on a sample of the candidates.
+
+Run from the repository root:
+    python benchmarks/bench_dictionary_attack.py [--candidates 1000000] [--max-workers N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from dictionary_attack import dictionary_attack, read_wordlist
+from language_model import encode_text, get_ngram_model
+from vigenere_cipher import vigenere_decrypt, vigenere_encrypt
+
+
+BIBLE_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'bible_en.txt')
+KEYWORD = "Jerusalem"
+
+
+def write_wordlist(path, count, seed=0):
+    """Write count random candidate keywords, with KEYWORD at 90% of the list."""
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    planted = count * 9 // 10
+    with open(path, 'w', encoding='utf-8') as file:
+        for i in range(count):
+            if i == planted:
+                file.write(KEYWORD + '\n')
+            file.write(''.join(rng.choices(letters, k=rng.randint(3, 12))) + '\n')
+
+
+def naive_rate(ciphertext, path, sample):
+    """Candidates per minute when every candidate decrypts and scores the whole ciphertext."""
+    model = get_ngram_model('english')
+    words = [word for _, word in zip(range(sample), read_wordlist(path))]
+    start = time.perf_counter()
+    for word in words:
+        model.score(encode_text('english', vigenere_decrypt('english', ciphertext, word)))
+    return len(words) / (time.perf_counter() - start) * 60
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=1_000_000, help="wordlist size")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--ciphertext-length", type=int, default=3000, help="characters of ciphertext")
+    parser.add_argument("--naive-sample", type=int, default=2000, help="candidates timed for the baseline")
+    args = parser.parse_args()
+
+    with open(BIBLE_PATH, 'r', encoding='utf-8') as file:
+        plaintext = file.read()[5000:5000 + args.ciphertext_length]
+    ciphertext = vigenere_encrypt('english', plaintext, KEYWORD)
+    get_ngram_model('english')  # Build or load the cached model outside the timings
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'words.txt')
+        write_wordlist(path, args.candidates)
+
+        naive = naive_rate(ciphertext, path, args.naive_sample)
+        print(f"{'Method':<28} {'Seconds':>9} {'Candidates/min':>16} {'Speedup':>8}  Found")
+        print("-" * 72)
+        print(f"{'full decrypt (estimated)':<28} {args.candidates / naive * 60:>9.2f} {naive:>16,.0f} {1:>7.1f}x")
+
+        workers = 1
+        while workers <= args.max_workers:
+            start = time.perf_counter()
+            results = dictionary_attack(ciphertext, read_wordlist(path), workers=workers)
+            elapsed = time.perf_counter() - start
+            rate = (args.candidates + 1) / elapsed * 60
+            found = bool(results) and results[0]['key'] == KEYWORD
+            print(f"{f'dictionary_attack x{workers}':<28} {elapsed:>9.2f} {rate:>16,.0f} {rate / naive:>7.1f}x  {found}")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark vigenere_encrypt latency on short messages with and without the key-schedule cache.
+
+Run from the repository root:
+    python benchmarks/bench_key_cache.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from vigenere_cipher import vigenere_encrypt, clear_key_cache, key_cache_info
+
+
+MESSAGES = [
+    "Meet me at the north gate at noon.",
+    "The package is delayed until Friday.",
+    "Hello World",
+    "Move the meeting to room twelve, please.",
+]
+KEYWORDS = ["Jerusalem", "lemon", "Key", "Himmelfarb"]
+
+
+def per_call_time(func, calls):
+    """Return the average wall time of func() in microseconds over several calls."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    calls = 20000
+    pairs = [(message, keyword) for message in MESSAGES for keyword in KEYWORDS]
+
+    def encrypt_cold():
+        for message, keyword in pairs:
+            clear_key_cache()
+            vigenere_encrypt("english", message, keyword)
+
+    def encrypt_warm():
+        for message, keyword in pairs:
+            vigenere_encrypt("english", message, keyword)
+
+    cold = per_call_time(encrypt_cold, calls // len(pairs)) / len(pairs)
+    clear_key_cache()
+    warm = per_call_time(encrypt_warm, calls // len(pairs)) / len(pairs)
+
+    print(f"{len(pairs)} (message, keyword) pairs, ~{sum(map(len, MESSAGES)) // len(MESSAGES)} chars per message")
+    print("=" * 60)
+    print(f"{'Path':<28} {'us/call':>10} {'Speedup':>9}")
+    print("-" * 60)
+    print(f"{'cache miss every call':<28} {cold:>10.2f} {1.0:>8.1f}x")
+    print(f"{'cache hit':<28} {warm:>10.2f} {cold / warm:>8.1f}x")
+    print("-" * 60)
+    print(f"Cache: {key_cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
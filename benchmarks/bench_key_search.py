@@ -0,0 +1,88 @@
+"""
+Benchmark key recovery on short Vigenère ciphertexts.
+
+Every paragraph of assets/jeruslaem_history_encrypted.txt (keyword
+'himmelfarb') is solved on its own, once with break_vigenere (frequency
+analysis of the key columns) and once with solve_vigenere (hill climbing
+on n-gram fitness), with and without NumPy. A paragraph counts as solved
+when the recovered keyword is a rotation of the real one; for the key
+search the time until that keyword was first found is reported too.
+
+Run from the repository root:
+    python benchmarks/bench_key_search.py [--time-budget 2] [--workers 1]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import array_backend
+from cyber_tools import break_vigenere
+from key_search import solve_vigenere
+
+
+ASSET_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'jeruslaem_history_encrypted.txt')
+KEYWORD = "himmelfarb"
+
+
+def is_solved(key):
+    return len(key) == len(KEYWORD) and key.lower() in KEYWORD + KEYWORD
+
+
+def load_paragraphs(min_length):
+    with open(ASSET_PATH, 'r', encoding='utf-8') as file:
+        return [paragraph for paragraph in file.read().split('\n\n') if len(paragraph) >= min_length]
+
+
+def time_to_solution(paragraph, time_budget, workers, seed):
+    """Seconds until the keyword was first reported, or None if it was not found."""
+    found = []
+
+    def record(best):
+        if not found and is_solved(best['key']):
+            found.append(best['elapsed'])
+
+    results = solve_vigenere(paragraph, time_budget=time_budget, workers=workers, seed=seed, callback=record)
+    return found[0] if found and results and is_solved(results[0]['key']) else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--time-budget", type=float, default=2.0, help="seconds per paragraph (default: 2)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-length", type=int, default=60, help="shortest paragraph to solve")
+    args = parser.parse_args()
+
+    paragraphs = load_paragraphs(args.min_length)
+    backends = ["numpy", "python"] if array_backend.is_available() else ["python"]
+    solved = {name: 0 for name in ["break_vigenere"] + backends}
+    print(f"{'Chars':>6} {'break_vigenere':>15} " + " ".join(f"{name + ' (s)':>12}" for name in backends))
+    for paragraph in paragraphs:
+        start = time.perf_counter()
+        results = break_vigenere(paragraph, 'english')
+        broken = bool(results) and is_solved(results[0]['key'])
+        solved["break_vigenere"] += broken
+        row = f"{len(paragraph):>6} {'yes' if broken else 'no':>11} {time.perf_counter() - start:>3.1f}s"
+        available = array_backend.is_available
+        for name in backends:
+            if name == "python":
+                array_backend.is_available = lambda: False
+            try:
+                seconds = time_to_solution(paragraph, args.time_budget, args.workers, args.seed)
+            finally:
+                array_backend.is_available = available
+            solved[name] += seconds is not None
+            row += f" {'-' if seconds is None else f'{seconds:.2f}':>12}"
+        print(row)
+
+    print()
+    for name, count in solved.items():
+        print(f"{name:<16} solved {count}/{len(paragraphs)}")
+
+
+if __name__ == "__main__":
+    main()
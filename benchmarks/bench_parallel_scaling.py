@@ -0,0 +1,56 @@
+"""
+Benchmark how vigenere_encrypt_parallel scales from 1 to N worker processes.
+
+Run from the repository root:
+    python benchmarks/bench_parallel_scaling.py [--copies 8] [--max-workers N] [--backend python]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from parallel_cipher import vigenere_encrypt_parallel
+from vigenere_cipher import vigenere_encrypt
+
+
+BIBLE_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'bible_en.txt')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--copies", type=int, default=8, help="number of copies of the bible to encrypt")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--backend", default="python", choices=["python", "numpy"])
+    args = parser.parse_args()
+
+    with open(BIBLE_PATH, 'r', encoding='utf-8') as file:
+        text = file.read() * args.copies
+    keyword = "Jerusalem"
+
+    print(f"Input: {args.copies} x bible_en.txt ({len(text)} chars), backend '{args.backend}'")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    expected = vigenere_encrypt("english", text, keyword, backend=args.backend)
+    sequential_time = time.perf_counter() - start
+
+    print(f"{'Workers':<10} {'Time (s)':>10} {'Chars/s':>14} {'Speedup':>9}")
+    print("-" * 70)
+    print(f"{'seq':<10} {sequential_time:>10.3f} {len(text) / sequential_time:>14,.0f} {1.0:>8.1f}x")
+
+    worker_counts = sorted({2 ** i for i in range(args.max_workers.bit_length())} | {args.max_workers})
+    for workers in worker_counts:
+        start = time.perf_counter()
+        result = vigenere_encrypt_parallel("english", text, keyword, workers=workers, backend=args.backend)
+        elapsed = time.perf_counter() - start
+        assert result == expected, f"parallel output with {workers} workers differs from vigenere_encrypt"
+        print(f"{workers:<10} {elapsed:>10.3f} {len(text) / elapsed:>14,.0f} {sequential_time / elapsed:>8.1f}x")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
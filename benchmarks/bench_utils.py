@@ -0,0 +1,21 @@
+"""
+Helpers shared by the benchmark scripts.
+
+The scripts are run directly (python benchmarks/bench_*.py), which puts this
+directory on sys.path, so they import from here with "from bench_utils import ...".
+"""
+
+import time
+
+
+def best_time(func, *args, repeat=3, **kwargs):
+    """Return (best wall time in seconds, last result) over several runs."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
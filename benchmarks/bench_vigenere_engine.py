@@ -0,0 +1,74 @@
+"""
+Benchmark the compiled VigenereCipher against a plain per-character loop.
+
+Run from the repository root:
+    python benchmarks/bench_vigenere_engine.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from alphabets import get_alphabet
+from vigenere_cipher import VigenereCipher
+
+from bench_utils import best_time
+
+
+BIBLE_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'bible_en.txt')
+
+
+def reference_transform(lang, text, keyword, sign):
+    """Per-character loop without precomputed tables (the original implementation)."""
+    alphabet = list(get_alphabet(lang))
+    key_shifts = [alphabet.index(char.lower()) for char in keyword if char.lower() in alphabet]
+    size = len(alphabet)
+    key_pos = 0
+    result = ""
+    for char in text:
+        lower_char = char.lower()
+        if lower_char in alphabet:
+            shift = key_shifts[key_pos % len(key_shifts)]
+            new_char = alphabet[(alphabet.index(lower_char) + sign * shift) % size]
+            result += new_char if char == lower_char else new_char.upper()
+            key_pos += 1
+        else:
+            result += char
+    return result
+
+
+def main():
+    with open(BIBLE_PATH, 'r', encoding='utf-8') as file:
+        text = file.read()
+    keyword = "Jerusalem"
+
+    print(f"Input: {BIBLE_PATH} ({len(text)} chars), keyword '{keyword}'")
+    print("=" * 70)
+
+    ref_enc_time, ref_encrypted = best_time(reference_transform, "english", text, keyword, 1)
+    ref_dec_time, ref_decrypted = best_time(reference_transform, "english", ref_encrypted, keyword, -1)
+
+    compile_time, cipher = best_time(VigenereCipher, "english", keyword)
+    enc_time, encrypted = best_time(cipher.encrypt, text)
+    dec_time, decrypted = best_time(cipher.decrypt, encrypted)
+
+    assert encrypted == ref_encrypted, "compiled encryption differs from the reference loop"
+    assert decrypted == ref_decrypted, "compiled decryption differs from the reference loop"
+
+    print(f"{'Path':<28} {'Time (s)':>10} {'Chars/s':>14} {'Speedup':>9}")
+    print("-" * 70)
+    rows = [
+        ("reference encrypt", ref_enc_time, ref_enc_time),
+        ("VigenereCipher.encrypt", enc_time, ref_enc_time),
+        ("reference decrypt", ref_dec_time, ref_dec_time),
+        ("VigenereCipher.decrypt", dec_time, ref_dec_time),
+    ]
+    for name, elapsed, reference in rows:
+        print(f"{name:<28} {elapsed:>10.4f} {len(text) / elapsed:>14,.0f} {reference / elapsed:>8.1f}x")
+    print("-" * 70)
+    print(f"Compiling VigenereCipher: {compile_time * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Load-test the cipher server and report latency percentiles and throughput.
+
+Starts a server in a subprocess unless --url points at a running one.
+
+Run from the repository root:
+    python benchmarks/load_test_server.py --requests 20000 --concurrency 64 --workers 2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'cipher_server.py')
+BIBLE_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'bible_en.txt')
+
+
+async def post(reader, writer, host, path, payload):
+    """Send one keep-alive POST request and return (status, decoded JSON body)."""
+    body = json.dumps(payload).encode('utf-8')
+    writer.write(f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode('latin-1') + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def client(host, port, requests, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for path, payload in requests:
+            start = time.perf_counter()
+            status, _ = await post(reader, writer, host, path, payload)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, requests, concurrency):
+    latencies = []
+    statuses = {}
+    shares = [requests[i::concurrency] for i in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, share, latencies, statuses) for share in shares if share))
+    return time.perf_counter() - start, latencies, statuses
+
+
+def build_requests(count):
+    with open(BIBLE_PATH, 'r', encoding='utf-8') as file:
+        lines = [line for line in file.read(2_000_000).splitlines() if line]
+    keywords = ["Jerusalem", "lemon", "Key"]
+    requests = []
+    for i in range(count):
+        text = lines[i % len(lines)]
+        kind = i % 4
+        if kind == 0:
+            requests.append(("/vigenere/encrypt", {"lang": "english", "text": text, "keyword": keywords[i % 3]}))
+        elif kind == 1:
+            requests.append(("/vigenere/decrypt", {"lang": "english", "text": text, "keyword": keywords[i % 3]}))
+        elif kind == 2:
+            requests.append(("/caesar/encrypt", {"lang": "english", "text": text, "shift": 3}))
+        else:
+            requests.append(("/frequency", {"lang": "english", "text": text}))
+    return requests
+
+
+def wait_for_port(host, port, timeout=10.0):
+    """Wait until a server accepts connections on host:port."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection((host, port), timeout=0.5).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the cipher server.")
+    parser.add_argument("--url", help="running server, e.g. http://127.0.0.1:8080 (default: start one)")
+    parser.add_argument("--requests", type=int, default=10000, help="total requests (default: 10000)")
+    parser.add_argument("--concurrency", type=int, default=32, help="concurrent connections (default: 32)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes for a started server (default: CPU count, 0 for none)")
+    parser.add_argument("--max-batch", type=int, default=64, help="batch size for a started server")
+    args = parser.parse_args()
+
+    process = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+    else:
+        host, port = "127.0.0.1", 18080
+        process = subprocess.Popen([sys.executable, SERVER_PATH, "--port", str(port), "--workers", str(args.workers),
+                                    "--max-batch", str(args.max_batch), "--max-pending", str(args.requests)],
+                                   stdout=subprocess.DEVNULL)
+        wait_for_port(host, port)
+
+    try:
+        requests = build_requests(args.requests)
+        elapsed, latencies, statuses = asyncio.run(run_load(host, port, requests, args.concurrency))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    print(f"{len(latencies)} requests, {args.concurrency} connections, statuses {statuses}")
+    print("=" * 50)
+    print(f"Throughput: {len(latencies) / elapsed:>12,.0f} requests/s")
+    print(f"p50:        {percentile(latencies, 0.50) * 1000:>12.2f} ms")
+    print(f"p99:        {percentile(latencies, 0.99) * 1000:>12.2f} ms")
+    print(f"mean:       {statistics.mean(latencies) * 1000:>12.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+Benchmark suite for the cipher and analysis hot paths, with JSON output and baselines.
+
+Every case is timed for each language and input size (1 KB up to the full
+English Bible). English input is taken from assets/bible_en.txt; Hebrew
+input from assets/bible_he.txt when present, otherwise from a
+deterministic text drawn from the Hebrew Bible letter frequencies.
+
+Run from the repository root:
+    python benchmarks/run_benchmarks.py                          # print a table
+    python benchmarks/run_benchmarks.py --output results.json    # also save JSON
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baselines/baseline.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baselines/baseline.json
+
+With --baseline, every case is compared against the stored timing and the
+script exits with status 1 if any case is slower than the baseline by more
+than --tolerance (default 25%), or has no entry in the baseline at all (the
+baseline must be re-recorded whenever a case is added). Baselines are
+machine-specific: record one on the machine that runs the comparison.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import array_backend
+from caesar_encrypt import caesar_encrypt, crack_caesar
+from cyber_tools import (analyze_crib_results, compact_crib_search, frequency_analysis, top_crib_fragments,
+                         vigenere_crib_search)
+from language_model import BUILTIN_COUNTS, encode_text, get_ngram_model
+from vigenere_cipher import vigenere_encrypt, vigenere_decrypt
+
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+CORPORA = {
+    'english': os.path.join(ROOT, 'assets', 'bible_en.txt'),
+    'hebrew': os.path.join(ROOT, 'assets', 'bible_he.txt'),
+}
+KEYWORDS = {'english': "Jerusalem", 'hebrew': "ירושלים"}
+CRIBS = {'english': "jerusalem", 'hebrew': "ירושלים"}
+SIZES = {'1K': 1024, '16K': 16 * 1024, '256K': 256 * 1024, 'full': None}
+DEFAULT_TOLERANCE = 0.25
+
+
+def load_corpus(lang, length=None):
+    """
+    Load the benchmark text for a language.
+
+    Args:
+        lang (str): 'english' or 'hebrew'
+        length (int): Characters to generate when no Hebrew corpus exists
+
+    Returns:
+        str: Corpus text
+    """
+    path = CORPORA[lang]
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as file:
+            return file.read()
+    counts = BUILTIN_COUNTS[lang]
+    rng = random.Random(0)
+    return ''.join(rng.choices(list(counts), weights=list(counts.values()), k=length))
+
+
+def build_cases(lang, text):
+    """
+    Build the (name, function) pairs to time on one input.
+
+    Each function runs the operation once. Decryption and the crib result
+    analysis get their inputs prepared outside of the timing.
+    """
+    keyword = KEYWORDS[lang]
+    crib = CRIBS[lang]
+    ciphertext = vigenere_encrypt(lang, text, keyword)
+    caesar_text = caesar_encrypt(lang, text, 3)
+    crib_results = vigenere_crib_search(ciphertext, crib, lang)
+    cases = [
+        ("caesar_encrypt", lambda: caesar_encrypt(lang, text, 3)),
+        ("vigenere_encrypt", lambda: vigenere_encrypt(lang, text, keyword)),
+        ("vigenere_decrypt", lambda: vigenere_decrypt(lang, ciphertext, keyword)),
+        ("crack_caesar", lambda: crack_caesar(lang, caesar_text)),
+        ("frequency_analysis", lambda: frequency_analysis(lang, text)),
+        ("vigenere_crib_search", lambda: vigenere_crib_search(ciphertext, crib, lang)),
+        ("analyze_crib_results", lambda: analyze_crib_results(crib_results)),
+        ("compact_crib_search", lambda: compact_crib_search(ciphertext, crib, lang)),
+        ("top_crib_fragments", lambda: top_crib_fragments(ciphertext, crib, lang)),
+    ]
+    model = get_ngram_model(lang)
+    if model is not None:
+        indices = encode_text(lang, text)
+        cases.append(("ngram_score", lambda: model.score(indices)))
+    if array_backend.is_available():
+        cases += [
+            ("vigenere_encrypt[numpy]", lambda: vigenere_encrypt(lang, text, keyword, backend="numpy")),
+            ("caesar_encrypt[numpy]", lambda: caesar_encrypt(lang, text, 3, backend="numpy")),
+        ]
+    return cases
+
+
+def time_case(func, repeat, min_time=0.05):
+    """
+    Time func, looping it so that every sample lasts at least min_time seconds.
+
+    Returns:
+        tuple: (best, median) seconds per call
+    """
+    func()  # Warm up caches
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+    return min(samples), statistics.median(samples)
+
+
+def run_suite(langs, sizes, repeat, name_filter=None, log=print):
+    """
+    Run every case for every language and size.
+
+    Returns:
+        list: One dict per case with name, lang, size, chars, best and median
+    """
+    results = []
+    full_length = len(load_corpus('english'))
+    for lang in langs:
+        corpus = load_corpus(lang, full_length)
+        for size_name in sizes:
+            length = SIZES[size_name]
+            text = corpus if length is None else corpus[:length]
+            for name, func in build_cases(lang, text):
+                if name_filter and name_filter not in name:
+                    continue
+                best, median = time_case(func, repeat)
+                result = {'name': name, 'lang': lang, 'size': size_name, 'chars': len(text),
+                          'best': best, 'median': median}
+                results.append(result)
+                log(f"{name:<26} {lang:<8} {size_name:>5} {best * 1000:>11.3f} {len(text) / best / 1e6:>10.2f}")
+    return results
+
+
+def environment():
+    """
+    Describe the machine and code version the results were recorded on.
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    numpy_version = array_backend.np.__version__ if array_backend.is_available() else None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'numpy': numpy_version,
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE, log=print):
+    """
+    Compare results against baseline results.
+
+    Returns:
+        tuple: (results with a 'ratio' to the baseline that are slower than
+        the baseline by more than tolerance, results that have no entry in
+        the baseline)
+    """
+    reference = {(entry['name'], entry['lang'], entry['size']): entry for entry in baseline['results']}
+    regressions = []
+    missing = []
+    log(f"\n{'Case':<26} {'Lang':<8} {'Size':>5} {'Baseline ms':>12} {'Now ms':>11} {'Ratio':>7}")
+    for result in results:
+        entry = reference.get((result['name'], result['lang'], result['size']))
+        if entry is None:
+            missing.append(result)
+            log(f"{result['name']:<26} {result['lang']:<8} {result['size']:>5} {'-':>12} "
+                f"{result['best'] * 1000:>11.3f} {'':>7}  MISSING FROM BASELINE")
+            continue
+        ratio = result['best'] / entry['best']
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressions.append({**result, 'ratio': ratio})
+            flag = "  REGRESSION"
+        log(f"{result['name']:<26} {result['lang']:<8} {result['size']:>5} {entry['best'] * 1000:>12.3f} "
+            f"{result['best'] * 1000:>11.3f} {ratio:>6.2f}x{flag}")
+    return regressions, missing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the cipher and analysis benchmark suite.")
+    parser.add_argument("--langs", default="english,hebrew", help="comma-separated languages")
+    parser.add_argument("--sizes", default=",".join(SIZES), help=f"comma-separated sizes ({', '.join(SIZES)})")
+    parser.add_argument("--filter", help="only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="timing samples per case (default: 5)")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--save-baseline", help="write the results as a baseline JSON file")
+    parser.add_argument("--baseline", help="compare against this baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown against the baseline (default: 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    langs = args.langs.split(",")
+    sizes = args.sizes.split(",")
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"unknown sizes: {', '.join(unknown)}")
+
+    print(f"{'Case':<26} {'Lang':<8} {'Size':>5} {'Best (ms)':>11} {'Mchars/s':>10}")
+    print("-" * 64)
+    report = {'environment': environment(), 'results': run_suite(langs, sizes, args.repeat, args.filter)}
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(report, file, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions, missing = compare(report['results'], baseline, args.tolerance)
+        if missing:
+            print(f"\n{len(missing)} case(s) missing from the baseline; record it again with --save-baseline")
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower than the baseline by more than {args.tolerance:.0%}")
+        if missing or regressions:
+            return 1
+        print("\nNo regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
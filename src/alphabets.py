@@ -2,6 +2,11 @@
 Alphabet definitions for different languages used in cipher implementations.
 """
 
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import wraps
+
 # English alphabet in lowercase
 english_alphabet = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', ' ']
 
@@ -15,17 +20,344 @@ ALPHABETS = {
 }
 
 
+class Alphabet(Sequence):
+    """
+    Immutable alphabet compiled into lookup tables.
+    
+    Behaves like the list of its characters (len, indexing, iteration, `in`,
+    index), but membership and index() are dict lookups instead of list scans.
+    
+    Attributes:
+        name (str): Language name
+        symbols (tuple): Alphabet characters in order (lowercase)
+        upper (dict): Symbol -> uppercase form, for symbols that have one
+        lookup (array): Codepoint -> symbol index (-1 if not a symbol), with one
+            extra -1 entry for any larger codepoint; usable from NumPy through
+            numpy.frombuffer(lookup, dtype=numpy.intc)
+        shift_tables (tuple): For each shift, a dict mapping every symbol and
+            its uppercase form to the shifted character (case preserved)
+    """
+    
+    __slots__ = ('name', 'symbols', 'upper', 'lookup', 'shift_tables', '_index')
+    
+    def __init__(self, name, symbols):
+        symbols = tuple(symbols)
+        index = {char: i for i, char in enumerate(symbols)}
+        upper = {char: char.upper() for char in symbols if char.upper() != char}
+        
+        lookup = array('i', [-1]) * (max(map(ord, symbols), default=0) + 2)
+        for i, char in enumerate(symbols):
+            lookup[ord(char)] = i
+        
+        size = len(symbols)
+        shift_tables = []
+        for shift in range(size):
+            table = {}
+            for i, char in enumerate(symbols):
+                new_char = symbols[(i + shift) % size]
+                table[char] = new_char
+                if char in upper:
+                    table[upper[char]] = new_char.upper()
+            shift_tables.append(table)
+        
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'symbols', symbols)
+        object.__setattr__(self, 'upper', upper)
+        object.__setattr__(self, 'lookup', lookup)
+        object.__setattr__(self, 'shift_tables', tuple(shift_tables))
+        object.__setattr__(self, '_index', index)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Alphabet objects are immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("Alphabet objects are immutable")
+    
+    def __len__(self):
+        return len(self.symbols)
+    
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return list(self.symbols[item])
+        return self.symbols[item]
+    
+    def __iter__(self):
+        return iter(self.symbols)
+    
+    def __contains__(self, char):
+        return char in self._index
+    
+    def index(self, char, start=0, stop=None):
+        """Return the position of char in the alphabet (raises ValueError if missing)."""
+        try:
+            i = self._index[char]
+        except (KeyError, TypeError):
+            raise ValueError(f"{char!r} is not in the {self.name} alphabet") from None
+        if i < start or (stop is not None and i >= stop):
+            raise ValueError(f"{char!r} is not in the given range of the {self.name} alphabet")
+        return i
+    
+    def count(self, char):
+        return 1 if char in self._index else 0
+    
+    def get_index(self, char, default=None):
+        """Return the position of char in the alphabet, or default if missing."""
+        return self._index.get(char, default)
+    
+    def __eq__(self, other):
+        if isinstance(other, Alphabet):
+            return self.symbols == other.symbols
+        if isinstance(other, (list, tuple)):
+            return self.symbols == tuple(other)
+        return NotImplemented
+    
+    def __hash__(self):
+        return hash(self.symbols)
+    
+    def __repr__(self):
+        return f"Alphabet({self.name!r}, {list(self.symbols)!r})"
+    
+    def __reduce__(self):
+        return (Alphabet, (self.name, self.symbols))
+
+
+BUILTIN_LANGUAGES = frozenset(ALPHABETS)
+
+# Compiled Alphabet objects, built on first use and kept in LRU order
+DEFAULT_ALPHABET_CACHE_SIZE = 32
+_compiled_alphabets = OrderedDict()
+_cache_size = DEFAULT_ALPHABET_CACHE_SIZE
+_cache_stats = {'hits': 0, 'misses': 0}
+# Caches of tables other modules derive from an alphabet (see alphabet_table_cache)
+_table_caches = []
+
+
 def get_alphabet(language):
     """
     Get the alphabet for a specific language.
     
     Args:
-        language (str): Language name ('english' or 'hebrew')
+        language (str): Language name ('english', 'hebrew' or a registered alphabet)
+    
+    Returns:
+        Alphabet: Cached compiled alphabet (usable like a list of characters),
+        or None if language not supported
+    """
+    language = language.lower()
+    alphabet = _compiled_alphabets.get(language)
+    if alphabet is not None:
+        _cache_stats['hits'] += 1
+        _compiled_alphabets.move_to_end(language)
+        return alphabet
+    
+    symbols = ALPHABETS.get(language)
+    if symbols is None:
+        return None
+    _cache_stats['misses'] += 1
+    alphabet = _compiled_alphabets[language] = Alphabet(language, symbols)
+    while len(_compiled_alphabets) > _cache_size:
+        _compiled_alphabets.popitem(last=False)
+    return alphabet
+
+
+def set_alphabet_cache_size(size):
+    """
+    Set how many compiled alphabets are kept in memory (least recently used are dropped).
+    
+    The tables the NumPy and bytes backends build per alphabet (see
+    alphabet_table_cache) are bounded by the same size.
+    
+    Args:
+        size (int): Maximum number of compiled alphabets (at least 1)
+    """
+    global _cache_size
+    if size < 1:
+        raise ValueError("Alphabet cache size must be at least 1")
+    _cache_size = size
+    for cache in [_compiled_alphabets] + _table_caches:
+        while len(cache) > _cache_size:
+            cache.popitem(last=False)
+
+
+def alphabet_table_cache(func):
+    """
+    Decorator caching a table built from an alphabet (e.g. its symbols tuple).
+    
+    Like the compiled alphabets, the tables are kept in LRU order and bounded
+    by set_alphabet_cache_size.
+    
+    Args:
+        func: Function of one hashable argument describing the alphabet
+    
+    Returns:
+        function: Cached version of func, with a cache_clear() method
+    """
+    cache = OrderedDict()
+    _table_caches.append(cache)
+    
+    @wraps(func)
+    def cached(key):
+        table = cache.get(key)
+        if table is not None:
+            cache.move_to_end(key)
+            return table
+        table = cache[key] = func(key)
+        while len(cache) > _cache_size:
+            cache.popitem(last=False)
+        return table
+    
+    cached.cache_clear = cache.clear
+    return cached
+
+
+def alphabet_cache_info():
+    """
+    Get statistics about the compiled alphabet cache.
+    
+    Returns:
+        dict: 'hits', 'misses', 'size' and 'maxsize'
+    """
+    return {**_cache_stats, 'size': len(_compiled_alphabets), 'maxsize': _cache_size}
+
+
+def validate_alphabet(symbols):
+    """
+    Check that a list of symbols can be used as a cipher alphabet.
+    
+    Text is lowercased before it is matched against the alphabet, so every
+    symbol must be a single lowercase (or caseless) character whose
+    uppercase form is a single character that lowercases back to the symbol
+    (not e.g. 'ß' -> 'SS' or dotless 'ı' -> 'I' -> 'i'). Symbols must be
+    unique, and no two symbols may share an uppercase form, otherwise case
+    could not be restored after encryption.
+    
+    Args:
+        symbols (list): Alphabet characters
+    
+    Raises:
+        ValueError: If the alphabet is invalid
+    """
+    if not symbols:
+        raise ValueError("Alphabet must contain at least one symbol")
+    seen = set()
+    uppercase_forms = {}
+    for char in symbols:
+        if not isinstance(char, str) or len(char) != 1:
+            raise ValueError(f"Alphabet symbols must be single characters, got {char!r}")
+        if char in seen:
+            raise ValueError(f"Duplicate alphabet symbol {char!r}")
+        seen.add(char)
+        if char.lower() != char:
+            raise ValueError(f"Alphabet symbol {char!r} must be lowercase (text is lowercased before matching)")
+        upper_char = char.upper()
+        if len(upper_char) != 1 or upper_char.lower() != char:
+            raise ValueError(f"Alphabet symbol {char!r} has the uppercase form {upper_char!r}, "
+                             "which does not lowercase back to it")
+        if upper_char != char:
+            if upper_char in uppercase_forms:
+                raise ValueError(
+                    f"Alphabet symbols {uppercase_forms[upper_char]!r} and {char!r} share the uppercase form {upper_char!r}")
+            uppercase_forms[upper_char] = char
+    for upper_char, char in uppercase_forms.items():
+        if upper_char in seen:
+            raise ValueError(f"Alphabet contains both {char!r} and its uppercase form {upper_char!r}")
+
+
+def register_alphabet(language, symbols, replace=False):
+    """
+    Register a new alphabet at runtime.
+    
+    Args:
+        language (str): Language name (case-insensitive)
+        symbols (list or str): Alphabet characters in order; a string is split into characters
+        replace (bool): Allow replacing an alphabet that is already registered
+    
+    Raises:
+        ValueError: If the alphabet is invalid or the language is already registered
+    """
+    if not isinstance(language, str) or not language.strip():
+        raise ValueError("Language name must be a non-empty string")
+    language = language.strip().lower()
+    symbols = list(symbols)
+    validate_alphabet(symbols)
+    if language in ALPHABETS and not replace:
+        raise ValueError(f"Alphabet '{language}' is already registered")
+    
+    ALPHABETS[language] = symbols
+    _compiled_alphabets.pop(language, None)  # Recompile on next use
+
+
+def unregister_alphabet(language):
+    """
+    Remove an alphabet registered with register_alphabet.
+    
+    Args:
+        language (str): Language name
+    
+    Raises:
+        ValueError: If the language is built in
+        KeyError: If the language is not registered
+    """
+    language = language.lower()
+    if language in BUILTIN_LANGUAGES:
+        raise ValueError(f"Cannot unregister built-in alphabet '{language}'")
+    del ALPHABETS[language]
+    _compiled_alphabets.pop(language, None)
+
+
+def load_alphabets(path, replace=False):
+    """
+    Register the alphabets defined in a JSON or TOML file.
+    
+    The file maps language names to their symbols, either at the top level or
+    under an "alphabets" key/table. Symbols can be a list of characters or a
+    string, e.g. {"greek": "αβγδεζηθικλμνξοπρστυφχψω "}.
+    
+    Args:
+        path (str): Path to a .json or .toml file
+        replace (bool): Allow replacing alphabets that are already registered
     
     Returns:
-        list: List of characters in the alphabet, or None if language not supported
+        list: Names of the registered languages
+    
+    Raises:
+        ValueError: If the file is malformed or an alphabet is invalid
     """
-    return ALPHABETS.get(language.lower())
+    if path.lower().endswith('.toml'):
+        import tomllib
+        with open(path, 'rb') as file:
+            data = tomllib.load(file)
+    else:
+        import json
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+    
+    if isinstance(data, dict) and isinstance(data.get('alphabets'), dict):
+        data = data['alphabets']
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a mapping of language names to symbols")
+    
+    # Validate everything first so a bad entry does not leave the file half loaded
+    definitions = {}
+    for language, symbols in data.items():
+        if not isinstance(symbols, (str, list)):
+            raise ValueError(f"{path}: symbols for '{language}' must be a string or a list")
+        try:
+            validate_alphabet(list(symbols))
+        except ValueError as error:
+            raise ValueError(f"{path}: alphabet '{language}': {error}") from None
+        name = language.strip().lower()  # Normalized like register_alphabet
+        if not name:
+            raise ValueError(f"{path}: language names must be non-empty")
+        if name in definitions:
+            raise ValueError(f"{path}: alphabet '{name}' is defined more than once")
+        if name in ALPHABETS and not replace:
+            raise ValueError(f"{path}: alphabet '{name}' is already registered")
+        definitions[name] = symbols
+    
+    for language, symbols in definitions.items():
+        register_alphabet(language, symbols, replace=replace)
+    return list(definitions)
 
 
 def get_supported_languages():
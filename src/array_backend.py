@@ -0,0 +1,237 @@
+"""
+Optional NumPy backend for the Caesar and Vigenère ciphers.
+
+Text is mapped to an array of alphabet indices through a codepoint lookup
+table, shifted with a tiled key array modulo the alphabet size, and mapped
+back. Case and characters outside the alphabet follow the same rules as the
+reference functions, so the output is identical.
+"""
+
+from alphabets import alphabet_table_cache
+
+# NumPy is optional and only imported the first time the backend is used,
+# so that importing the cipher modules stays fast for short-lived processes
+np = None
+_numpy_loaded = False
+
+
+def _load_numpy():
+    global np, _numpy_loaded
+    if not _numpy_loaded:
+        _numpy_loaded = True
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        np = numpy
+    return np
+
+
+def is_available():
+    """
+    Check whether the array backend can be used.
+
+    Returns:
+        bool: True if NumPy is installed
+    """
+    return _load_numpy() is not None
+
+
+def _require_numpy():
+    if _load_numpy() is None:
+        raise ImportError("The numpy backend requires NumPy (pip install numpy)")
+
+
+@alphabet_table_cache
+def _compile_alphabet(symbols):
+    """
+    Build the lookup arrays for an alphabet (given as a tuple of characters).
+
+    Returns:
+        tuple: (index_lut, upper_lut, lower_codepoints, upper_codepoints)
+        where index_lut maps a codepoint to its alphabet index (-1 if not in
+        the alphabet, with one extra sentinel slot for larger codepoints) and
+        upper_lut marks the uppercase forms.
+    """
+    variants = [(char, index, False) for index, char in enumerate(symbols)]
+    variants += [(char.upper(), index, True) for index, char in enumerate(symbols) if char.upper() != char]
+
+    lut_size = max(ord(char) for char, _, _ in variants) + 2
+    index_lut = np.full(lut_size, -1, dtype=np.int32)
+    upper_lut = np.zeros(lut_size, dtype=bool)
+    for char, index, is_upper in variants:
+        index_lut[ord(char)] = index
+        upper_lut[ord(char)] = is_upper
+
+    lower_codepoints = np.array([ord(char) for char in symbols], dtype=np.uint32)
+    upper_codepoints = np.array([ord(char.upper()) for char in symbols], dtype=np.uint32)
+    return index_lut, upper_lut, lower_codepoints, upper_codepoints
+
+
+def supports_alphabet(alphabet):
+    """
+    Check whether an alphabet can be handled by the array backend.
+
+    Every symbol and its uppercase form must be a single codepoint.
+    """
+    return all(len(char) == 1 and len(char.upper()) == 1 for char in alphabet)
+
+
+def _map_text(symbols, codepoints):
+    """
+    Map codepoints to alphabet indices (-1 outside the alphabet) and uppercase flags.
+    """
+    index_lut, upper_lut, _, _ = _compile_alphabet(symbols)
+    lut_keys = np.minimum(codepoints, len(index_lut) - 1)
+    indices = index_lut[lut_keys]
+    is_upper = upper_lut[lut_keys]
+
+    # Characters outside the table can still match through lower() (e.g. the Kelvin sign)
+    misses = np.unique(codepoints[indices < 0])
+    for codepoint in misses.tolist():
+        char = chr(codepoint)
+        lower_char = char.lower()
+        if lower_char != char and lower_char in symbols:
+            positions = codepoints == codepoint
+            indices[positions] = symbols.index(lower_char)
+            is_upper[positions] = True
+    return indices, is_upper
+
+
+def _shift_letters(symbols, codepoints, indices, is_upper, mask, key):
+    """
+    Replace the alphabet characters (mask) of codepoints, shifted by key (one shift per letter).
+    """
+    _, _, lower_codepoints, upper_codepoints = _compile_alphabet(symbols)
+    new_indices = (indices[mask] + key) % len(symbols)
+    result = codepoints.copy()
+    result[mask] = np.where(is_upper[mask], upper_codepoints[new_indices], lower_codepoints[new_indices])
+    return result.tobytes().decode('utf-32-le', 'surrogatepass')
+
+
+def shift_text(alphabet, text, shifts, phase=0):
+    """
+    Shift every alphabet character in text by a repeating list of shifts.
+
+    Characters outside the alphabet are copied unchanged and do not advance
+    the position in shifts.
+
+    Args:
+        alphabet (list): Alphabet characters (lowercase)
+        text (str): Text to transform
+        shifts (list): Shift for each key position (negative to decrypt)
+        phase (int): Key position of the first alphabet character in text
+
+    Returns:
+        str: Transformed text
+    """
+    _require_numpy()
+    if not text or not shifts:
+        return text
+
+    symbols = tuple(alphabet)
+    codepoints = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    indices, is_upper = _map_text(symbols, codepoints)
+
+    mask = indices >= 0
+    letter_count = int(np.count_nonzero(mask))
+    if letter_count == 0:
+        return text
+
+    period = len(shifts)
+    key = np.array([shifts[(phase + i) % period] for i in range(period)], dtype=np.int64)
+    tiled_key = np.tile(key, -(-letter_count // period))[:letter_count]
+    return _shift_letters(symbols, codepoints, indices, is_upper, mask, tiled_key)
+
+
+def shift_texts(alphabet, texts, shifts):
+    """
+    Shift many texts in one vectorized pass, restarting the key for each text.
+
+    The texts are joined into one buffer, transformed together and split
+    again, so the result is the same as calling shift_text on each text.
+
+    Args:
+        alphabet (list): Alphabet characters (lowercase)
+        texts (list): Texts to transform
+        shifts (list): Shift for each key position (negative to decrypt)
+
+    Returns:
+        list: Transformed texts, in input order
+    """
+    _require_numpy()
+    texts = list(texts)
+    joined = ''.join(texts)
+    if not joined or not shifts:
+        return texts
+
+    symbols = tuple(alphabet)
+    codepoints = np.frombuffer(joined.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    indices, is_upper = _map_text(symbols, codepoints)
+
+    mask = indices >= 0
+    positions = np.flatnonzero(mask)
+    if positions.size == 0:
+        return texts
+
+    # Key position of each letter = its rank among the letters of its own text
+    ends = np.cumsum([len(text) for text in texts])
+    starts = ends - [len(text) for text in texts]
+    letters_before = np.searchsorted(positions, starts)
+    letters_per_text = np.diff(letters_before, append=positions.size)
+    key_pos = np.arange(positions.size) - np.repeat(letters_before, letters_per_text)
+    key = np.asarray(shifts, dtype=np.int64)[key_pos % len(shifts)]
+
+    result = _shift_letters(symbols, codepoints, indices, is_upper, mask, key)
+    return [result[start:end] for start, end in zip(starts.tolist(), ends.tolist())]
+
+
+@alphabet_table_cache
+def _compile_symbol_lut(symbols):
+    lut = np.full(max(ord(char) for char in symbols) + 2, -1, dtype=np.int32)
+    for index, char in enumerate(symbols):
+        lut[ord(char)] = index
+    return lut
+
+
+def text_to_codepoints(text):
+    """
+    Convert text to an array of codepoints (one uint32 per character).
+    """
+    _require_numpy()
+    return np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+
+
+def text_to_indices(alphabet, text):
+    """
+    Map every character of text to its index in the alphabet.
+
+    Characters are matched exactly (no case folding); anything that is not
+    an alphabet symbol maps to -1.
+
+    Args:
+        alphabet (Alphabet or list): Alphabet characters
+        text (str): Text to convert
+
+    Returns:
+        numpy.ndarray: Integer array with one entry per character
+    """
+    _require_numpy()
+    if hasattr(alphabet, 'lookup'):
+        lut = np.frombuffer(alphabet.lookup, dtype=np.intc)  # Prebuilt by the compiled Alphabet
+    else:
+        lut = _compile_symbol_lut(tuple(alphabet))
+    codepoints = text_to_codepoints(text)
+    return lut[np.minimum(codepoints, len(lut) - 1)]
+
+
+def rows_to_strings(codepoints):
+    """
+    Turn a 2-D array of codepoints into a list of strings, one per row.
+    """
+    _require_numpy()
+    rows, width = codepoints.shape
+    if width == 0:
+        return [''] * rows
+    packed = np.ascontiguousarray(codepoints, dtype=np.uint32).view(f'<U{width}')
+    return packed.ravel().tolist()
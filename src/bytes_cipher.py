@@ -0,0 +1,191 @@
+"""
+Caesar and Vigenère ciphers on bytes for single-byte (ASCII) alphabets.
+
+For alphabets whose symbols and uppercase forms are all ASCII, such as
+English, each shift is a 256-entry translation table, so the data never
+has to be decoded to str. Bytes outside the alphabet are copied unchanged
+and do not advance the keyword. Because every byte of a multibyte UTF-8
+character is >= 0x80, UTF-8 input gives the same result as the str
+functions, except for non-ASCII characters that only lowercase into the
+alphabet (e.g. the Kelvin sign), which are left as they are.
+
+Results can be written into a caller-provided buffer (bytearray,
+memoryview, mmap, ...) of the same length. With NumPy installed the
+Vigenère result is computed directly into that buffer.
+"""
+
+import re
+
+from alphabets import alphabet_table_cache, get_alphabet
+import array_backend
+from vigenere_cipher import get_cipher
+
+
+def supports_alphabet(alphabet):
+    """
+    Check whether an alphabet can be handled on bytes.
+
+    Every symbol and its uppercase form must be a single ASCII character.
+    """
+    return all(len(form) == 1 and ord(form) < 128 for char in alphabet for form in (char, char.upper()))
+
+
+@alphabet_table_cache
+def _byte_tables(symbols):
+    """
+    Build the translation table of every shift for an alphabet (given as a tuple of characters).
+
+    Returns:
+        tuple: (tables, letters) where tables[shift] is a 256-byte
+        translation table and letters is the bytes of all alphabet
+        characters (both cases)
+    """
+    size = len(symbols)
+    tables = []
+    for shift in range(size):
+        table = bytearray(range(256))
+        for index, char in enumerate(symbols):
+            new_char = symbols[(index + shift) % size]
+            table[ord(char)] = ord(new_char)
+            if char.upper() != char:
+                table[ord(char.upper())] = ord(new_char.upper())
+        tables.append(bytes(table))
+    letters = bytes(sorted({ord(form) for char in symbols for form in (char, char.upper())}))
+    return tuple(tables), letters
+
+
+@alphabet_table_cache
+def _separator_pattern(letters):
+    return re.compile(b'([^' + re.escape(letters) + b']+)')
+
+
+def _compile(lang):
+    alphabet = get_alphabet(lang)
+    if alphabet is None:
+        return None
+    if not supports_alphabet(alphabet):
+        raise ValueError(f"The {lang} alphabet is not single-byte; use the str functions instead")
+    return _byte_tables(tuple(alphabet))
+
+
+def _finish(result, out):
+    if out is None:
+        return bytes(result)
+    out[:] = result
+    return out
+
+
+def _check_out(data, out):
+    if out is not None and len(memoryview(out).cast('B')) != len(memoryview(data).cast('B')):
+        raise ValueError("The output buffer must have the same length as the input")
+
+
+def _shift_bytes(data, compiled, shifts, out):
+    tables, letters = compiled
+    view = memoryview(data).cast('B')
+    period = len(shifts)
+    if period == 1:
+        return _finish(view.tobytes().translate(tables[shifts[0]]), out)  # One table: translate is fastest
+
+    if array_backend.is_available():
+        # Only alphabet bytes advance the key: look up each one in the table of its key phase
+        np = array_backend.np
+        source = np.frombuffer(view, dtype=np.uint8)
+        target = np.frombuffer(memoryview(out).cast('B'), dtype=np.uint8) if out is not None else source.copy()
+        table_array = np.frombuffer(b''.join(tables[shift] for shift in shifts), dtype=np.uint8)
+        is_letter = np.zeros(256, dtype=bool)
+        is_letter[np.frombuffer(letters, dtype=np.uint8)] = True
+        positions = np.flatnonzero(is_letter[source])
+        lookup = np.arange(positions.size) % period * 256 + source[positions]
+        shifted = table_array[lookup]
+        if out is not None:
+            target[:] = source
+        target[positions] = shifted
+        return out if out is not None else target.tobytes()
+
+    # Pure Python: pull out the alphabet bytes, shift each key phase with one translate, put them back
+    pieces = _separator_pattern(letters).split(view.tobytes())
+    shifted = bytearray(b''.join(pieces[0::2]))
+    for phase, shift in enumerate(shifts):
+        shifted[phase::period] = shifted[phase::period].translate(tables[shift])
+    pos = 0
+    for index in range(0, len(pieces), 2):
+        length = len(pieces[index])
+        pieces[index] = shifted[pos:pos + length]
+        pos += length
+    return _finish(b''.join(pieces), out)
+
+
+def caesar_encrypt_bytes(lang, data, shift, out=None):
+    """
+    Encrypt bytes with the Caesar cipher.
+
+    Args:
+        lang (str): Language with a single-byte alphabet (e.g. 'english')
+        data: bytes, bytearray or memoryview to encrypt
+        shift (int): Number of positions to shift each character
+        out: Optional writable buffer of the same length to write the result into
+
+    Returns:
+        bytes or out: Encrypted data
+
+    Raises:
+        ValueError: If the alphabet is not single-byte or out has the wrong length
+    """
+    _check_out(data, out)
+    compiled = _compile(lang)
+    if compiled is None:
+        return _finish(memoryview(data).cast('B'), out)  # Language not supported: copy unchanged
+    return _shift_bytes(data, compiled, [shift % len(compiled[0])], out)
+
+
+def vigenere_encrypt_bytes(lang, data, keyword, out=None):
+    """
+    Encrypt bytes with the Vigenère cipher.
+
+    The result is the same as vigenere_encrypt on the decoded text (see the
+    module docstring for the one exception).
+
+    Args:
+        lang (str): Language with a single-byte alphabet (e.g. 'english')
+        data: bytes, bytearray or memoryview to encrypt
+        keyword (str): Keyword for encryption
+        out: Optional writable buffer of the same length to write the result into
+
+    Returns:
+        bytes or out: Encrypted data
+
+    Raises:
+        ValueError: If the alphabet is not single-byte or out has the wrong length
+    """
+    _check_out(data, out)
+    compiled = _compile(lang)
+    shifts = get_cipher(lang, keyword).shifts if compiled is not None else None
+    if not shifts:
+        return _finish(memoryview(data).cast('B'), out)  # Unsupported language or no valid keyword characters
+    return _shift_bytes(data, compiled, shifts, out)
+
+
+def vigenere_decrypt_bytes(lang, data, keyword, out=None):
+    """
+    Decrypt bytes with the Vigenère cipher.
+
+    Args:
+        lang (str): Language with a single-byte alphabet (e.g. 'english')
+        data: bytes, bytearray or memoryview to decrypt
+        keyword (str): Keyword for decryption
+        out: Optional writable buffer of the same length to write the result into
+
+    Returns:
+        bytes or out: Decrypted data
+
+    Raises:
+        ValueError: If the alphabet is not single-byte or out has the wrong length
+    """
+    _check_out(data, out)
+    compiled = _compile(lang)
+    shifts = get_cipher(lang, keyword).shifts if compiled is not None else None
+    if not shifts:
+        return _finish(memoryview(data).cast('B'), out)
+    size = len(compiled[0])
+    return _shift_bytes(data, compiled, [-shift % size for shift in shifts], out)
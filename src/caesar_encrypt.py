@@ -1,22 +1,211 @@
+import argparse
+import math
+import sys
+from contextlib import ExitStack
+
 from alphabets import get_alphabet
-from cyber_tools import frequency_analysis, plot_frequency
+import array_backend
+
 
+def caesar_encrypt(lang, text, shift, backend="python"):
+    """
+    Encrypt text using the Caesar cipher.
 
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        text (str): Text to encrypt
+        shift (int): Number of positions to shift each character
+        backend (str): 'python' (default, str.translate) or 'numpy' for the vectorized path
+
+    Returns:
+        str: Encrypted text
+    """
+    if backend not in ("python", "numpy"):
+        raise ValueError(f"Unknown backend: {backend!r}")
 
-def caesar_encrypt(lang, text, shift):
     alphabet = get_alphabet(lang)
     if alphabet is None:
         return text  # Return original text if language not supported
 
-    result = ""
-   
-    return result
+    if backend == "numpy" and array_backend.supports_alphabet(alphabet):
+        return array_backend.shift_text(alphabet, text, [shift])
 
+    return text.translate(_CaesarTable(alphabet, shift))
 
 
+class _CaesarTable(dict):
+    """
+    str.translate table for one Caesar shift.
 
+    Alphabet characters and their uppercase forms are filled in up front.
+    Any other character is resolved through lower() the first time it is
+    seen (an uppercase form whose lowercase is in the alphabet, such as the
+    Kelvin sign, is shifted) and then remembered.
+    """
+
+    def __init__(self, alphabet, shift):
+        shift_table = alphabet.shift_tables[shift % len(alphabet)]
+        super().__init__((ord(char), new_char) for char, new_char in shift_table.items() if len(char) == 1)
+        self._lower_table = {char: shift_table[char] for char in alphabet}
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        lower_char = char.lower()
+        value = codepoint  # Characters outside the alphabet stay unchanged
+        if lower_char != char and lower_char in self._lower_table:
+            value = self._lower_table[lower_char].upper()
+        self[codepoint] = value
+        return value
+
+
+def caesar_encrypt_many(lang, texts, shift, backend="python"):
+    """
+    Encrypt many texts with the same Caesar shift.
+
+    The texts are joined into one buffer, translated in a single pass and
+    split again, so the result is the same as calling caesar_encrypt on
+    each text without paying the per-call setup for every record.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        texts (iterable): Texts to encrypt
+        shift (int): Number of positions to shift each character
+        backend (str): 'python' (default, str.translate) or 'numpy' for the vectorized path
+
+    Returns:
+        list: Encrypted texts, in input order
+    """
+    if backend not in ("python", "numpy"):
+        raise ValueError(f"Unknown backend: {backend!r}")
+
+    texts = list(texts)
+    alphabet = get_alphabet(lang)
+    if alphabet is None:
+        return texts  # Return original texts if language not supported
+
+    joined = ''.join(texts)
+    if backend == "numpy" and array_backend.supports_alphabet(alphabet):
+        result = array_backend.shift_text(alphabet, joined, [shift])
+    else:
+        result = joined.translate(_CaesarTable(alphabet, shift))
+
+    encrypted = []
+    start = 0
+    for text in texts:
+        end = start + len(text)
+        encrypted.append(result[start:end])
+        start = end
+    return encrypted
+
+
+def crack_caesar(lang, ciphertext):
+    """
+    Find the shift of a Caesar ciphertext without a known plaintext.
+
+    The symbol counts of the ciphertext are computed once. Every shift is
+    then scored by circularly correlating them with the log reference
+    letter probabilities of the language (see language_model.get_profile),
+    which gives the log-likelihood of the plaintext that shift would
+    produce, without decrypting the text for each shift. Only the best
+    shift is applied to the text.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        ciphertext (str): The encrypted text
+
+    Returns:
+        list: Dicts with 'shift', 'score' (log-likelihood per character,
+        higher is better) and 'confidence' (probability of the shift given
+        the counts, summing to 1), best first. The first dict also has the
+        'plaintext'. Empty if the language is not supported or the text
+        has no alphabet characters.
+    """
+    from cyber_tools import frequency_analysis
+    from language_model import get_profile
+
+    alphabet = get_alphabet(lang)
+    profile = get_profile(lang) if alphabet is not None else None
+    if profile is None:
+        return []
+
+    counts = list(frequency_analysis(lang, ciphertext).values())
+    total = sum(counts)
+    if total == 0:
+        return []
+
+    size = len(alphabet)
+    log_profile = [math.log(probability) for probability in profile]
+    # Plaintext symbol i encrypts to symbol i + shift, so shift k pairs counts[(i + k) % size] with profile[i]
+    log_likelihoods = [
+        sum(counts[(i + shift) % size] * log_probability for i, log_probability in enumerate(log_profile))
+        for shift in range(size)
+    ]
+    best = max(log_likelihoods)
+    weights = [math.exp(value - best) for value in log_likelihoods]
+    weight_total = sum(weights)
+
+    results = [
+        {'shift': shift, 'score': log_likelihood / total, 'confidence': weight / weight_total}
+        for shift, (log_likelihood, weight) in enumerate(zip(log_likelihoods, weights))
+    ]
+    results.sort(key=lambda x: -x['score'])
+    results[0]['plaintext'] = ciphertext.translate(_CaesarTable(alphabet, -results[0]['shift']))
+    return results
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def encrypt_stream(lang, infile, outfile, shift, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Encrypt a text file object chunk by chunk into another file object.
+
+    Only one chunk is held in memory at a time, and the output is identical
+    to caesar_encrypt on the whole text.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        infile: Readable text file object
+        outfile: Writable text file object
+        shift (int): Number of positions to shift each character
+        chunk_size (int): Number of characters to read at a time
+
+    Returns:
+        int: Number of characters processed
+    """
+    alphabet = get_alphabet(lang)
+    table = _CaesarTable(alphabet, shift) if alphabet is not None else {}
+
+    total = 0
+    while True:
+        chunk = infile.read(chunk_size)
+        if not chunk:
+            break
+        outfile.write(chunk.translate(table))
+        total += len(chunk)
+    return total
+
+
+def decrypt_stream(lang, infile, outfile, shift, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Decrypt a Caesar-encrypted text file object chunk by chunk.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        infile: Readable text file object
+        outfile: Writable text file object
+        shift (int): Shift that was used for encryption
+        chunk_size (int): Number of characters to read at a time
+
+    Returns:
+        int: Number of characters processed
+    """
+    return encrypt_stream(lang, infile, outfile, -shift, chunk_size=chunk_size)
+
+
+def _run_demo():
+    from cyber_tools import plot_frequency  # Only needed for the demo
 
-if __name__ == "__main__":
     # Simple example usage
     with open('./assets/bible_en.txt', 'r', encoding='utf-8') as file:
             original_text = file.read()
@@ -31,3 +220,44 @@ if __name__ == "__main__":
     # Plot frequency analysis
     plot_frequency('english', original_text, "Frequency Analysis of Original Text", ignore_spaces=True)
     plot_frequency('english', encrypted_text, "Frequency Analysis of Encrypted Text", ignore_spaces=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Encrypt or decrypt text with the Caesar cipher.")
+    parser.add_argument("mode", nargs="?", choices=["encrypt", "decrypt"],
+                        help="stream the input through the cipher (runs the demo if omitted)")
+    parser.add_argument("-s", "--shift", type=int, default=3, help="shift (default: 3)")
+    parser.add_argument("-l", "--lang", default="english", help="language (default: english)")
+    parser.add_argument("-i", "--input", help="input file (default: stdin)")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="characters read per chunk")
+    parser.add_argument("--mmap", action="store_true",
+                        help="memory-map the input and output files (requires --input and --output)")
+    args = parser.parse_args(argv)
+
+    if args.mode is None:
+        _run_demo()
+        return
+
+    if args.mmap:
+        if not args.input or not args.output:
+            parser.error("--mmap requires --input and --output")
+        import mmap_cipher
+        transform_file = mmap_cipher.caesar_encrypt_file if args.mode == "encrypt" else mmap_cipher.caesar_decrypt_file
+        transform_file(args.lang, args.input, args.output, args.shift)
+        return
+
+    stream = encrypt_stream if args.mode == "encrypt" else decrypt_stream
+    with ExitStack() as stack:
+        infile = sys.stdin
+        outfile = sys.stdout
+        if args.input:
+            infile = stack.enter_context(open(args.input, 'r', encoding='utf-8', newline=''))
+        if args.output:
+            outfile = stack.enter_context(open(args.output, 'w', encoding='utf-8', newline=''))
+        stream(args.lang, infile, outfile, args.shift, chunk_size=args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+"""
+Small asyncio HTTP service for the ciphers and frequency analysis.
+
+The server keeps a pool of warm worker processes (one per CPU by default)
+so that compiled alphabets and key schedules are reused across requests
+instead of being rebuilt by a new interpreter for every call, and so that
+CPU-heavy batches never block the event loop. With workers=0 the batches
+run in the server process itself.
+
+Endpoints (JSON request and response bodies):
+    POST /vigenere/encrypt   {"lang", "text", "keyword"} -> {"result"}
+    POST /vigenere/decrypt   {"lang", "text", "keyword"} -> {"result"}
+    POST /caesar/encrypt     {"lang", "text", "shift"}   -> {"result"}
+    POST /caesar/decrypt     {"lang", "text", "shift"}   -> {"result"}
+    POST /frequency          {"lang", "text", "ignore_spaces"} -> {"result"}
+    GET  /health, GET /stats
+
+Requests that arrive close together are micro-batched: they are queued for
+up to max_delay seconds (or until max_batch requests are waiting) and sent
+to a worker as one job, where requests sharing a language and key go
+through the *_many batch functions. At most max_pending requests may be
+queued; beyond that the server answers 503 so clients back off.
+
+Run locally:
+    python src/cipher_server.py --port 8080 --workers 2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor, wait
+from http import HTTPStatus
+
+
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_DELAY = 0.002
+DEFAULT_MAX_PENDING = 1024
+DEFAULT_MAX_BODY = 1024 * 1024
+
+# Path -> (operation, name of the key field)
+ROUTES = {
+    '/vigenere/encrypt': ('vigenere_encrypt', 'keyword'),
+    '/vigenere/decrypt': ('vigenere_decrypt', 'keyword'),
+    '/caesar/encrypt': ('caesar_encrypt', 'shift'),
+    '/caesar/decrypt': ('caesar_decrypt', 'shift'),
+    '/frequency': ('frequency', 'ignore_spaces'),
+}
+
+
+def _run_group(op, lang, key, texts):
+    # Imported here so that worker processes load the cipher modules once, on first use
+    from caesar_encrypt import caesar_encrypt_many
+    from cyber_tools import frequency_analysis
+    from vigenere_cipher import vigenere_encrypt_many, vigenere_decrypt_many
+
+    if op == 'vigenere_encrypt':
+        return vigenere_encrypt_many(lang, texts, key)
+    if op == 'vigenere_decrypt':
+        return vigenere_decrypt_many(lang, texts, key)
+    if op == 'caesar_encrypt':
+        return caesar_encrypt_many(lang, texts, key)
+    if op == 'caesar_decrypt':
+        return caesar_encrypt_many(lang, texts, -key)
+    return [frequency_analysis(lang, text, ignore_spaces=key) for text in texts]
+
+
+def warm_up():
+    """
+    Load the cipher modules and compile the built-in alphabets in the current process.
+    """
+    from alphabets import get_alphabet, get_supported_languages
+    import caesar_encrypt, cyber_tools, vigenere_cipher  # noqa: F401
+
+    for language in get_supported_languages():
+        get_alphabet(language)
+
+
+def run_batch(jobs):
+    """
+    Run a micro-batch of requests.
+
+    Jobs that share an operation, language and key are processed together
+    through the batch functions. An error in one group does not fail the
+    other groups.
+
+    Args:
+        jobs (list): (operation, lang, key, text) tuples
+
+    Returns:
+        list: (ok, result or error message) for each job, in input order
+    """
+    groups = {}
+    for index, (op, lang, key, text) in enumerate(jobs):
+        groups.setdefault((op, lang, key), []).append((index, text))
+
+    results = [None] * len(jobs)
+    for (op, lang, key), members in groups.items():
+        try:
+            outputs = _run_group(op, lang, key, [text for _, text in members])
+            for (index, _), output in zip(members, outputs):
+                results[index] = (True, output)
+        except Exception as error:  # Reported to the client as a 400
+            for index, _ in members:
+                results[index] = (False, str(error))
+    return results
+
+
+class Overloaded(Exception):
+    """Raised when the request queue is full."""
+
+
+class MicroBatcher:
+    """
+    Collect concurrent requests into batches and run them off the event loop.
+
+    Args:
+        executor: concurrent.futures executor, or None to run batches inline
+        max_batch (int): Largest number of requests per batch
+        max_delay (float): Seconds to wait for more requests before running a batch
+        max_pending (int): Largest number of queued requests before rejecting new ones
+        concurrency (int): Batches allowed to run at the same time (e.g. the number of workers)
+    """
+
+    def __init__(self, executor=None, max_batch=DEFAULT_MAX_BATCH, max_delay=DEFAULT_MAX_DELAY,
+                 max_pending=DEFAULT_MAX_PENDING, concurrency=1):
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.stats = {'requests': 0, 'batches': 0, 'rejected': 0, 'errors': 0}
+        self._queue = []
+        self._wakeup = asyncio.Event()
+        self._in_flight = 0
+        self._slots = asyncio.Semaphore(concurrency)
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    @property
+    def pending(self):
+        """Number of requests queued or being processed."""
+        return len(self._queue) + self._in_flight
+
+    async def submit(self, op, lang, key, text):
+        """
+        Queue one request and wait for its result.
+
+        Raises:
+            Overloaded: If max_pending requests are already waiting
+            ValueError: If the request failed
+        """
+        if self.pending >= self.max_pending:
+            self.stats['rejected'] += 1
+            raise Overloaded()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append(((op, lang, key, text), future))
+        self.stats['requests'] += 1
+        self._wakeup.set()
+        ok, value = await future
+        if not ok:
+            self.stats['errors'] += 1
+            raise ValueError(value)
+        return value
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            if len(self._queue) < self.max_batch and self.max_delay > 0:
+                await asyncio.sleep(self.max_delay)  # Let more requests join the batch
+            await self._slots.acquire()  # One batch per worker at a time
+            batch, self._queue = self._queue[:self.max_batch], self._queue[self.max_batch:]
+            if not self._queue:
+                self._wakeup.clear()
+            if not batch:
+                self._slots.release()
+                continue
+            self._in_flight += len(batch)
+            self.stats['batches'] += 1
+            asyncio.get_running_loop().create_task(self._execute(batch))
+
+    async def _execute(self, batch):
+        jobs = [job for job, _ in batch]
+        try:
+            if self.executor is None:
+                results = run_batch(jobs)
+            else:
+                results = await asyncio.get_running_loop().run_in_executor(self.executor, run_batch, jobs)
+        except Exception as error:  # e.g. a broken worker pool
+            results = [(False, str(error))] * len(batch)
+        finally:
+            self._in_flight -= len(batch)
+            self._slots.release()
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+def parse_job(path, body):
+    """
+    Turn a request path and JSON body into a (operation, lang, key, text) job.
+
+    Raises:
+        KeyError: If the path is not a known endpoint
+        ValueError: If the body is invalid
+    """
+    op, key_field = ROUTES[path]
+    data = json.loads(body or b'{}')
+    if not isinstance(data, dict):
+        raise ValueError("Request body must be a JSON object")
+    lang = data.get('lang', 'english')
+    text = data.get('text')
+    if not isinstance(lang, str) or not isinstance(text, str):
+        raise ValueError("'lang' and 'text' must be strings")
+
+    if key_field == 'keyword':
+        key = data.get('keyword')
+        if not isinstance(key, str):
+            raise ValueError("'keyword' must be a string")
+    elif key_field == 'shift':
+        key = data.get('shift', 3)
+        if not isinstance(key, int) or isinstance(key, bool):
+            raise ValueError("'shift' must be an integer")
+    else:
+        key = bool(data.get('ignore_spaces', False))
+    return op, lang, key, text
+
+
+class CipherServer:
+    """
+    HTTP/1.1 front-end (with keep-alive) for a MicroBatcher.
+
+    Args:
+        batcher (MicroBatcher): Batcher that runs the requests
+        max_body (int): Largest accepted request body in bytes
+    """
+
+    def __init__(self, batcher, max_body=DEFAULT_MAX_BODY):
+        self.batcher = batcher
+        self.max_body = max_body
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                    if not request_line:
+                        break
+                    headers = {}
+                    while True:
+                        line = await reader.readline()
+                        if line in (b'\r\n', b'\n', b''):
+                            break
+                        name, _, value = line.decode('latin-1').partition(':')
+                        headers[name.strip().lower()] = value.strip()
+                except ValueError:  # A line longer than the stream limit
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST,
+                                        {'error': 'Request line or header too long'}, False)
+                    break
+
+                try:
+                    method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                except ValueError:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {'error': 'Malformed request line'}, False)
+                    break
+
+                try:
+                    length = int(headers.get('content-length') or 0)
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {'error': 'Invalid Content-Length'}, False)
+                    break
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                if length > self.max_body:
+                    await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                        {'error': f"Body larger than {self.max_body} bytes"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                status, payload = await self.dispatch(method, path, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, path, body):
+        """
+        Handle one request.
+
+        Returns:
+            tuple: (HTTPStatus, JSON-serializable payload)
+        """
+        if method == 'GET' and path == '/health':
+            return HTTPStatus.OK, {'status': 'ok'}
+        if method == 'GET' and path == '/stats':
+            return HTTPStatus.OK, {**self.batcher.stats, 'pending': self.batcher.pending}
+        if path not in ROUTES:
+            return HTTPStatus.NOT_FOUND, {'error': f"Unknown endpoint: {path}"}
+        if method != 'POST':
+            return HTTPStatus.METHOD_NOT_ALLOWED, {'error': "Use POST"}
+
+        try:
+            job = parse_job(path, body)
+            result = await self.batcher.submit(*job)
+        except Overloaded:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {'error': "Server busy, retry later"}
+        except ValueError as error:  # Includes invalid JSON
+            return HTTPStatus.BAD_REQUEST, {'error': str(error)}
+        return HTTPStatus.OK, {'result': result}
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            head.append("Retry-After: 1")
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+
+async def serve(host='127.0.0.1', port=8080, workers=None, max_batch=DEFAULT_MAX_BATCH,
+                max_delay=DEFAULT_MAX_DELAY, max_pending=DEFAULT_MAX_PENDING, max_body=DEFAULT_MAX_BODY,
+                ready=None):
+    """
+    Run the server until cancelled.
+
+    Args:
+        host (str): Interface to listen on
+        port (int): TCP port (0 picks a free port)
+        workers (int): Worker processes for the batches (default: CPU count;
+            0 runs them in the server process, blocking the event loop while they run)
+        max_batch (int): Largest number of requests per batch
+        max_delay (float): Seconds to wait for more requests before running a batch
+        max_pending (int): Largest number of queued requests before answering 503
+        max_body (int): Largest accepted request body in bytes
+        ready (asyncio.Future): Optional future set to the bound (host, port) once listening
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    executor = None
+    if workers > 0:
+        # Start (and warm) the workers before binding, so they do not inherit the listening socket
+        executor = ProcessPoolExecutor(max_workers=workers)
+        wait([executor.submit(warm_up) for _ in range(workers)])
+    else:
+        warm_up()
+    batcher = MicroBatcher(executor, max_batch=max_batch, max_delay=max_delay, max_pending=max_pending,
+                           concurrency=max(workers, 1))
+    server = CipherServer(batcher, max_body=max_body)
+    batcher.start()
+    try:
+        listener = await asyncio.start_server(server.handle_connection, host, port)
+        async with listener:
+            if ready is not None:
+                ready.set_result(listener.sockets[0].getsockname()[:2])
+            await listener.serve_forever()
+    finally:
+        await batcher.stop()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the ciphers and frequency analysis over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="port (default: 8080)")
+    parser.add_argument("--workers", type=int,
+                        help="worker processes for CPU-heavy batches (default: CPU count; 0 runs them in the "
+                             "server process)")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="requests per batch")
+    parser.add_argument("--max-delay-ms", type=float, default=DEFAULT_MAX_DELAY * 1000,
+                        help="milliseconds to wait for a batch to fill")
+    parser.add_argument("--max-pending", type=int, default=DEFAULT_MAX_PENDING,
+                        help="queued requests before answering 503")
+    parser.add_argument("--max-body", type=int, default=DEFAULT_MAX_BODY, help="largest request body in bytes")
+    args = parser.parse_args(argv)
+
+    async def run():
+        task = asyncio.current_task()
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, task.cancel)  # Shut down the workers too
+        await serve(args.host, args.port, args.workers, args.max_batch, args.max_delay_ms / 1000,
+                    args.max_pending, args.max_body)
+
+    print(f"Serving on http://{args.host}:{args.port}", flush=True)
+    try:
+        asyncio.run(run())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+if __name__ == "__main__":
+    main()
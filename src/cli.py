@@ -0,0 +1,225 @@
+"""
+Command-line entry point for the ciphers and the analysis tools.
+
+    python src/cli.py encrypt -k KEY [-l LANG] [-i FILE] [-o FILE]
+    python src/cli.py decrypt --cipher caesar -s 3 < in.txt > out.txt
+    python src/cli.py analyze -i cipher.txt [--break] [--json]
+    python src/cli.py crib -i cipher.txt --crib jerusalem
+    python src/cli.py attack -i cipher.txt --wordlist words.txt
+    python src/cli.py solve -i cipher.txt [--time-budget 5] [--workers N]
+
+Only what a subcommand needs is imported, and only when it runs: encrypting
+in a shell pipeline never loads the analysis tools, NumPy or the language
+models, which keeps the startup time of short-lived invocations low.
+"""
+
+import argparse
+import sys
+from contextlib import ExitStack
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _open_files(stack, args):
+    infile = sys.stdin
+    outfile = sys.stdout
+    if args.input:
+        infile = stack.enter_context(open(args.input, 'r', encoding='utf-8', newline=''))
+    if args.output:
+        outfile = stack.enter_context(open(args.output, 'w', encoding='utf-8', newline=''))
+    return infile, outfile
+
+
+def _read_input(args):
+    if args.input:
+        with open(args.input, 'r', encoding='utf-8', newline='') as file:
+            return file.read()
+    return sys.stdin.read()
+
+
+def _run_cipher(args, parser):
+    decrypt = args.command == "decrypt"
+    if args.cipher == "vigenere":
+        if args.keyword is None:
+            parser.error("--keyword is required for the vigenere cipher")
+        key = args.keyword
+        import vigenere_cipher as module
+    else:
+        key = args.shift
+        import caesar_encrypt as module
+
+    if args.mmap:
+        if not args.input or not args.output:
+            parser.error("--mmap requires --input and --output")
+        import mmap_cipher
+        transform_file = getattr(mmap_cipher, f"{args.cipher}_{args.command}_file")
+        transform_file(args.lang, args.input, args.output, key)
+        return 0
+
+    stream = module.decrypt_stream if decrypt else module.encrypt_stream
+    with ExitStack() as stack:
+        infile, outfile = _open_files(stack, args)
+        stream(args.lang, infile, outfile, key, chunk_size=args.chunk_size)
+    return 0
+
+
+def _run_analyze(args, parser):
+    from cyber_tools import break_vigenere, frequency_analysis, plot_frequency_dict, rank_key_lengths
+
+    text = _read_input(args)
+    frequencies = frequency_analysis(args.lang, text, ignore_spaces=args.ignore_spaces)
+    if not frequencies:
+        parser.error(f"unsupported language: {args.lang}")
+    report = {'frequencies': frequencies}
+    if args.key_lengths:
+        report['key_lengths'] = rank_key_lengths(text, args.lang, args.max_length)[:args.key_lengths]
+    if args.caesar:
+        from caesar_encrypt import crack_caesar
+        report['caesar'] = [{name: value for name, value in result.items() if name != 'plaintext'}
+                            for result in crack_caesar(args.lang, text)[:5]]
+    if args.break_key:
+        report['keys'] = [{name: value for name, value in result.items() if name != 'plaintext'}
+                          for result in break_vigenere(text, args.lang, args.max_length)]
+
+    if args.json:
+        import json
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 0
+
+    plot_frequency_dict(frequencies, f"Character Frequency Analysis ({args.lang})")
+    if 'key_lengths' in report:
+        print(f"\n{'Key length':<12} {'Score':<8} {'IoC':<8} {'Kasiski'}")
+        for entry in report['key_lengths']:
+            print(f"{entry['length']:<12} {entry['score']:<8.3f} {entry['ioc']:<8.3f} {entry['kasiski']:.3f}")
+    if 'caesar' in report:
+        print(f"\n{'Caesar shift':<14} {'Score':<10} {'Confidence'}")
+        for entry in report['caesar']:
+            print(f"{entry['shift']:<14} {entry['score']:<10.4f} {entry['confidence']:.4f}")
+    if 'keys' in report:
+        print(f"\n{'Key':<24} {'Length':<8} {'Score'}")
+        for entry in report['keys']:
+            print(f"{entry['key']:<24} {entry['length']:<8} {entry['score']:.4f}")
+    return 0
+
+
+def _run_crib(args, parser):
+    from cyber_tools import print_crib_analysis
+
+    print_crib_analysis(_read_input(args), args.crib, args.lang, args.top)
+    return 0
+
+
+def _run_attack(args, parser):
+    from dictionary_attack import dictionary_attack, read_wordlist
+
+    results = dictionary_attack(_read_input(args), read_wordlist(args.wordlist), args.lang, top_n=args.top,
+                                prefix_length=args.prefix_length, workers=args.workers)
+    if args.json:
+        import json
+        json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 0
+    if not results:
+        print("No candidate keyword could be scored.")
+        return 0
+    print(f"{'Key':<24} {'Score':<10} {'Prefix score':<14} {'Plaintext'}")
+    for result in results:
+        sample = result['plaintext'][:40].replace('\n', ' ')
+        print(f"{result['key']:<24} {result['score']:<10.4f} {result['prefix_score']:<14.4f} {sample}")
+    return 0
+
+
+def _run_solve(args, parser):
+    from key_search import solve_vigenere
+
+    def report(best):
+        print(f"{best['elapsed']:>7.2f}s  {best['key']:<24} {best['score']:.4f}", file=sys.stderr)
+
+    results = solve_vigenere(_read_input(args), args.lang, max_length=args.max_length,
+                             time_budget=args.time_budget, workers=args.workers, seed=args.seed,
+                             callback=None if args.quiet else report)
+    if args.json:
+        import json
+        json.dump(results[:args.top], sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return 0
+    if not results:
+        print("Nothing to solve.")
+        return 0
+    print(f"{'Key':<24} {'Length':<8} {'Score':<10} {'Plaintext'}")
+    for result in results[:args.top]:
+        sample = result['plaintext'][:40].replace('\n', ' ')
+        print(f"{result['key']:<24} {result['length']:<8} {result['score']:<10.4f} {sample}")
+    return 0
+
+
+def build_parser():
+    """
+    Build the argument parser with the encrypt, decrypt, analyze, crib, attack and solve subcommands.
+    """
+    parser = argparse.ArgumentParser(description="Vigenère and Caesar ciphers and cryptanalysis tools.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-l", "--lang", default="english", help="language (default: english)")
+    common.add_argument("-i", "--input", help="input file (default: stdin)")
+
+    for command in ("encrypt", "decrypt"):
+        sub = subparsers.add_parser(command, parents=[common], help=f"{command} text with a cipher")
+        sub.add_argument("-c", "--cipher", choices=["vigenere", "caesar"], default="vigenere",
+                         help="cipher (default: vigenere)")
+        sub.add_argument("-k", "--keyword", help="keyword (vigenere)")
+        sub.add_argument("-s", "--shift", type=int, default=3, help="shift (caesar, default: 3)")
+        sub.add_argument("-o", "--output", help="output file (default: stdout)")
+        sub.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="characters read per chunk")
+        sub.add_argument("--mmap", action="store_true",
+                         help="memory-map the input and output files (requires --input and --output)")
+        sub.set_defaults(handler=_run_cipher)
+
+    sub = subparsers.add_parser("analyze", parents=[common], help="frequency analysis and key recovery")
+    sub.add_argument("--ignore-spaces", action="store_true", help="leave spaces out of the frequency table")
+    sub.add_argument("--key-lengths", type=int, default=0, metavar="N",
+                     help="show the N most likely Vigenère key lengths")
+    sub.add_argument("--caesar", action="store_true", help="rank the Caesar shifts of the text")
+    sub.add_argument("--break", dest="break_key", action="store_true",
+                     help="recover the Vigenère keyword without a crib")
+    sub.add_argument("--max-length", type=int, default=20, help="longest key length to consider (default: 20)")
+    sub.add_argument("--json", action="store_true", help="print the results as JSON")
+    sub.set_defaults(handler=_run_analyze)
+
+    sub = subparsers.add_parser("crib", parents=[common], help="Vigenère crib search")
+    sub.add_argument("--crib", required=True, help="known plaintext word or phrase")
+    sub.add_argument("--top", type=int, default=10, help="key fragments to show (default: 10)")
+    sub.set_defaults(handler=_run_crib)
+
+    sub = subparsers.add_parser("attack", parents=[common], help="Vigenère dictionary attack with a wordlist")
+    sub.add_argument("-w", "--wordlist", required=True, help="file with one candidate keyword per line")
+    sub.add_argument("--top", type=int, default=10, help="candidates to show (default: 10)")
+    sub.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    sub.add_argument("--prefix-length", type=int, default=64,
+                     help="ciphertext characters each candidate is scored on (default: 64)")
+    sub.add_argument("--json", action="store_true", help="print the results as JSON")
+    sub.set_defaults(handler=_run_attack)
+
+    sub = subparsers.add_parser("solve", parents=[common], help="Vigenère key search for short ciphertexts")
+    sub.add_argument("--time-budget", type=float, default=5.0, help="seconds to search (default: 5)")
+    sub.add_argument("--workers", type=int, default=1, help="worker processes (default: 1)")
+    sub.add_argument("--seed", type=int, help="seed of the search, for reproducible results")
+    sub.add_argument("--max-length", type=int, default=20, help="longest key length to consider (default: 20)")
+    sub.add_argument("--top", type=int, default=5, help="key lengths to show (default: 5)")
+    sub.add_argument("-q", "--quiet", action="store_true", help="do not report better keys as they are found")
+    sub.add_argument("--json", action="store_true", help="print the results as JSON")
+    sub.set_defaults(handler=_run_solve)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.handler(args, parser)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,10 +2,16 @@
 Cybersecurity and cryptanalysis tools for cipher analysis.
 """
 
+import heapq
+from array import array
+from collections import Counter
+from operator import itemgetter
+
 from alphabets import get_alphabet
+import array_backend
 
 
-def vigenere_crib_search(ciphertext, crib, lang='english'):
+def vigenere_crib_search(ciphertext, crib, lang='english', lazy=False):
     """
     Perform a crib search on Vigenere cipher to find potential key fragments.
     
@@ -13,43 +19,83 @@ def vigenere_crib_search(ciphertext, crib, lang='english'):
         ciphertext (str): The encrypted text
         crib (str): Known plaintext word/phrase to search for
         lang (str): Language ('english' or 'hebrew')
+        lazy (bool): Return a generator instead of building the whole list
     
     Returns:
         list: List of tuples (position, key_fragment, decrypted_window)
     """
+    results = iter_crib_search(ciphertext, crib, lang)
+    return results if lazy else list(results)
+
+
+def iter_crib_search(ciphertext, crib, lang='english', block_size=65536):
+    """
+    Lazily perform a crib search on Vigenere cipher.
+    
+    The ciphertext is converted to alphabet indices once. Only windows made
+    entirely of alphabet characters are considered, and their key fragments
+    (K = C - P mod alphabet_size) are computed in blocks of block_size
+    windows with NumPy when it is available.
+    
+    Args:
+        ciphertext (str): The encrypted text
+        crib (str): Known plaintext word/phrase to search for
+        lang (str): Language ('english' or 'hebrew')
+        block_size (int): Number of windows computed at a time
+    
+    Yields:
+        tuple: (position, key_fragment, decrypted_window)
+    """
     alphabet = get_alphabet(lang)
     if alphabet is None:
-        return []
+        return
     
     # Clean inputs
-    ciphertext = ciphertext.lower()
-    crib = crib.lower()
+    yield from _iter_crib_search_lowered(alphabet, ciphertext.lower(), crib.lower(), block_size)
+
+
+def _iter_crib_search_python(alphabet, ciphertext, crib):
+    size = len(alphabet)
+    crib_length = len(crib)
+    
+    # key_tables[j][c] is the key character when ciphertext char c lines up with crib[j]
+    key_tables = [
+        {char: alphabet[(i - alphabet.index(plain_char)) % size] for i, char in enumerate(alphabet)}
+        for plain_char in crib
+    ]
     
-    results = []
+    run = 0  # Length of the current run of alphabet characters
+    for end, char in enumerate(ciphertext):
+        run = run + 1 if char in alphabet else 0
+        if run >= crib_length:
+            start = end - crib_length + 1
+            window = ciphertext[start:end + 1]
+            key_fragment = ''.join([table[c] for table, c in zip(key_tables, window)])
+            yield (start, key_fragment, window)
+
+
+def _iter_crib_search_numpy(alphabet, ciphertext, crib, block_size):
+    np = array_backend.np
+    size = len(alphabet)
     crib_length = len(crib)
     
-    # Slide the crib across the ciphertext
-    for i in range(len(ciphertext) - crib_length + 1):
-        window = ciphertext[i:i + crib_length]
-        key_fragment = ""
-        
-        # Calculate potential key fragment
-        valid = True
-        for j in range(crib_length):
-            if window[j] not in alphabet or crib[j] not in alphabet:
-                valid = False
-                break
-            
-            # Calculate key character: K = C - P (mod alphabet_size)
-            cipher_idx = alphabet.index(window[j])
-            plain_idx = alphabet.index(crib[j])
-            key_idx = (cipher_idx - plain_idx) % len(alphabet)
-            key_fragment += alphabet[key_idx]
-        
-        if valid:
-            results.append((i, key_fragment, window))
+    codepoints = array_backend.text_to_codepoints(ciphertext)
+    indices = array_backend.text_to_indices(alphabet, ciphertext)
+    crib_indices = np.array([alphabet.index(char) for char in crib], dtype=np.int32)
+    symbol_codepoints = np.array([ord(char) for char in alphabet], dtype=np.uint32)
     
-    return results
+    # A window is valid when it contains no characters outside the alphabet
+    invalid = np.concatenate(([0], np.cumsum(indices < 0)))
+    starts = np.flatnonzero(invalid[crib_length:] == invalid[:-crib_length])
+    offsets = np.arange(crib_length)
+    
+    for block_start in range(0, len(starts), block_size):
+        block = starts[block_start:block_start + block_size]
+        positions = block[:, None] + offsets
+        key_indices = (indices[positions] - crib_indices) % size
+        key_fragments = array_backend.rows_to_strings(symbol_codepoints[key_indices])
+        windows = array_backend.rows_to_strings(codepoints[positions])
+        yield from zip(block.tolist(), key_fragments, windows)
 
 
 def analyze_crib_results(results):
@@ -77,6 +123,446 @@ def analyze_crib_results(results):
     return key_counts
 
 
+# Typecode of the arrays holding window positions and fragment ids
+POSITION_TYPECODE = 'I'
+
+
+def _max_packed_length(size):
+    """Longest key fragment whose packed code size ** length fits in an int64."""
+    length = 0
+    while size ** (length + 1) <= 2 ** 63 - 1:
+        length += 1
+    return length
+
+
+def _decode_fragment(alphabet, code, length):
+    if isinstance(code, bytes):
+        return ''.join([alphabet[index] for index in code])
+    chars = []
+    for _ in range(length):
+        code, index = divmod(code, len(alphabet))
+        chars.append(alphabet[index])
+    return ''.join(reversed(chars))
+
+
+def _decode_fragments(alphabet, codes, length):
+    """Decode a NumPy array of packed fragment codes into strings."""
+    np = array_backend.np
+    if codes.dtype.kind == 'V':
+        key_indices = np.frombuffer(codes.tobytes(), dtype=np.uint8).reshape(-1, length)
+    else:
+        powers = len(alphabet) ** np.arange(length - 1, -1, -1, dtype=np.int64)
+        key_indices = codes[:, None] // powers % len(alphabet)
+    symbol_codepoints = np.array([ord(char) for char in alphabet], dtype=np.uint32)
+    return array_backend.rows_to_strings(symbol_codepoints[key_indices])
+
+
+def _iter_crib_codes(alphabet, ciphertext, crib, block_size=65536):
+    """
+    Yield (starts, codes) blocks for the windows matched by a lowercased crib.
+    
+    Each key fragment is packed into one integer, its alphabet indices read
+    as the digits of a base len(alphabet) number. With NumPy both are
+    arrays; fragments too long for an int64 code are packed as fixed-width
+    bytes (one byte per index) instead. Without NumPy both are lists.
+    """
+    crib_length = len(crib)
+    if crib_length == 0:
+        for start in range(0, len(ciphertext) + 1, block_size):
+            stop = min(start + block_size, len(ciphertext) + 1)
+            yield list(range(start, stop)), [0] * (stop - start)
+        return
+    if crib_length > len(ciphertext) or any(char not in alphabet for char in crib):
+        return
+    
+    size = len(alphabet)
+    if array_backend.is_available() and size <= 256:
+        np = array_backend.np
+        crib_indices = np.array([alphabet.index(char) for char in crib], dtype=np.int64)
+        powers = size ** np.arange(crib_length - 1, -1, -1, dtype=np.int64)
+        packed = crib_length <= _max_packed_length(size)
+        offsets = np.arange(crib_length)
+        # Windows starting in each segment of block_size characters, so the
+        # arrays never grow with the length of the ciphertext
+        for segment_start in range(0, len(ciphertext) - crib_length + 1, block_size):
+            segment = ciphertext[segment_start:segment_start + block_size + crib_length - 1]
+            indices = array_backend.text_to_indices(alphabet, segment)
+            invalid = np.concatenate(([0], np.cumsum(indices < 0)))
+            starts = np.flatnonzero(invalid[crib_length:] == invalid[:-crib_length])
+            if len(starts):
+                key_indices = (indices[starts[:, None] + offsets] - crib_indices) % size
+                if packed:
+                    codes = key_indices @ powers
+                else:
+                    codes = np.ascontiguousarray(key_indices, dtype=np.uint8).view(
+                        np.dtype((np.void, crib_length))).ravel()
+                yield starts + segment_start, codes
+        return
+    
+    # key_tables[j][c] is the key index when ciphertext char c lines up with crib[j]
+    key_tables = [
+        {char: (i - alphabet.index(plain_char)) % size for i, char in enumerate(alphabet)}
+        for plain_char in crib
+    ]
+    starts = []
+    codes = []
+    run = 0  # Length of the current run of alphabet characters
+    for end, char in enumerate(ciphertext):
+        run = run + 1 if char in alphabet else 0
+        if run >= crib_length:
+            start = end - crib_length + 1
+            code = 0
+            for table, c in zip(key_tables, ciphertext[start:end + 1]):
+                code = code * size + table[c]
+            starts.append(start)
+            codes.append(code)
+            if len(starts) == block_size:
+                yield starts, codes
+                starts = []
+                codes = []
+    if starts:
+        yield starts, codes
+
+
+class CribMatches:
+    """
+    Compact crib search results.
+    
+    Instead of one (position, key_fragment, window) tuple per window, the
+    windows are kept as two parallel arrays: their start positions and the
+    id of their key fragment in fragments, which holds every distinct
+    fragment once, in order of first occurrence. The arrays are NumPy
+    uint32 arrays when NumPy is available, array('I') otherwise.
+    
+    Iterating yields the same tuples as iter_crib_search, so the matches
+    can be passed to analyze_crib_results.
+    
+    Args:
+        text (str): Lowercased ciphertext the windows are taken from
+        crib_length (int): Length of the crib
+        positions: Start position of every window
+        fragment_ids: Index in fragments of the key fragment of every window
+        fragments (list): Distinct key fragments
+    """
+    
+    def __init__(self, text, crib_length, positions, fragment_ids, fragments):
+        self.text = text
+        self.crib_length = crib_length
+        self.positions = positions
+        self.fragment_ids = fragment_ids
+        self.fragments = fragments
+    
+    def __len__(self):
+        return len(self.positions)
+    
+    def __iter__(self):
+        fragments = self.fragments
+        text = self.text
+        crib_length = self.crib_length
+        for position, fragment_id in zip(self.positions, self.fragment_ids):
+            position = int(position)
+            yield (position, fragments[fragment_id], text[position:position + crib_length])
+    
+    def __repr__(self):
+        return f"CribMatches(windows={len(self)}, fragments={len(self.fragments)})"
+    
+    def counts(self):
+        """
+        Count the windows of every key fragment.
+        
+        Returns:
+            list: Number of windows per fragment id
+        """
+        if array_backend.is_available() and not isinstance(self.fragment_ids, array):
+            np = array_backend.np
+            return np.bincount(self.fragment_ids, minlength=len(self.fragments)).tolist()
+        counts = [0] * len(self.fragments)
+        for fragment_id in self.fragment_ids:
+            counts[fragment_id] += 1
+        return counts
+    
+    def positions_of(self, fragment):
+        """
+        Get the start positions of the windows with a key fragment.
+        
+        Args:
+            fragment (str): Key fragment
+        
+        Returns:
+            list: Positions in increasing order (empty if the fragment never occurs)
+        """
+        try:
+            fragment_id = self.fragments.index(fragment)
+        except ValueError:
+            return []
+        if array_backend.is_available() and not isinstance(self.fragment_ids, array):
+            return self.positions[self.fragment_ids == fragment_id].tolist()
+        return [position for position, other in zip(self.positions, self.fragment_ids) if other == fragment_id]
+    
+    def top_fragments(self, top_n=10, max_positions=None):
+        """
+        Get the most frequent key fragments.
+        
+        Args:
+            top_n (int): Number of fragments to return
+            max_positions (int): Positions to list per fragment (default: all)
+        
+        Returns:
+            list: Dicts with 'fragment', 'count' and 'positions', most
+            frequent first; ties in order of first occurrence
+        """
+        counts = self.counts()
+        best = heapq.nlargest(top_n, range(len(counts)), key=counts.__getitem__)
+        return [{'fragment': self.fragments[fragment_id], 'count': counts[fragment_id],
+                 'positions': self.positions_of(self.fragments[fragment_id])[:max_positions]}
+                for fragment_id in best]
+
+
+def compact_crib_search(ciphertext, crib, lang='english', block_size=65536):
+    """
+    Perform a crib search and return the matches in compact form.
+    
+    Finds the same windows as vigenere_crib_search, but stores a position
+    and a fragment id per window (see CribMatches) instead of two strings
+    and a tuple.
+    
+    Args:
+        ciphertext (str): The encrypted text
+        crib (str): Known plaintext word/phrase to search for
+        lang (str): Language ('english' or 'hebrew')
+        block_size (int): Number of windows computed at a time
+    
+    Returns:
+        CribMatches: The matches (empty for unsupported languages)
+    """
+    alphabet = get_alphabet(lang)
+    text = ciphertext.lower()
+    crib = crib.lower()
+    if alphabet is None:
+        return CribMatches(text, len(crib), array(POSITION_TYPECODE), array(POSITION_TYPECODE), [])
+    
+    blocks = list(_iter_crib_codes(alphabet, text, crib, block_size))
+    if blocks and array_backend.is_available() and not isinstance(blocks[0][1], list):
+        np = array_backend.np
+        positions = np.concatenate([starts for starts, _ in blocks]).astype(np.uint32)
+        codes, first, inverse = np.unique(np.concatenate([codes for _, codes in blocks]),
+                                          return_index=True, return_inverse=True)
+        # Renumber the fragments in order of first occurrence
+        order = np.argsort(first, kind='stable')
+        ranks = np.empty(len(order), dtype=np.uint32)
+        ranks[order] = np.arange(len(order), dtype=np.uint32)
+        fragments = _decode_fragments(alphabet, codes[order], len(crib))
+        return CribMatches(text, len(crib), positions, ranks[inverse.ravel()], fragments)
+    
+    positions = array(POSITION_TYPECODE)
+    fragment_ids = array(POSITION_TYPECODE)
+    ids = {}
+    for starts, codes in blocks:
+        positions.extend(int(start) for start in starts)
+        for code in codes:
+            fragment_id = ids.get(code)
+            if fragment_id is None:
+                fragment_id = ids[code] = len(ids)
+            fragment_ids.append(fragment_id)
+    fragments = [_decode_fragment(alphabet, code, len(crib)) for code in ids]
+    return CribMatches(text, len(crib), positions, fragment_ids, fragments)
+
+
+def top_crib_fragments(ciphertext, crib, lang='english', top_n=10, max_positions=5, block_size=65536):
+    """
+    Find the most frequent key fragments of a crib search without storing the matches.
+    
+    The windows are counted in blocks with a Counter keyed by the packed
+    fragment codes, so memory grows with the number of distinct fragments
+    instead of the length of the ciphertext. A second pass collects the
+    first positions of the top fragments only.
+    
+    Args:
+        ciphertext (str): The encrypted text
+        crib (str): Known plaintext word/phrase to search for
+        lang (str): Language ('english' or 'hebrew')
+        top_n (int): Number of fragments to return
+        max_positions (int): First positions to list per fragment
+        block_size (int): Number of windows computed at a time
+    
+    Returns:
+        dict: {'windows': number of windows, 'unique': number of distinct
+               fragments, 'top': list of dicts with 'fragment', 'count' and
+               'positions', most frequent first; ties in order of first
+               occurrence, like analyze_crib_results}
+    """
+    alphabet = get_alphabet(lang)
+    if alphabet is None:
+        return {'windows': 0, 'unique': 0, 'top': []}
+    text = ciphertext.lower()
+    crib = crib.lower()
+    
+    counts = Counter()
+    windows = 0
+    for starts, codes in _iter_crib_codes(alphabet, text, crib, block_size):
+        windows += len(starts)
+        if isinstance(codes, list):
+            counts.update(codes)
+            continue
+        np = array_backend.np
+        unique, first, block_counts = np.unique(codes, return_index=True, return_counts=True)
+        # Insert new codes in order of first occurrence to keep ties stable
+        order = np.argsort(first, kind='stable')
+        for code, count in zip(unique[order].tolist(), block_counts[order].tolist()):
+            counts[code] += count
+    
+    best = heapq.nlargest(top_n, counts.items(), key=itemgetter(1))
+    samples = {code: [] for code, _ in best}
+    if samples and max_positions:
+        wanted = len(samples)
+        for starts, codes in _iter_crib_codes(alphabet, text, crib, block_size):
+            if not isinstance(codes, list):
+                np = array_backend.np
+                mask = np.isin(codes, np.array(list(samples), dtype=codes.dtype))
+                starts = starts[mask].tolist()
+                codes = codes[mask].tolist()
+            for start, code in zip(starts, codes):
+                sample = samples.get(code)
+                if sample is not None and len(sample) < max_positions:
+                    sample.append(start)
+                    if len(sample) == max_positions:
+                        wanted -= 1
+            if not wanted:
+                break
+    
+    top = [{'fragment': _decode_fragment(alphabet, code, len(crib)), 'count': count, 'positions': samples[code]}
+           for code, count in best]
+    return {'windows': windows, 'unique': len(counts), 'top': top}
+
+
+def batch_crib_search(ciphertext, cribs, lang='english'):
+    """
+    Run a crib search for many cribs against one ciphertext.
+    
+    The ciphertext is lowercased and indexed once for all cribs. With NumPy,
+    the cribs are arranged in a trie so cribs sharing a prefix (e.g. "the",
+    "then", "there") share the key columns computed for that prefix.
+    
+    Args:
+        ciphertext (str): The encrypted text
+        cribs (list): Known plaintext words/phrases to search for
+        lang (str): Language ('english' or 'hebrew')
+    
+    Returns:
+        dict: Crib -> list of tuples (position, key_fragment, decrypted_window),
+        the same lists vigenere_crib_search returns for each crib
+    """
+    alphabet = get_alphabet(lang)
+    if alphabet is None:
+        return {crib: [] for crib in cribs}
+    
+    ciphertext = ciphertext.lower()
+    results = {}
+    searchable = []
+    for crib in cribs:
+        lower_crib = crib.lower()
+        if not lower_crib or not array_backend.is_available():
+            results[crib] = list(_iter_crib_search_lowered(alphabet, ciphertext, lower_crib))
+        elif len(lower_crib) > len(ciphertext) or any(char not in alphabet for char in lower_crib):
+            results[crib] = []
+        else:
+            searchable.append(crib)
+    
+    if searchable:
+        results.update(_batch_crib_search_numpy(alphabet, ciphertext, searchable))
+    return {crib: results[crib] for crib in cribs}
+
+
+def _iter_crib_search_lowered(alphabet, ciphertext, crib, block_size=65536):
+    crib_length = len(crib)
+    if crib_length == 0:
+        for i in range(len(ciphertext) + 1):
+            yield (i, "", "")
+        return
+    if crib_length > len(ciphertext) or any(char not in alphabet for char in crib):
+        return
+    
+    if array_backend.is_available():
+        yield from _iter_crib_search_numpy(alphabet, ciphertext, crib, block_size)
+    else:
+        yield from _iter_crib_search_python(alphabet, ciphertext, crib)
+
+
+def _batch_crib_search_numpy(alphabet, ciphertext, cribs):
+    np = array_backend.np
+    size = len(alphabet)
+    text_length = len(ciphertext)
+    
+    codepoints = array_backend.text_to_codepoints(ciphertext)
+    indices = array_backend.text_to_indices(alphabet, ciphertext)
+    invalid = np.concatenate(([0], np.cumsum(indices < 0)))
+    symbol_codepoints = np.array([ord(char) for char in alphabet], dtype=np.uint32)
+    
+    # Trie of lowercased cribs; each node lists the cribs that end there
+    root = {'children': {}, 'cribs': []}
+    for crib in cribs:
+        node = root
+        for char in crib.lower():
+            node = node['children'].setdefault(char, {'children': {}, 'cribs': []})
+        node['cribs'].append(crib)
+    
+    results = {}
+    # Each stack entry carries the key columns of its prefix: column j holds
+    # (C[s + j] - P[j]) % size for every start s, shared by all cribs below it
+    stack = [(root, [])]
+    while stack:
+        node, columns = stack.pop()
+        depth = len(columns)
+        if node['cribs']:
+            starts = np.flatnonzero(invalid[depth:] == invalid[:-depth])
+            positions = starts[:, None] + np.arange(depth)
+            key_indices = np.stack([column[starts] for column in columns], axis=1)
+            matches = list(zip(
+                starts.tolist(),
+                array_backend.rows_to_strings(symbol_codepoints[key_indices]),
+                array_backend.rows_to_strings(codepoints[positions]),
+            ))
+            for crib in node['cribs']:
+                results[crib] = list(matches)
+        for char, child in node['children'].items():
+            shifted = indices[depth:text_length] - alphabet.index(char)
+            stack.append((child, columns + [(shifted % size).astype(np.int16)]))
+    
+    return results
+
+
+def batch_crib_analysis(ciphertext, cribs, lang='english'):
+    """
+    Run batch_crib_search and aggregate the key fragments.
+    
+    Args:
+        ciphertext (str): The encrypted text
+        cribs (list): Known plaintext words/phrases to search for
+        lang (str): Language ('english' or 'hebrew')
+    
+    Returns:
+        dict: {'results': crib -> crib search results,
+               'per_crib': crib -> analyze_crib_results dict,
+               'merged': analyze_crib_results dict over all cribs}
+    """
+    results = batch_crib_search(ciphertext, cribs, lang)
+    per_crib = {crib: analyze_crib_results(crib_results) for crib, crib_results in results.items()}
+    
+    merged = {}
+    for key_counts in per_crib.values():
+        for key_fragment, data in key_counts.items():
+            if key_fragment in merged:
+                merged[key_fragment]['count'] += data['count']
+                merged[key_fragment]['positions'].extend(data['positions'])
+            else:
+                merged[key_fragment] = {
+                    'count': data['count'],
+                    'positions': list(data['positions'])
+                }
+    
+    return {'results': results, 'per_crib': per_crib, 'merged': merged}
+
+
 def print_crib_analysis(ciphertext, crib, lang='english', top_n=10):
     """
     Perform crib search and display results with unique key fragments.
@@ -94,40 +580,333 @@ def print_crib_analysis(ciphertext, crib, lang='english', top_n=10):
     print(f"Language: {lang}")
     print("=" * 70)
     
-    results = vigenere_crib_search(ciphertext, crib, lang)
+    analysis = top_crib_fragments(ciphertext, crib, lang, top_n)
     
-    if not results:
+    if not analysis['windows']:
         print("No matches found for the crib.")
         return
     
-    print(f"\nTotal possible positions: {len(results)}")
-    
-    key_counts = analyze_crib_results(results)
-    
-    # Sort by count (descending)
-    sorted_keys = sorted(key_counts.items(), key=lambda x: x[1]['count'], reverse=True)
-    
-    print(f"\nUnique key fragments found: {len(sorted_keys)}")
+    print(f"\nTotal possible positions: {analysis['windows']}")
+    print(f"\nUnique key fragments found: {analysis['unique']}")
     print("=" * 70)
     print(f"{'Key Fragment':<20} {'Count':<10} {'Positions'}")
     print("-" * 70)
     
-    for key_fragment, data in sorted_keys[:top_n]:
-        positions_str = ', '.join(map(str, data['positions'][:5]))
-        if len(data['positions']) > 5:
-            positions_str += f", ... ({len(data['positions'])} total)"
-        print(f"{key_fragment:<20} {data['count']:<10} {positions_str}")
+    for entry in analysis['top']:
+        positions_str = ', '.join(map(str, entry['positions']))
+        if entry['count'] > len(entry['positions']):
+            positions_str += f", ... ({entry['count']} total)"
+        print(f"{entry['fragment']:<20} {entry['count']:<10} {positions_str}")
     
     print("=" * 70)
     
     # Show most likely key fragment
-    if sorted_keys:
-        most_common = sorted_keys[0]
-        print(f"\nMost frequent key fragment: '{most_common[0]}' (appears {most_common[1]['count']} times)")
+    if analysis['top']:
+        most_common = analysis['top'][0]
+        print(f"\nMost frequent key fragment: '{most_common['fragment']}' (appears {most_common['count']} times)")
         print(f"This suggests the key repeats with these characters at corresponding positions.")
 
 
 
+def _alphabet_stream(alphabet, text):
+    """
+    Alphabet indices of the characters of text that advance a Vigenère key.
+    
+    Returns a NumPy array when NumPy is available, otherwise a list.
+    """
+    if array_backend.is_available():
+        indices = array_backend.text_to_indices(alphabet, text.lower())
+        return indices[indices >= 0]
+    return [alphabet.index(char) for char in text.lower() if char in alphabet]
+
+
+def _column_counts(stream, length, size):
+    """Count each symbol in each of the `length` key columns of stream."""
+    if array_backend.is_available():
+        np = array_backend.np
+        columns = np.arange(len(stream)) % length
+        counts = np.bincount(columns * size + stream, minlength=length * size)
+        return counts.reshape(length, size).tolist()
+    counts = [[0] * size for _ in range(length)]
+    for i, symbol in enumerate(stream):
+        counts[i % length][symbol] += 1
+    return counts
+
+
+def index_of_coincidence(counts):
+    """
+    Compute the index of coincidence of a list of symbol counts.
+    
+    Args:
+        counts (list): Number of occurrences of each alphabet symbol
+    
+    Returns:
+        float: Probability that two randomly chosen symbols are equal (0 for fewer than 2 symbols)
+    """
+    total = sum(counts)
+    if total < 2:
+        return 0.0
+    return sum(count * (count - 1) for count in counts) / (total * (total - 1))
+
+
+def _kasiski_spacings(stream, size, ngram):
+    """Distances between consecutive occurrences of each repeated n-gram."""
+    count = max(len(stream) - ngram + 1, 0)
+    if array_backend.is_available():
+        np = array_backend.np
+        if count < 2:
+            return np.zeros(0, dtype=np.int64)
+        # Pack each n-gram into one integer so repeats can be found by sorting
+        codes = np.zeros(count, dtype=np.int64)
+        for k in range(ngram):
+            codes = codes * size + stream[k:k + count]
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        repeated = sorted_codes[1:] == sorted_codes[:-1]
+        return order[1:][repeated] - order[:-1][repeated]
+    
+    last_seen = {}
+    spacings = []
+    for i in range(count):
+        code = tuple(stream[i:i + ngram])
+        if code in last_seen:
+            spacings.append(i - last_seen[code])
+        last_seen[code] = i
+    return spacings
+
+
+def _count_multiples(spacings, length):
+    if array_backend.is_available():
+        return int(array_backend.np.count_nonzero(spacings % length == 0))
+    return sum(1 for spacing in spacings if spacing % length == 0)
+
+
+def rank_key_lengths(ciphertext, lang='english', max_length=20, ngram=3):
+    """
+    Score candidate Vigenère key lengths for a ciphertext.
+    
+    Two statistics are combined, each normalized to [0, 1] across candidates:
+    - Kasiski: how much more often than chance (1/length) the spacings between
+      repeated n-grams are multiples of the length
+    - Index of coincidence: the average IoC of the key columns, relative to
+      the IoC of uniformly random text (1/alphabet_size)
+    
+    Lengths whose column IoC is already reached by one of their divisors have
+    their score halved, so multiples of the key length rank below it. Only
+    alphabet characters are considered, since other characters do not
+    advance the key.
+    
+    Args:
+        ciphertext (str): The encrypted text
+        lang (str): Language ('english' or 'hebrew')
+        max_length (int): Longest key length to consider
+        ngram (int): Length of the repeated sequences used for Kasiski spacings
+    
+    Returns:
+        list: Dicts with 'length', 'score', 'ioc' and 'kasiski', best first
+    """
+    alphabet = get_alphabet(lang)
+    if alphabet is None:
+        return []
+    
+    size = len(alphabet)
+    stream = _alphabet_stream(alphabet, ciphertext)
+    max_length = min(max_length, len(stream) // 2)
+    if max_length < 1:
+        return []
+    
+    spacings = _kasiski_spacings(stream, size, ngram)
+    candidates = []
+    for length in range(1, max_length + 1):
+        columns = _column_counts(stream, length, size)
+        ioc = sum(index_of_coincidence(counts) for counts in columns) / length
+        if len(spacings):
+            divisible = _count_multiples(spacings, length) / len(spacings)
+            kasiski = max(divisible - 1 / length, 0.0)
+        else:
+            kasiski = 0.0
+        candidates.append({'length': length, 'ioc': ioc, 'kasiski': kasiski})
+    
+    random_ioc = 1 / size
+    best_ioc = max(candidate['ioc'] for candidate in candidates)
+    best_kasiski = max(candidate['kasiski'] for candidate in candidates)
+    for candidate in candidates:
+        ioc_score = 0.0
+        if best_ioc > random_ioc:
+            ioc_score = max(candidate['ioc'] - random_ioc, 0.0) / (best_ioc - random_ioc)
+        kasiski_score = candidate['kasiski'] / best_kasiski if best_kasiski > 0 else 0.0
+        if candidate['length'] == 1:
+            kasiski_score = ioc_score  # Every spacing is a multiple of 1, so Kasiski says nothing
+        candidate['score'] = (ioc_score + kasiski_score) / 2
+    
+    # A multiple of the true length has about the same column IoC as the true
+    # length itself, so halve the score when a divisor explains the IoC as well
+    for candidate in candidates:
+        length = candidate['length']
+        for divisor in candidates[:length // 2]:
+            if length % divisor['length'] == 0 and divisor['ioc'] >= 0.9 * candidate['ioc']:
+                candidate['score'] /= 2
+                break
+    
+    return sorted(candidates, key=lambda x: (-x['score'], x['length']))
+
+
+def estimate_key_length(ciphertext, lang='english', max_length=20, ngram=3):
+    """
+    Estimate the keyword length of a Vigenère ciphertext.
+    
+    Args:
+        ciphertext (str): The encrypted text
+        lang (str): Language ('english' or 'hebrew')
+        max_length (int): Longest key length to consider
+        ngram (int): Length of the repeated sequences used for Kasiski spacings
+    
+    Returns:
+        int: Most likely key length, or None if the text is too short
+    """
+    ranked = rank_key_lengths(ciphertext, lang, max_length, ngram)
+    return ranked[0]['length'] if ranked else None
+
+
+def _best_shift(counts, profile):
+    """
+    Find the key shift that best explains one key column.
+    
+    Args:
+        counts (list): Ciphertext symbol counts of the column
+        profile (tuple): Reference probability of each plaintext symbol
+    
+    Returns:
+        tuple: (shift, chi_squared) with the lowest chi-squared statistic
+    """
+    size = len(profile)
+    total = sum(counts)
+    if total == 0:
+        return 0, 0.0
+    if array_backend.is_available():
+        np = array_backend.np
+        expected = total * np.asarray(profile)
+        # observed[k, i] is the count of the symbol plaintext i encrypts to under shift k
+        shifted = np.add.outer(np.arange(size), np.arange(size)) % size
+        observed = np.asarray(counts)[shifted]
+        chi_squared = ((observed - expected) ** 2 / expected).sum(axis=1)
+        shift = int(chi_squared.argmin())
+        return shift, float(chi_squared[shift])
+    
+    best = None
+    for shift in range(size):
+        chi_squared = 0.0
+        for i, probability in enumerate(profile):
+            expected = total * probability
+            chi_squared += (counts[(i + shift) % size] - expected) ** 2 / expected
+        if best is None or chi_squared < best[1]:
+            best = (shift, chi_squared)
+    return best
+
+
+def _shortest_period(key):
+    """Reduce a key that repeats itself (e.g. 'abcabc') to its shortest period."""
+    for length in range(1, len(key)):
+        if len(key) % length == 0 and key[:length] * (len(key) // length) == key:
+            return key[:length]
+    return key
+
+
+def break_vigenere(ciphertext, lang='english', max_length=20, candidates=3):
+    """
+    Recover the keyword of a Vigenère ciphertext without a crib.
+    
+    For each of the most likely key lengths (see rank_key_lengths), the
+    alphabet characters are split into key columns and every shift of each
+    column is scored with a chi-squared test against the reference letter
+    frequencies of the language (see language_model.get_profile). The best
+    shift of each column gives one key character.
+    
+    Args:
+        ciphertext (str): The encrypted text
+        lang (str): Language ('english' or 'hebrew')
+        max_length (int): Longest key length to consider
+        candidates (int): Number of key lengths to try
+    
+    Returns:
+        list: Dicts with 'key', 'length', 'score' (chi-squared per character,
+        lower is better) and 'plaintext', best first
+    """
+    from language_model import get_profile
+    from vigenere_cipher import VigenereCipher
+    
+    alphabet = get_alphabet(lang)
+    profile = get_profile(lang) if alphabet is not None else None
+    if profile is None:
+        return []
+    
+    size = len(alphabet)
+    stream = _alphabet_stream(alphabet, ciphertext)
+    if len(stream) == 0:
+        return []
+    
+    results = {}
+    for candidate in rank_key_lengths(ciphertext, lang, max_length)[:candidates]:
+        columns = _column_counts(stream, candidate['length'], size)
+        shifts = [_best_shift(counts, profile) for counts in columns]
+        key = _shortest_period(''.join(alphabet[shift] for shift, _ in shifts))
+        score = sum(chi_squared for _, chi_squared in shifts) / len(stream)
+        if key not in results or score < results[key]['score']:
+            results[key] = {'key': key, 'length': len(key), 'score': score}
+    
+    ranked = sorted(results.values(), key=lambda x: x['score'])
+    for result in ranked:
+        result['plaintext'] = VigenereCipher(lang, result['key']).decrypt(ciphertext)
+    return ranked
+
+
+# _char_counts counts with np.bincount while its array (one counter per
+# codepoint up to the highest one) stays this small or smaller than the text
+BINCOUNT_MAX_CODEPOINT = 0x800
+
+# Characters before a capital sigma that FrequencyCounter looks at to
+# lowercase it the way str.lower() does on the whole text
+SIGMA_CONTEXT_LENGTH = 16
+
+
+def _char_counts(text):
+    """
+    Count each distinct character of text in a single pass.
+    
+    Returns:
+        iterable: (character, count) pairs
+    """
+    if '\u03a3' in text:
+        # str.lower() maps capital sigma to 'σ' or final 'ς' depending on the
+        # next character, so it cannot be folded one character at a time
+        text = text.lower()
+    if array_backend.is_available() and text:
+        np = array_backend.np
+        codepoints = array_backend.text_to_codepoints(text)
+        if int(codepoints.max()) < max(len(codepoints), BINCOUNT_MAX_CODEPOINT):
+            counts = np.bincount(codepoints)
+            present = np.flatnonzero(counts)
+            return zip(map(chr, present.tolist()), counts[present].tolist())
+        # np.bincount allocates a counter for every codepoint up to the
+        # highest one: a single emoji would cost a million of them
+        codepoints, counts = np.unique(codepoints, return_counts=True)
+        return zip(map(chr, codepoints.tolist()), counts.tolist())
+    return Counter(text).items()
+
+
+def _add_char_counts(frequency_dict, char_counts):
+    """
+    Add (character, count) pairs to a frequency dict keyed by alphabet symbol.
+    
+    Characters are folded with lower() exactly as text.lower() would, so the
+    result is the same as counting the lowercased text.
+    """
+    for char, count in char_counts:
+        for lower_char in char.lower():
+            if lower_char in frequency_dict:
+                frequency_dict[lower_char] += count
+
+
 def frequency_analysis(lang, text, ignore_spaces=False):
     """
     Perform frequency analysis on the given text.
@@ -146,10 +925,8 @@ def frequency_analysis(lang, text, ignore_spaces=False):
     # Initialize frequency dictionary with all alphabet characters set to 0
     frequency_dict = {char: 0 for char in alphabet}
     
-    # Count occurrences of each character in the text
-    for char in text.lower():
-        if char in alphabet:
-            frequency_dict[char] += 1
+    # Count each distinct character once, then fold case into the alphabet
+    _add_char_counts(frequency_dict, _char_counts(text))
 
     if ignore_spaces:
         frequency_dict.pop(' ', None)  # Remove space from frequency dict if ignored
@@ -167,7 +944,17 @@ def plot_frequency(lang, text, title="Character Frequency Analysis", ignore_spac
         title (str): Title for the plot
     """
     frequency_dict = frequency_analysis(lang, text, ignore_spaces=ignore_spaces)
+    plot_frequency_dict(frequency_dict, title)
+
+
+def plot_frequency_dict(frequency_dict, title="Character Frequency Analysis"):
+    """
+    Plot precomputed character frequencies using text-based visualization.
     
+    Args:
+        frequency_dict (dict): Character counts, as returned by frequency_analysis
+        title (str): Title for the plot
+    """
     characters = list(frequency_dict.keys())
     frequencies = list(frequency_dict.values())
     
@@ -210,3 +997,145 @@ def plot_frequency(lang, text, title="Character Frequency Analysis", ignore_spac
     print(f"Total characters: {total_chars}\n")
 
 
+class FrequencyCounter:
+    """
+    Incremental, mergeable character frequency counter.
+    
+    Text can be added in chunks with update() and counters built separately
+    (e.g. in different processes) can be combined with +, so frequencies of
+    inputs that do not fit in memory can be computed without rereading them.
+    The result is the same as frequency_analysis on the concatenated text:
+    a capital sigma at the end of a chunk is held back until the next chunk
+    shows whether str.lower() would make it a final 'ς', and the last
+    SIGMA_CONTEXT_LENGTH characters counted are kept to tell whether a
+    letter comes before it. Only a sigma separated from the previous letter
+    by more than that many accents or apostrophes can be lowercased
+    differently.
+    
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        ignore_spaces (bool): Leave space out of to_dict() and plot()
+    """
+    
+    def __init__(self, lang, ignore_spaces=False):
+        self.lang = lang
+        self.ignore_spaces = ignore_spaces
+        alphabet = get_alphabet(lang) if lang else None
+        self.counts = {char: 0 for char in alphabet} if alphabet is not None else {}
+        # End of the text counted so far, and a trailing capital sigma (with
+        # what follows it) whose lowercase form depends on the next chunk
+        self._context = ''
+        self._pending = ''
+    
+    def update(self, text):
+        """
+        Add the characters of a chunk of text to the counts.
+        
+        Args:
+            text (str): Text to count
+        """
+        if not self.counts:
+            return
+        text = self._pending + text
+        self._pending = ''
+        if '\u03a3' in text:
+            # str.lower() maps capital sigma to a final 'ς' after a letter
+            # unless a letter follows, so look at both neighbouring chunks
+            last_sigma = text.rindex('\u03a3')
+            before = (self._context + text[:last_sigma])[-SIGMA_CONTEXT_LENGTH:]
+            tail = before + text[last_sigma:]
+            if (tail + 'A').lower()[:-1] != tail.lower():
+                text, self._pending = text[:last_sigma], text[last_sigma:]
+            text_counts = _char_counts(self._lower(text, self._pending))
+        else:
+            text_counts = _char_counts(text)
+        _add_char_counts(self.counts, text_counts)
+        self._context = (self._context + text)[-SIGMA_CONTEXT_LENGTH:]
+    
+    def _lower(self, text, following=''):
+        """Lowercase text as str.lower() would between the context and following."""
+        start = len(self._context.lower())
+        lowered = (self._context + text + following).lower()
+        return lowered[start:start + len(text.lower())]
+    
+    def _settled_counts(self):
+        """Counts including a held back sigma, taken as the end of the text."""
+        counts = dict(self.counts)
+        if self._pending:
+            _add_char_counts(counts, _char_counts(self._lower(self._pending)))
+        return counts
+    
+    def update_stream(self, infile, chunk_size=64 * 1024):
+        """
+        Count a text file object chunk by chunk.
+        
+        Args:
+            infile: Readable text file object
+            chunk_size (int): Number of characters to read at a time
+        """
+        while True:
+            chunk = infile.read(chunk_size)
+            if not chunk:
+                break
+            self.update(chunk)
+    
+    def _check_compatible(self, other):
+        if not isinstance(other, FrequencyCounter):
+            return NotImplemented
+        if self.counts.keys() != other.counts.keys():
+            raise ValueError(f"Cannot merge counters for '{self.lang}' and '{other.lang}'")
+        return None
+    
+    def __add__(self, other):
+        incompatible = self._check_compatible(other)
+        if incompatible is not None:
+            return incompatible
+        result = FrequencyCounter(self.lang, self.ignore_spaces)
+        other_counts = other._settled_counts()
+        result.counts = {char: count + other_counts[char]
+                         for char, count in self._settled_counts().items()}
+        return result
+    
+    def __iadd__(self, other):
+        incompatible = self._check_compatible(other)
+        if incompatible is not None:
+            return incompatible
+        self.counts = self._settled_counts()
+        self._context = self._pending = ''
+        for char, count in other._settled_counts().items():
+            self.counts[char] += count
+        return self
+    
+    def __eq__(self, other):
+        if not isinstance(other, FrequencyCounter):
+            return NotImplemented
+        return self.lang == other.lang and self.to_dict() == other.to_dict()
+    
+    def __repr__(self):
+        return f"FrequencyCounter(lang={self.lang!r}, total={self.total})"
+    
+    @property
+    def total(self):
+        """Number of alphabet characters counted (excluding space if ignored)."""
+        return sum(self.to_dict().values())
+    
+    def to_dict(self):
+        """
+        Get the counts in the format returned by frequency_analysis.
+        
+        Returns:
+            dict: Dictionary with character frequencies
+        """
+        frequency_dict = self._settled_counts()
+        if self.ignore_spaces:
+            frequency_dict.pop(' ', None)
+        return frequency_dict
+    
+    def plot(self, title="Character Frequency Analysis"):
+        """
+        Plot the counts like plot_frequency.
+        
+        Args:
+            title (str): Title for the plot
+        """
+        plot_frequency_dict(self.to_dict(), title)
@@ -0,0 +1,327 @@
+"""
+Dictionary attack on Vigenère ciphertexts.
+
+Every candidate keyword from a wordlist is cleaned exactly like
+vigenere_decrypt cleans a keyword, and scored by the n-gram log-likelihood
+(see language_model.get_ngram_model) of a short decrypted prefix of the
+ciphertext instead of the whole text. Candidates are screened on the first
+few characters of the prefix, and only the most promising ones are scored
+on the rest of it. Log-probabilities are never positive, so the running
+score of a candidate only goes down as more characters are added: as soon
+as it drops below the score it has to beat, the candidate is abandoned.
+Only the final top candidates are decrypted in full.
+
+The wordlist is read lazily in chunks, which are scored in a process pool.
+At most two chunks per worker are in flight, and each carries the best
+score threshold known when it is submitted.
+"""
+
+import heapq
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from alphabets import get_alphabet
+import array_backend
+from cyber_tools import _shortest_period
+from language_model import encode_text, get_ngram_model
+from vigenere_cipher import vigenere_decrypt
+
+
+DEFAULT_PREFIX_LENGTH = 64
+DEFAULT_CHUNK_SIZE = 20000
+
+# Every candidate is first scored on this many characters, and only the
+# best SCREEN_FACTOR * top_n candidates of each chunk on the whole prefix
+SCREEN_LENGTH = 16
+SCREEN_FACTOR = 20
+
+
+def read_wordlist(path, encoding='utf-8'):
+    """
+    Lazily read candidate keywords from a wordlist file, one per line.
+
+    Blank lines are skipped.
+
+    Args:
+        path (str): Wordlist file
+        encoding (str): File encoding
+
+    Yields:
+        str: Candidate keywords
+    """
+    with open(path, 'r', encoding=encoding, errors='replace') as file:
+        for line in file:
+            word = line.strip()
+            if word:
+                yield word
+
+
+class _KeyTable(dict):
+    """
+    str.translate table that maps keyword characters to chr(alphabet index).
+
+    Characters are resolved through lower() the first time they are seen,
+    exactly as VigenereCipher cleans a keyword; characters outside the
+    alphabet are deleted.
+    """
+
+    def __init__(self, alphabet):
+        super().__init__()
+        self._positions = {char: chr(index) for index, char in enumerate(alphabet)}
+
+    def __missing__(self, codepoint):
+        value = self._positions.get(chr(codepoint).lower())
+        self[codepoint] = value
+        return value
+
+
+class _PrefixScorer:
+    """
+    Scores candidate keywords on a decrypted prefix of one ciphertext.
+
+    Candidates are first screened on the first SCREEN_LENGTH characters;
+    only the best SCREEN_FACTOR * top_n of them are scored on the whole
+    prefix. Both stages stop scoring a candidate as soon as it falls below
+    the score it has to beat.
+
+    Args:
+        lang (str): Language of the plaintext
+        prefix (list): Alphabet indices of the first ciphertext symbols
+        top_n (int): Number of best candidates to keep
+    """
+
+    def __init__(self, lang, prefix, top_n):
+        alphabet = get_alphabet(lang)
+        model = get_ngram_model(lang) or get_ngram_model(lang, 1)
+        self.key_table = _KeyTable(alphabet)
+        self.size = len(alphabet)
+        self.order = model.order
+        self.prefix = list(prefix)
+        self.top_n = top_n
+        self.use_numpy = array_backend.is_available()
+        if self.use_numpy:
+            self.np = array_backend.np
+            self.tables = [self.np.asarray(table) for table in model.log_probabilities]
+            self.prefix_array = self.np.asarray(self.prefix, dtype=self.np.int64)
+        else:
+            self.tables = [list(table) for table in model.log_probabilities]
+
+    def clean(self, word):
+        """
+        Key of a keyword: its alphabet indices as a string of chr(index),
+        cleaned like VigenereCipher cleans the keyword.
+
+        A keyword that repeats itself (e.g. 'lemonlemon') is reduced to its
+        shortest period, since both decrypt to the same text.
+        """
+        return _shortest_period(word.translate(self.key_table))
+
+    def score_words(self, words, threshold):
+        """
+        Score candidate keywords and keep the best top_n.
+
+        Args:
+            words (list): Candidate keywords
+            threshold (float): Candidates whose prefix log-likelihood is
+                below this are dropped (the k-th best score found so far)
+
+        Returns:
+            list: (log_likelihood, key, word) tuples of the best candidates
+        """
+        candidates = {}
+        for word in words:
+            key = self.clean(word)
+            if key and key not in candidates:
+                candidates[key] = word
+        if not candidates or not self.prefix:
+            return []
+
+        best = self._best(list(candidates), min(SCREEN_LENGTH, len(self.prefix)), threshold,
+                          self.top_n * SCREEN_FACTOR)
+        if SCREEN_LENGTH < len(self.prefix):
+            best = self._best([key for _, key in best], len(self.prefix), threshold, self.top_n)
+        else:
+            best = sorted(best, reverse=True)[:self.top_n]
+        return [(total, key, candidates[key]) for total, key in best]
+
+    def _best(self, keys, length, threshold, keep):
+        """
+        The `keep` best keys on the first `length` prefix characters.
+
+        Returns:
+            list: (log_likelihood, key) of the best keys scoring at least threshold
+        """
+        if self.use_numpy:
+            np = self.np
+            totals = self._sum_log_probabilities(self._decrypt(keys, length))
+            rows = np.flatnonzero(totals >= threshold)
+            if len(rows) > keep:
+                rows = rows[np.argpartition(-totals[rows], keep - 1)[:keep]]
+            return [(total, keys[row]) for row, total in zip(rows.tolist(), totals[rows].tolist())]
+
+        heap = []
+        for key in keys:
+            bound = max(heap[0][0], threshold) if len(heap) == keep else threshold
+            total = self.log_likelihood(key, length, bound)
+            if total is None:
+                continue
+            if len(heap) < keep:
+                heapq.heappush(heap, (total, key))
+            else:
+                heapq.heapreplace(heap, (total, key))
+        return heap
+
+    def log_likelihood(self, key, length, bound=float('-inf')):
+        """
+        Log-likelihood of the first `length` prefix characters decrypted with a key (see clean).
+
+        Returns None as soon as the running total falls below bound: every
+        term is a log-probability, so the total can only decrease.
+        """
+        size = self.size
+        order = self.order
+        tables = self.tables
+        table = tables[-1]
+        modulus = size ** (order - 1)
+        shifts = [ord(char) for char in key]
+        period = len(shifts)
+        total = 0.0
+        code = 0
+        for i, symbol in enumerate(self.prefix[:length]):
+            code = code % modulus * size + (symbol - shifts[i % period]) % size
+            total += table[code] if i >= order - 1 else tables[i][code]
+            if total < bound:
+                return None
+        return total
+
+    def _decrypt(self, keys, columns):
+        """Decrypt the first `columns` prefix symbols with each key, one row per key."""
+        np = self.np
+        plain = np.empty((len(keys), columns), dtype=np.int64)
+        by_period = {}
+        for row, key in enumerate(keys):
+            by_period.setdefault(len(key), []).append(row)
+        positions = np.arange(columns)
+        for period, rows in by_period.items():
+            joined = ''.join([keys[row] for row in rows]).encode('utf-32-le')
+            shifts = np.frombuffer(joined, dtype=np.uint32).reshape(len(rows), period).astype(np.int64)
+            plain[rows] = self.prefix_array[:columns] - shifts[:, positions % period]
+        return plain % self.size
+
+    def _sum_log_probabilities(self, plain):
+        np = self.np
+        size = self.size
+        order = self.order
+        count, columns = plain.shape
+        total = np.zeros(count)
+        code = np.zeros(count, dtype=np.int64)
+        for i in range(min(order - 1, columns)):
+            code = code * size + plain[:, i]
+            total += self.tables[i][code]
+        if columns >= order:
+            width = columns - order + 1
+            codes = np.zeros((count, width), dtype=np.int64)
+            for k in range(order):
+                codes = codes * size + plain[:, k:k + width]
+            total += self.tables[-1][codes].sum(axis=1)
+        return total
+
+
+_worker_scorer = None
+
+
+def _init_worker(lang, prefix, top_n):
+    global _worker_scorer
+    _worker_scorer = _PrefixScorer(lang, prefix, top_n)
+
+
+def _score_chunk(task):
+    words, threshold = task
+    return _worker_scorer.score_words(words, threshold)
+
+
+def _iter_chunks(words, chunk_size):
+    words = iter(words)
+    while True:
+        chunk = list(islice(words, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _merge(best, results, top_n):
+    """Merge chunk results into the global best candidates, keyed by key."""
+    for total, key, word in results:
+        if key in best and best[key][0] >= total:
+            continue
+        best[key] = (total, word)
+    if len(best) > top_n:
+        for key, _ in sorted(best.items(), key=lambda item: item[1][0])[:len(best) - top_n]:
+            del best[key]
+    return min(total for total, _ in best.values()) if len(best) == top_n else float('-inf')
+
+
+def dictionary_attack(ciphertext, words, lang='english', top_n=10, prefix_length=DEFAULT_PREFIX_LENGTH,
+                      workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Find the Vigenère keyword of a ciphertext among candidate keywords.
+
+    Args:
+        ciphertext (str): The encrypted text
+        words (iterable): Candidate keywords, e.g. read_wordlist(path); consumed lazily
+        lang (str): Language of the plaintext ('english' or 'hebrew')
+        top_n (int): Number of candidates to return
+        prefix_length (int): Alphabet characters of the ciphertext each candidate is scored on
+        workers (int): Worker processes (default: CPU count; 1 scores in this process)
+        chunk_size (int): Candidates per task sent to a worker
+
+    Returns:
+        list: Dicts with 'key' (the candidate as given), 'prefix_score'
+        (log-likelihood per character of the decrypted prefix), 'score'
+        (log-likelihood per character of the whole decryption) and
+        'plaintext', best 'score' first. Candidates that decrypt to the
+        same text appear once. Empty if the language has no n-gram
+        model or the ciphertext has no alphabet characters.
+    """
+    if top_n < 1:
+        raise ValueError("top_n must be at least 1")
+    if get_alphabet(lang) is None:
+        return []
+    model = get_ngram_model(lang) or get_ngram_model(lang, 1)
+    if model is None:
+        return []
+    cipher_indices = encode_text(lang, ciphertext)
+    if len(cipher_indices) == 0:
+        return []
+    prefix = [int(index) for index in cipher_indices[:prefix_length]]
+
+    best = {}
+    threshold = float('-inf')
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        scorer = _PrefixScorer(lang, prefix, top_n)
+        for chunk in _iter_chunks(words, chunk_size):
+            threshold = _merge(best, scorer.score_words(chunk, threshold), top_n)
+    else:
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(lang, prefix, top_n)) as executor:
+            for chunk in _iter_chunks(words, chunk_size):
+                pending.append(executor.submit(_score_chunk, (chunk, threshold)))
+                if len(pending) >= workers * 2:
+                    threshold = _merge(best, pending.popleft().result(), top_n)
+            while pending:
+                threshold = _merge(best, pending.popleft().result(), top_n)
+
+    results = []
+    for total, word in best.values():
+        plaintext = vigenere_decrypt(lang, ciphertext, word)
+        results.append({
+            'key': word,
+            'prefix_score': total / len(prefix),
+            'score': model.score(encode_text(lang, plaintext)),
+            'plaintext': plaintext,
+        })
+    return sorted(results, key=lambda x: -x['score'])
@@ -0,0 +1,250 @@
+"""
+Opt-in instrumentation of the public cipher and analysis functions.
+
+enable() replaces the public functions of vigenere_cipher, caesar_encrypt
+and cyber_tools with timing wrappers, and disable() puts the original
+functions back, so there is no cost at all while instrumentation is off.
+Because the functions are swapped on the modules, calls made through the
+module (vigenere_cipher.vigenere_encrypt(...)) and calls between the
+functions of these modules are recorded; names imported with
+"from module import name" before enable() keep pointing at the originals.
+
+For each function the wrappers record the number of calls, the input size
+(characters of the text argument), the total and slowest wall time, and
+derived characters per second. The hit/miss counters of the alphabet and
+key-schedule caches are included in every export. For finding out where
+the time goes inside one call, profile() and trace_memory() run a single
+call under cProfile or tracemalloc.
+"""
+
+import cProfile
+import functools
+import importlib
+import inspect
+import io
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+INSTRUMENTED_MODULES = ('vigenere_cipher', 'caesar_encrypt', 'cyber_tools')
+
+# Cache management helpers that are not worth timing
+EXCLUDED_FUNCTIONS = frozenset({'main', 'clear_key_cache', 'key_cache_info', 'set_key_cache_size'})
+
+# Parameters whose length is recorded as the input size
+SIZE_PARAMETERS = ('text', 'ciphertext', 'texts', 'data')
+
+_originals = {}
+_stats = {}
+
+
+def _input_size(value):
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return sum(len(item) for item in value if isinstance(item, (str, bytes, bytearray)))
+    return 0
+
+
+def _size_getter(func):
+    try:
+        parameters = list(inspect.signature(func).parameters)
+    except (TypeError, ValueError):
+        return None
+    for name in SIZE_PARAMETERS:
+        if name in parameters:
+            index = parameters.index(name)
+
+            def get_size(args, kwargs, index=index, name=name):
+                if index < len(args):
+                    return _input_size(args[index])
+                return _input_size(kwargs.get(name))
+            return get_size
+    return None
+
+
+def _wrap(qualified_name, func):
+    stats = _stats.setdefault(qualified_name, {'calls': 0, 'chars': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+    get_size = _size_getter(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats['calls'] += 1
+            stats['seconds'] += elapsed
+            if elapsed > stats['max_seconds']:
+                stats['max_seconds'] = elapsed
+            if get_size is not None:
+                stats['chars'] += get_size(args, kwargs)
+    return wrapper
+
+
+def _public_functions(module):
+    for name, value in vars(module).items():
+        if (name.startswith('_') or name in EXCLUDED_FUNCTIONS or not inspect.isfunction(value)
+                or value.__module__ != module.__name__ or inspect.isgeneratorfunction(value)):
+            continue
+        yield name, value
+
+
+def is_enabled():
+    """
+    Check whether instrumentation is currently enabled.
+    """
+    return bool(_originals)
+
+
+def enable(modules=INSTRUMENTED_MODULES):
+    """
+    Start recording calls to the public functions of the given modules.
+
+    Args:
+        modules (tuple): Module names to instrument
+    """
+    for module_name in modules:
+        module = importlib.import_module(module_name)
+        for name, func in list(_public_functions(module)):
+            key = (module_name, name)
+            if key in _originals:
+                continue  # Already instrumented
+            _originals[key] = func
+            setattr(module, name, _wrap(f"{module_name}.{name}", func))
+
+
+def disable():
+    """
+    Stop recording and restore the original functions. Recorded statistics are kept.
+    """
+    for (module_name, name), func in _originals.items():
+        setattr(importlib.import_module(module_name), name, func)
+    _originals.clear()
+
+
+def reset():
+    """
+    Clear the recorded statistics.
+    """
+    for stats in _stats.values():
+        stats.update(calls=0, chars=0, seconds=0.0, max_seconds=0.0)
+
+
+@contextmanager
+def instrumented(modules=INSTRUMENTED_MODULES):
+    """
+    Context manager that enables instrumentation for the duration of a block.
+    """
+    was_enabled = is_enabled()
+    enable(modules)
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def _cache_stats():
+    from alphabets import alphabet_cache_info
+    from vigenere_cipher import key_cache_info
+    return {'alphabet': alphabet_cache_info(), 'key_schedule': key_cache_info()}
+
+
+def get_stats():
+    """
+    Get the recorded statistics.
+
+    Returns:
+        dict: {'functions': {name: {'calls', 'chars', 'seconds', 'max_seconds',
+        'chars_per_second'}}, 'caches': {cache: {'hits', 'misses', 'size', 'maxsize'}}}
+        for every function that has been called
+    """
+    functions = {}
+    for name, stats in sorted(_stats.items()):
+        if stats['calls']:
+            speed = stats['chars'] / stats['seconds'] if stats['seconds'] > 0 else 0.0
+            functions[name] = {**stats, 'chars_per_second': speed}
+    return {'functions': functions, 'caches': _cache_stats()}
+
+
+def to_prometheus(prefix='vigenere'):
+    """
+    Export the recorded statistics in the Prometheus text exposition format.
+
+    Args:
+        prefix (str): Prefix of every metric name
+
+    Returns:
+        str: Metrics text
+    """
+    stats = get_stats()
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for labels, value in samples:
+            label_text = ','.join(f'{label}="{label_value}"' for label, label_value in labels.items())
+            lines.append(f"{prefix}_{name}{{{label_text}}} {value}")
+
+    functions = stats['functions'].items()
+    metric('calls_total', 'counter', "Number of calls.",
+           [({'function': name}, values['calls']) for name, values in functions])
+    metric('input_chars_total', 'counter', "Characters of input processed.",
+           [({'function': name}, values['chars']) for name, values in functions])
+    metric('seconds_total', 'counter', "Wall time spent in the function.",
+           [({'function': name}, repr(values['seconds'])) for name, values in functions])
+    metric('max_seconds', 'gauge', "Slowest single call.",
+           [({'function': name}, repr(values['max_seconds'])) for name, values in functions])
+    metric('cache_hits_total', 'counter', "Cache hits.",
+           [({'cache': name}, values['hits']) for name, values in stats['caches'].items()])
+    metric('cache_misses_total', 'counter', "Cache misses.",
+           [({'cache': name}, values['misses']) for name, values in stats['caches'].items()])
+    metric('cache_entries', 'gauge', "Entries currently cached.",
+           [({'cache': name}, values['size']) for name, values in stats['caches'].items()])
+    return '\n'.join(lines) + '\n'
+
+
+def profile(func, *args, sort='cumulative', limit=25, **kwargs):
+    """
+    Run one call under cProfile.
+
+    Args:
+        func (callable): Function to call with *args and **kwargs
+        sort (str): pstats sort key
+        limit (int): Number of rows in the report
+
+    Returns:
+        tuple: (return value of the call, profile report text)
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args, **kwargs)
+    report = io.StringIO()
+    pstats.Stats(profiler, stream=report).sort_stats(sort).print_stats(limit)
+    return result, report.getvalue()
+
+
+def trace_memory(func, *args, **kwargs):
+    """
+    Run one call under tracemalloc.
+
+    Returns:
+        tuple: (return value of the call, {'current': bytes still allocated
+        after the call, 'peak': peak bytes allocated during the call})
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start, _ = tracemalloc.get_traced_memory()
+    try:
+        result = func(*args, **kwargs)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    return result, {'current': current - start, 'peak': peak - start}
@@ -0,0 +1,357 @@
+"""
+Key recovery for short Vigenère ciphertexts by hill climbing on n-gram fitness.
+
+Frequency analysis of the key columns (break_vigenere) needs a few hundred
+characters per column. On short ciphertexts this module instead searches
+the key space directly: each key is scored by the n-gram log-likelihood of
+its decryption (see language_model.get_ngram_model), and improved one key
+column at a time by trying every letter for that column. Changing the
+letter of one column only changes the plaintext characters of that column,
+so only the n-gram terms that contain one of them are recomputed; the text
+is never decrypted again as a whole.
+
+The search starts from the best single-letter shift of every column. When
+no single column can be improved any more, one to three columns are
+perturbed and the key is climbed again (iterated local search); a worse
+key is accepted with the simulated-annealing probability exp(delta / T),
+with T falling to zero over the time slice. Slices for every candidate
+key length run until the time budget is spent, optionally in parallel
+worker processes.
+"""
+
+import math
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from alphabets import get_alphabet
+import array_backend
+from language_model import encode_text, get_ngram_model
+from vigenere_cipher import vigenere_decrypt
+
+
+DEFAULT_TIME_BUDGET = 5.0
+
+# Longest single search for one key length; the budget is spent in slices
+# of at most this length so best-so-far results are reported regularly
+SLICE_SECONDS = 0.25
+
+# Starting temperature (in nats of log-likelihood) of the annealing acceptance
+DEFAULT_TEMPERATURE = 2.0
+
+# A key column needs at least this many characters to be searched
+MIN_COLUMN_SIZE = 4
+
+# Perturbed columns are set to one of their best single-letter shifts with this probability
+RANKED_PERTURBATION = 0.7
+RANKED_CHOICES = 6
+
+
+class _KeySearch:
+    """
+    Hill-climbing search for the key of one key length.
+
+    Args:
+        model (NGramModel): Language model used as the fitness function
+        indices (list): Alphabet indices of the ciphertext
+        length (int): Key length
+    """
+
+    def __init__(self, model, indices, length):
+        self.size = model.size
+        self.order = model.order
+        self.length = length
+        self.cipher = [int(index) for index in indices]
+        count = len(self.cipher)
+        self.columns = [list(range(j, count, length)) for j in range(length)]
+        # Term t scores character t given the characters before it, so a
+        # change in column j affects the terms of its characters and the next order - 1
+        self.affected = [sorted({i + d for i in column for d in range(self.order) if i + d < count})
+                         for column in self.columns]
+        unigram = model.log_probabilities[0]
+        self.ranks = [sorted(range(self.size), key=lambda shift, column=column: -sum(
+            unigram[(self.cipher[i] - shift) % self.size] for i in column)) for column in self.columns]
+
+        self.use_numpy = array_backend.is_available()
+        if self.use_numpy:
+            np = array_backend.np
+            self.np = np
+            self.tables = [np.asarray(table) for table in model.log_probabilities]
+            self.cipher_array = np.asarray(self.cipher, dtype=np.int64)
+            self.shifts = np.arange(self.size)[:, None, None]
+            self.windows = []
+            for j, affected in enumerate(self.affected):
+                tail = np.asarray([t for t in affected if t >= self.order - 1], dtype=np.int64)
+                positions = tail[:, None] - (self.order - 1) + np.arange(self.order)
+                self.windows.append((positions, positions % length == j, self.cipher_array[positions]))
+        else:
+            self.tables = [list(table) for table in model.log_probabilities]
+
+    def _term(self, plain, t):
+        """Log-probability of plaintext character t given the characters before it."""
+        start = max(0, t - self.order + 1)
+        code = 0
+        for index in plain[start:t + 1]:
+            code = code * self.size + index
+        return self.tables[t - start][code]
+
+    def decrypt(self, key):
+        size = self.size
+        length = self.length
+        plain = [(symbol - key[i % length]) % size for i, symbol in enumerate(self.cipher)]
+        return self.np.asarray(plain, dtype=self.np.int64) if self.use_numpy else plain
+
+    def fitness(self, plain):
+        """Log-likelihood of a decryption (see NGramModel.log_likelihood)."""
+        head = min(self.order - 1, len(plain))
+        total = sum(self._term(plain, t) for t in range(head))
+        if self.use_numpy and len(plain) >= self.order:
+            count = len(plain) - self.order + 1
+            codes = self.np.zeros(count, dtype=self.np.int64)
+            for k in range(self.order):
+                codes = codes * self.size + plain[k:k + count]
+            return float(total + self.tables[-1][codes].sum())
+        return total + sum(self._term(plain, t) for t in range(head, len(plain)))
+
+    def column_scores(self, plain, j):
+        """
+        Score every letter for key column j, keeping the other columns as they are.
+
+        Only the n-gram terms that contain a character of column j are
+        computed; the other terms are the same for every letter.
+
+        Returns:
+            list: For each letter, the sum of those terms when column j is decrypted with it
+        """
+        size = self.size
+        column = self.columns[j]
+        head = [t for t in self.affected[j] if t < self.order - 1]
+        saved = [plain[i] for i in column]
+        head_scores = []
+        for shift in range(size):
+            for i in column[:self.order]:
+                plain[i] = (self.cipher[i] - shift) % size
+            head_scores.append(sum(self._term(plain, t) for t in head))
+        for i, value in zip(column, saved):
+            plain[i] = value
+
+        if self.use_numpy:
+            positions, in_column, cipher = self.windows[j]
+            values = self.np.where(in_column, (cipher - self.shifts) % size, plain[positions])
+            codes = values[:, :, 0]
+            for k in range(1, self.order):
+                codes = codes * size + values[:, :, k]
+            return (self.tables[-1][codes].sum(axis=1) + head_scores).tolist()
+
+        scores = []
+        tail = [t for t in self.affected[j] if t >= self.order - 1]
+        for shift in range(size):
+            for i in column:
+                plain[i] = (self.cipher[i] - shift) % size
+            scores.append(head_scores[shift] + sum(self._term(plain, t) for t in tail))
+        for i, value in zip(column, saved):
+            plain[i] = value
+        return scores
+
+    def set_column(self, plain, j, shift):
+        if self.use_numpy:
+            column = self.columns[j]
+            plain[column] = (self.cipher_array[column] - shift) % self.size
+        else:
+            for i in self.columns[j]:
+                plain[i] = (self.cipher[i] - shift) % self.size
+
+    def climb(self, key):
+        """
+        Improve a key one column at a time until no column can be improved.
+
+        Returns:
+            tuple: (fitness, key) of the local optimum
+        """
+        key = list(key)
+        plain = self.decrypt(key)
+        improved = True
+        while improved:
+            improved = False
+            for j in range(self.length):
+                scores = self.column_scores(plain, j)
+                best = max(range(self.size), key=scores.__getitem__)
+                if scores[best] > scores[key[j]]:
+                    key[j] = best
+                    self.set_column(plain, j, best)
+                    improved = True
+        return self.fitness(plain), key
+
+    def search(self, rng, seconds, start=None, temperature=DEFAULT_TEMPERATURE):
+        """
+        Iterated local search with simulated-annealing acceptance for a number of seconds.
+
+        Args:
+            rng (random.Random): Source of randomness
+            seconds (float): Time to search; at least one climb is always done
+            start (list): Key to start from (default: best single-letter shift of every column)
+            temperature (float): Starting temperature of the acceptance rule
+
+        Returns:
+            tuple: (fitness, key, climbs) of the best key found
+        """
+        started = time.perf_counter()
+        current_fitness, current = self.climb(start or [ranks[0] for ranks in self.ranks])
+        best_fitness, best = current_fitness, current
+        climbs = 1
+        if self.length == 1 or self.order == 1:
+            return best_fitness, best, climbs  # Independent columns: the climb is already optimal
+
+        while True:
+            remaining = seconds - (time.perf_counter() - started)
+            if remaining <= 0:
+                break
+            key = list(current)
+            for j in rng.sample(range(self.length), min(self.length, rng.randint(1, 3))):
+                if rng.random() < RANKED_PERTURBATION:
+                    key[j] = rng.choice(self.ranks[j][:RANKED_CHOICES])
+                else:
+                    key[j] = rng.randrange(self.size)
+            fitness, key = self.climb(key)
+            climbs += 1
+            temp = temperature * remaining / seconds
+            if fitness >= current_fitness or rng.random() < math.exp((fitness - current_fitness) / temp):
+                current_fitness, current = fitness, key
+            if fitness > best_fitness:
+                best_fitness, best = fitness, key
+        return best_fitness, best, climbs
+
+
+def _search_state(lang, indices):
+    return get_ngram_model(lang) or get_ngram_model(lang, 1), indices, {}
+
+
+_worker_state = None
+
+
+def _init_worker(lang, indices):
+    global _worker_state
+    _worker_state = _search_state(lang, indices)
+
+
+def _search_slice_in_worker(task):
+    return _search_slice(_worker_state, task)
+
+
+def _search_slice(state, task):
+    """Search one key length for one time slice."""
+    length, seed, seconds, start, temperature = task
+    model, indices, searches = state
+    if length not in searches:
+        searches[length] = _KeySearch(model, indices, length)
+    fitness, key, climbs = searches[length].search(random.Random(seed), seconds, start, temperature)
+    return length, fitness, key, climbs
+
+
+def solve_vigenere(ciphertext, lang='english', key_lengths=None, max_length=20, time_budget=DEFAULT_TIME_BUDGET,
+                   workers=1, seed=None, temperature=DEFAULT_TEMPERATURE, callback=None):
+    """
+    Recover the keyword of a short Vigenère ciphertext by searching the key space.
+
+    The time budget is spent in slices of up to SLICE_SECONDS, cycling
+    through the key lengths (most likely first, see rank_key_lengths).
+    Each slice continues from the best key found so far for its length.
+
+    Args:
+        ciphertext (str): The encrypted text
+        lang (str): Language ('english' or 'hebrew')
+        key_lengths (list): Key lengths to try (default: 1 to max_length,
+            limited so every key column has MIN_COLUMN_SIZE characters)
+        max_length (int): Longest key length to try when key_lengths is not given
+        time_budget (float): Seconds to search
+        workers (int): Worker processes searching in parallel (1 searches in this process)
+        seed (int): Seed of the random perturbations, for reproducible results
+        temperature (float): Starting temperature of the annealing acceptance
+        callback (callable): Called with a dict ('key', 'length', 'score',
+            'elapsed', 'climbs') every time a better key is found
+
+    Returns:
+        list: Dicts with 'key', 'length', 'score' (log-likelihood per
+        character, higher is better) and 'plaintext', best first; keys that
+        repeat themselves are reduced to their period. Empty if the
+        language is not supported or the text has no alphabet characters.
+    """
+    from cyber_tools import _shortest_period, rank_key_lengths
+
+    alphabet = get_alphabet(lang)
+    if alphabet is None:
+        return []
+    indices = encode_text(lang, ciphertext)
+    count = len(indices)
+    if count == 0:
+        return []
+    indices = [int(index) for index in indices]
+
+    if key_lengths is None:
+        limit = max(1, min(max_length, count // MIN_COLUMN_SIZE))
+        ranked = [candidate['length'] for candidate in rank_key_lengths(ciphertext, lang, limit)]
+        key_lengths = ranked + [length for length in range(1, limit + 1) if length not in ranked]
+    key_lengths = [length for length in key_lengths if 1 <= length <= count]
+    if not key_lengths:
+        return []
+
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    deadline = started + time_budget
+    slice_seconds = min(SLICE_SECONDS, time_budget / len(key_lengths))
+    best = {}  # length -> (fitness, key)
+    climbs = 0
+    overall = None
+    next_length = 0
+
+    def next_task():
+        nonlocal next_length
+        length = key_lengths[next_length % len(key_lengths)]
+        next_length += 1
+        start = best[length][1] if length in best else None
+        seconds = max(0.0, min(slice_seconds, deadline - time.perf_counter()))
+        return length, rng.getrandbits(32), seconds, start, temperature
+
+    def record(result):
+        nonlocal climbs, overall
+        length, fitness, key, slice_climbs = result
+        climbs += slice_climbs
+        if length not in best or fitness > best[length][0]:
+            best[length] = (fitness, key)
+        score = fitness / count
+        if overall is None or score > overall['score'] + 1e-12:
+            keyword = ''.join(alphabet[shift] for shift in _shortest_period(key))
+            overall = {'key': keyword, 'length': len(keyword), 'score': score,
+                       'elapsed': time.perf_counter() - started, 'climbs': climbs}
+            if callback is not None:
+                callback(dict(overall))
+
+    if workers == 1:
+        state = _search_state(lang, indices)
+        # Every key length gets at least one slice, even past the deadline
+        while next_length < len(key_lengths) or time.perf_counter() < deadline:
+            record(_search_slice(state, next_task()))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(lang, indices)) as executor:
+            pending = set()
+            while True:
+                while len(pending) < workers and (next_length < len(key_lengths)
+                                                  or time.perf_counter() < deadline):
+                    pending.add(executor.submit(_search_slice_in_worker, next_task()))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record(future.result())
+
+    results = {}
+    for length, (fitness, key) in best.items():
+        keyword = ''.join(alphabet[shift] for shift in _shortest_period(key))
+        score = fitness / count
+        if keyword not in results or score > results[keyword]['score']:
+            results[keyword] = {'key': keyword, 'length': len(keyword), 'score': score}
+    ranked = sorted(results.values(), key=lambda x: -x['score'])
+    for result in ranked:
+        result['plaintext'] = vigenere_decrypt(lang, ciphertext, result['key'])
+    return ranked
@@ -0,0 +1,404 @@
+"""
+Reference letter-frequency profiles and n-gram models used to score candidate decryptions.
+
+Profiles and unigram to trigram counts are counted from a corpus for each
+language (e.g. assets/bible_en.txt) and cached on disk, keyed on a SHA-256
+hash of the corpus, so the corpus is only recounted when it changes.
+"""
+
+import array
+import hashlib
+import json
+import math
+import mmap
+import os
+import sys
+from functools import lru_cache
+
+from alphabets import get_alphabet
+import array_backend
+
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'assets')
+
+# Corpus used to build the reference profile of each language
+CORPORA = {
+    'english': os.path.join(ASSETS_DIR, 'bible_en.txt'),
+    'hebrew': os.path.join(ASSETS_DIR, 'bible_he.txt'),
+}
+
+# Letter counts of the Hebrew Bible, used when the Hebrew corpus is not available
+BUILTIN_COUNTS = {
+    'hebrew': {
+        'א': 96065, 'ב': 65534, 'ג': 10137, 'ד': 32552, 'ה': 102515, 'ו': 130538, 'ז': 9138,
+        'ח': 27748, 'ט': 6353, 'י': 139128, 'כ': 34881, 'ל': 88805, 'מ': 57912, 'ם': 41603,
+        'נ': 40110, 'ן': 15301, 'ס': 9673, 'ע': 45043, 'פ': 17761, 'ף': 2564, 'צ': 11776,
+        'ץ': 3290, 'ק': 18405, 'ר': 69157, 'ש': 58224, 'ת': 63744, ' ': 227339,
+    },
+}
+
+
+def get_cache_dir():
+    """
+    Get the directory where language profiles are cached.
+
+    Set the VIGENERE_CACHE_DIR environment variable to override the default
+    (~/.cache/vigenere_cipher).
+    """
+    return os.environ.get('VIGENERE_CACHE_DIR') or os.path.join(
+        os.path.expanduser('~'), '.cache', 'vigenere_cipher')
+
+
+def corpus_hash(path):
+    """
+    Compute the SHA-256 hex digest of a corpus file.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_cache(path, expected_hash):
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if data.get('corpus_hash') != expected_hash:
+        return None  # The corpus changed since the cache was written
+    return data
+
+
+def _write_cache(path, data):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Caching is best effort; the counts are still returned
+
+
+def get_letter_counts(lang):
+    """
+    Get the letter counts of the reference corpus for a language.
+
+    The counts are read from the on-disk cache when the corpus hash matches,
+    otherwise they are counted with frequency_analysis and cached.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+
+    Returns:
+        dict: Character -> count, in alphabet order, or None if no corpus is available
+    """
+    lang = lang.lower()
+    alphabet = get_alphabet(lang)
+    if alphabet is None:
+        return None
+
+    path = CORPORA.get(lang)
+    if path is None or not os.path.exists(path):
+        return dict(BUILTIN_COUNTS[lang]) if lang in BUILTIN_COUNTS else None
+
+    digest = corpus_hash(path)
+    cache_path = os.path.join(get_cache_dir(), f"{lang}_unigram.json")
+    cached = _read_cache(cache_path, digest)
+    if cached is not None and cached.get('alphabet') == list(alphabet):
+        return dict(zip(alphabet, cached['counts']))
+
+    from cyber_tools import frequency_analysis
+
+    with open(path, 'r', encoding='utf-8') as file:
+        counts = frequency_analysis(lang, file.read())
+    _write_cache(cache_path, {
+        'corpus_hash': digest,
+        'alphabet': list(alphabet),
+        'counts': [counts[char] for char in alphabet],
+    })
+    return counts
+
+
+@lru_cache(maxsize=None)
+def get_profile(lang):
+    """
+    Get the reference letter probabilities for a language.
+
+    Counts are add-one smoothed so that no symbol has probability zero.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+
+    Returns:
+        tuple: Probability of each alphabet symbol, in alphabet order, or None
+    """
+    counts = get_letter_counts(lang)
+    if counts is None:
+        return None
+    alphabet = get_alphabet(lang)
+    total = sum(counts.values()) + len(alphabet)
+    return tuple((counts.get(char, 0) + 1) / total for char in alphabet)
+
+
+# Longest n-grams counted from a corpus; every shorter order is counted too
+NGRAM_ORDER = 3
+
+# Counts are stored as native int64 (array typecode 'q', NumPy '=i8')
+NGRAM_TYPECODE = 'q'
+
+
+def encode_text(lang, text):
+    """
+    Integer-encode the alphabet characters of a text.
+
+    Characters are lowercased and those outside the alphabet are dropped,
+    the same characters that advance a Vigenère key.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        text (str): Text to encode
+
+    Returns:
+        NumPy array (or list without NumPy) of alphabet indices, or None if
+        the language is not supported
+    """
+    alphabet = get_alphabet(lang)
+    if alphabet is None:
+        return None
+    if array_backend.is_available():
+        indices = array_backend.text_to_indices(alphabet, text.lower())
+        return indices[indices >= 0].astype(array_backend.np.int64)
+    positions = {char: index for index, char in enumerate(alphabet)}
+    return [positions[char] for char in text.lower() if char in positions]
+
+
+def count_ngrams(indices, size, order):
+    """
+    Count the n-grams of an integer-encoded text.
+
+    Args:
+        indices: Alphabet indices (see encode_text)
+        size (int): Alphabet size
+        order (int): n-gram length
+
+    Returns:
+        Flat counts (NumPy array, or list without NumPy) of length
+        size ** order, where the n-gram (a, b, c) is at (a * size + b) * size + c
+    """
+    count = max(len(indices) - order + 1, 0)
+    if array_backend.is_available():
+        np = array_backend.np
+        indices = np.asarray(indices, dtype=np.int64)
+        codes = np.zeros(count, dtype=np.int64)
+        for k in range(order):
+            codes = codes * size + indices[k:k + count]
+        return np.bincount(codes, minlength=size ** order)
+
+    counts = [0] * size ** order
+    modulus = size ** (order - 1)
+    code = 0
+    for i, index in enumerate(indices):
+        code = code % modulus * size + index
+        if i >= order - 1:
+            counts[code] += 1
+    return counts
+
+
+class NGramModel:
+    """
+    Character n-gram model of a language, used to score candidate plaintexts.
+
+    Each character is scored by its add-one smoothed probability given the
+    previous order - 1 characters (fewer at the start of the text), so the
+    score of a text is its log-likelihood under the corpus statistics.
+    """
+
+    def __init__(self, alphabet, counts):
+        """
+        Args:
+            alphabet (list): Alphabet symbols
+            counts (list): counts[k] holds the flat (k + 1)-gram counts (see count_ngrams)
+        """
+        self.alphabet = list(alphabet)
+        self.size = len(alphabet)
+        self.order = len(counts)
+        self.counts = counts
+        self.log_probabilities = [self._conditional_log_probabilities(table) for table in counts]
+
+    def _conditional_log_probabilities(self, counts):
+        size = self.size
+        if array_backend.is_available():
+            np = array_backend.np
+            table = np.asarray(counts, dtype=np.float64).reshape(-1, size) + 1
+            return np.log(table / table.sum(axis=1, keepdims=True)).ravel()
+        result = []
+        for start in range(0, len(counts), size):
+            block = counts[start:start + size]
+            total = sum(block) + size
+            result.extend(math.log((count + 1) / total) for count in block)
+        return result
+
+    def log_likelihood(self, indices):
+        """
+        Compute the natural-log likelihood of an integer-encoded text.
+
+        Args:
+            indices: Alphabet indices (see encode_text)
+
+        Returns:
+            float: Sum of the log-probabilities of every character
+        """
+        order = self.order
+        size = self.size
+        head = min(order - 1, len(indices))
+        total = 0.0
+        code = 0
+        for i in range(head):
+            code = code * size + int(indices[i])
+            total += self.log_probabilities[i][code]
+        if len(indices) < order:
+            return float(total)
+
+        table = self.log_probabilities[-1]
+        if array_backend.is_available():
+            np = array_backend.np
+            indices = np.asarray(indices, dtype=np.int64)
+            count = len(indices) - order + 1
+            codes = np.zeros(count, dtype=np.int64)
+            for k in range(order):
+                codes = codes * size + indices[k:k + count]
+            return float(total + np.asarray(table)[codes].sum())
+
+        modulus = size ** (order - 1)
+        for index in indices[head:]:
+            code = code % modulus * size + index
+            total += table[code]
+        return total
+
+    def score(self, indices):
+        """
+        Compute the log-likelihood per character of an integer-encoded text.
+
+        Higher is more language-like; the score does not depend on the text length.
+
+        Returns:
+            float: Average log-probability per character, or -inf for an empty text
+        """
+        if len(indices) == 0:
+            return float('-inf')
+        return self.log_likelihood(indices) / len(indices)
+
+    def score_text(self, text):
+        """
+        Compute the log-likelihood per character of the alphabet characters of a text.
+        """
+        positions = {char: index for index, char in enumerate(self.alphabet)}
+        return self.score([positions[char] for char in text.lower() if char in positions])
+
+
+def _map_array(path, length):
+    """
+    Memory-map a file of native int64 values.
+
+    Returns:
+        NumPy memmap (or memoryview without NumPy), or None if the file is
+        missing or does not hold length values
+    """
+    try:
+        if os.path.getsize(path) != length * array.array(NGRAM_TYPECODE).itemsize:
+            return None
+        if array_backend.is_available():
+            return array_backend.np.memmap(path, dtype='=i8', mode='r')
+        with open(path, 'rb') as file:
+            return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)).cast(NGRAM_TYPECODE)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_array(path, values):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as file:
+        if array_backend.is_available():
+            array_backend.np.asarray(values, dtype='=i8').tofile(file)
+        else:
+            array.array(NGRAM_TYPECODE, values).tofile(file)
+    os.replace(tmp_path, path)
+
+
+def _read_ngram_cache(lang, digest, alphabet):
+    cache_dir = get_cache_dir()
+    meta = _read_cache(os.path.join(cache_dir, f"{lang}_ngrams.json"), digest)
+    if (meta is None or meta.get('alphabet') != list(alphabet) or meta.get('order') != NGRAM_ORDER
+            or meta.get('typecode') != NGRAM_TYPECODE or meta.get('byteorder') != sys.byteorder):
+        return None
+    counts = []
+    for order in range(1, NGRAM_ORDER + 1):
+        table = _map_array(os.path.join(cache_dir, f"{lang}_{order}gram.bin"), len(alphabet) ** order)
+        if table is None:
+            return None
+        counts.append(table)
+    return counts
+
+
+def _write_ngram_cache(lang, digest, alphabet, counts):
+    cache_dir = get_cache_dir()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for order, table in enumerate(counts, start=1):
+            _write_array(os.path.join(cache_dir, f"{lang}_{order}gram.bin"), table)
+    except OSError:
+        return  # Caching is best effort; the counts are still used
+    # The metadata is written last, so interrupted writes are never mistaken for a valid cache
+    _write_cache(os.path.join(cache_dir, f"{lang}_ngrams.json"), {
+        'corpus_hash': digest,
+        'alphabet': list(alphabet),
+        'order': NGRAM_ORDER,
+        'typecode': NGRAM_TYPECODE,
+        'byteorder': sys.byteorder,
+    })
+
+
+@lru_cache(maxsize=None)
+def get_ngram_model(lang, order=NGRAM_ORDER):
+    """
+    Get the n-gram model of a language, built from its reference corpus.
+
+    The unigram to trigram counts are stored as binary arrays in the cache
+    directory and memory-mapped on load. They are recounted only when the
+    corpus hash or the alphabet changes. Without a corpus, only the unigram
+    model of the built-in counts is available.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        order (int): n-gram length, 1 to NGRAM_ORDER
+
+    Returns:
+        NGramModel: The model, or None if no statistics are available
+
+    Raises:
+        ValueError: If order is out of range
+    """
+    if not 1 <= order <= NGRAM_ORDER:
+        raise ValueError(f"order must be between 1 and {NGRAM_ORDER}")
+    lang = lang.lower()
+    alphabet = get_alphabet(lang)
+    if alphabet is None:
+        return None
+
+    path = CORPORA.get(lang)
+    if path is None or not os.path.exists(path):
+        if order == 1 and lang in BUILTIN_COUNTS:
+            return NGramModel(alphabet, [[BUILTIN_COUNTS[lang].get(char, 0) for char in alphabet]])
+        return None
+
+    digest = corpus_hash(path)
+    counts = _read_ngram_cache(lang, digest, alphabet)
+    if counts is None:
+        with open(path, 'r', encoding='utf-8') as file:
+            indices = encode_text(lang, file.read())
+        counts = [count_ngrams(indices, len(alphabet), n) for n in range(1, NGRAM_ORDER + 1)]
+        _write_ngram_cache(lang, digest, alphabet, counts)
+    return NGramModel(alphabet, counts[:order])
@@ -0,0 +1,244 @@
+"""
+Memory-mapped encryption and decryption of files on disk.
+
+The input file is memory-mapped and processed in windows of a few
+megabytes. Every window ends on a UTF-8 character boundary, so multibyte
+text (e.g. Hebrew) is decoded correctly, and the Vigenère key position is
+carried from one window to the next. Results are written into a
+memory-mapped output file that is preallocated to the input size. When
+the output gets longer than that (a Hebrew space encrypts to a two-byte
+letter), the rest is written to the file sequentially rather than growing
+the map, which needs mremap and is not available on every platform. Neither
+the input nor the output is ever held in memory as a whole.
+
+In-place mode writes the results back into the input map. It is only
+possible when every window keeps its byte length, which the file is
+checked for before anything is written. Writing to an output path that is
+the input file itself also uses in-place mode.
+"""
+
+import mmap
+import os
+
+from alphabets import get_alphabet
+from caesar_encrypt import _CaesarTable
+from vigenere_cipher import get_cipher
+
+
+DEFAULT_WINDOW_SIZE = 4 * 1024 * 1024
+
+
+def utf8_boundary(buffer, pos):
+    """
+    Move a byte offset back to the start of the UTF-8 character containing it.
+
+    Args:
+        buffer: Bytes-like object (e.g. an mmap)
+        pos (int): Byte offset
+
+    Returns:
+        int: Largest offset <= pos that does not fall inside a multibyte character
+    """
+    start = pos
+    # Continuation bytes look like 0b10xxxxxx; a character is at most 4 bytes long
+    while pos > 0 and start - pos < 3 and buffer[pos] & 0xC0 == 0x80:
+        pos -= 1
+    return pos
+
+
+def iter_windows(buffer, size, window_size=DEFAULT_WINDOW_SIZE):
+    """
+    Yield (start, end) byte ranges covering buffer, split at UTF-8 character boundaries.
+    """
+    start = 0
+    while start < size:
+        end = min(start + window_size, size)
+        if end < size:
+            boundary = utf8_boundary(buffer, end)
+            if boundary > start:
+                end = boundary
+            else:
+                # The window is smaller than one character: take the whole character
+                while end < size and buffer[end] & 0xC0 == 0x80:
+                    end += 1
+        yield start, end
+        start = end
+
+
+def _map_file(file, access):
+    return mmap.mmap(file.fileno(), 0, access=access)
+
+
+def _transform_into(in_map, size, out_path, transform, window_size):
+    with open(out_path, 'w+b') as out_file:
+        out_file.truncate(size)
+        out_map = _map_file(out_file, mmap.ACCESS_WRITE)
+        windows = iter_windows(in_map, size, window_size)
+        pos = 0
+        try:
+            for start, end in windows:
+                data = transform(in_map[start:end].decode('utf-8')).encode('utf-8')
+                if pos + len(data) > size:
+                    break
+                out_map[pos:pos + len(data)] = data
+                pos += len(data)
+            else:
+                data = None
+            out_map.flush()
+        finally:
+            out_map.close()
+        out_file.truncate(pos)
+        if data is not None:
+            # The output outgrew the preallocated map: write the rest sequentially
+            out_file.seek(pos)
+            out_file.write(data)
+            pos += len(data)
+            for start, end in windows:
+                data = transform(in_map[start:end].decode('utf-8')).encode('utf-8')
+                out_file.write(data)
+                pos += len(data)
+    return pos
+
+
+def _check_in_place(in_map, size, transform, window_size):
+    for start, end in iter_windows(in_map, size, window_size):
+        text = in_map[start:end].decode('utf-8')
+        if len(transform(text).encode('utf-8')) != end - start:
+            raise ValueError(f"Cannot transform in place: the text at byte {start}-{end} "
+                             "changes its UTF-8 length; write to an output file instead")
+
+
+def _transform_in_place(in_map, size, transform, window_size):
+    for start, end in iter_windows(in_map, size, window_size):
+        in_map[start:end] = transform(in_map[start:end].decode('utf-8')).encode('utf-8')
+    in_map.flush()
+    return size
+
+
+def transform_file(in_path, out_path, make_transform, window_size=DEFAULT_WINDOW_SIZE):
+    """
+    Transform a UTF-8 file window by window through memory maps.
+
+    Args:
+        in_path (str): Input file
+        out_path (str): Output file, or None (or the input file itself) to
+            transform the input file in place
+        make_transform (callable): Returns a new transform(text) -> text
+            function each time it is called; the function is applied to
+            consecutive windows and may keep state between them
+        window_size (int): Bytes per window
+
+    Returns:
+        int: Number of bytes written
+
+    Raises:
+        ValueError: In place, if the transformation would change the file size
+    """
+    if out_path is not None and os.path.exists(out_path) and os.path.samefile(in_path, out_path):
+        out_path = None  # Opening the output for writing would truncate the input
+    size = os.path.getsize(in_path)
+    if size == 0:
+        if out_path is not None:
+            open(out_path, 'wb').close()
+        return 0
+
+    with open(in_path, 'rb' if out_path is not None else 'r+b') as in_file:
+        in_map = _map_file(in_file, mmap.ACCESS_READ if out_path is not None else mmap.ACCESS_WRITE)
+        try:
+            if out_path is not None:
+                return _transform_into(in_map, size, out_path, make_transform(), window_size)
+            _check_in_place(in_map, size, make_transform(), window_size)
+            return _transform_in_place(in_map, size, make_transform(), window_size)
+        finally:
+            in_map.close()
+
+
+def _vigenere_transform(lang, keyword, decrypt):
+    cipher = get_cipher(lang, keyword)
+    transform_chunk = cipher.decrypt_chunk if decrypt else cipher.encrypt_chunk
+
+    def make_transform():
+        key_pos = 0
+
+        def transform(text):
+            nonlocal key_pos
+            result, key_pos = transform_chunk(text, key_pos)
+            return result
+        return transform
+    return make_transform
+
+
+def _caesar_transform(lang, shift):
+    alphabet = get_alphabet(lang)
+    table = _CaesarTable(alphabet, shift) if alphabet is not None else {}
+    return lambda: lambda text: text.translate(table)
+
+
+def vigenere_encrypt_file(lang, in_path, out_path, keyword, window_size=DEFAULT_WINDOW_SIZE):
+    """
+    Encrypt a UTF-8 file with the Vigenère cipher through memory maps.
+
+    The output is identical to vigenere_encrypt on the whole decoded file.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        in_path (str): Input file
+        out_path (str): Output file, or None to encrypt the input file in place
+        keyword (str): Keyword for encryption
+        window_size (int): Bytes per window
+
+    Returns:
+        int: Number of bytes written
+    """
+    return transform_file(in_path, out_path, _vigenere_transform(lang, keyword, False), window_size)
+
+
+def vigenere_decrypt_file(lang, in_path, out_path, keyword, window_size=DEFAULT_WINDOW_SIZE):
+    """
+    Decrypt a UTF-8 file with the Vigenère cipher through memory maps.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        in_path (str): Input file
+        out_path (str): Output file, or None to decrypt the input file in place
+        keyword (str): Keyword for decryption
+        window_size (int): Bytes per window
+
+    Returns:
+        int: Number of bytes written
+    """
+    return transform_file(in_path, out_path, _vigenere_transform(lang, keyword, True), window_size)
+
+
+def caesar_encrypt_file(lang, in_path, out_path, shift, window_size=DEFAULT_WINDOW_SIZE):
+    """
+    Encrypt a UTF-8 file with the Caesar cipher through memory maps.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        in_path (str): Input file
+        out_path (str): Output file, or None to encrypt the input file in place
+        shift (int): Number of positions to shift each character
+        window_size (int): Bytes per window
+
+    Returns:
+        int: Number of bytes written
+    """
+    return transform_file(in_path, out_path, _caesar_transform(lang, shift), window_size)
+
+
+def caesar_decrypt_file(lang, in_path, out_path, shift, window_size=DEFAULT_WINDOW_SIZE):
+    """
+    Decrypt a Caesar-encrypted UTF-8 file through memory maps.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        in_path (str): Input file
+        out_path (str): Output file, or None to decrypt the input file in place
+        shift (int): Shift that was used for encryption
+        window_size (int): Bytes per window
+
+    Returns:
+        int: Number of bytes written
+    """
+    return transform_file(in_path, out_path, _caesar_transform(lang, -shift), window_size)
@@ -1,39 +1,42 @@
+import argparse
+import sys
+from collections import OrderedDict
+from contextlib import ExitStack
+
 from alphabets import get_alphabet
-from caesar_encrypt import caesar_encrypt
-from cyber_tools import frequency_analysis, plot_frequency, print_crib_analysis
+import array_backend
 
 
-def vigenere_encrypt(lang, text, keyword):
+def vigenere_encrypt(lang, text, keyword, backend="python"):
     """
     Encrypt text using the Vigenère cipher with a keyword.
     
+    The cleaned keyword and its shift tables come from the key-schedule
+    cache (see get_cipher), so repeated calls with the same keyword only
+    pay for the pass over the text.
+    
     Args:
         lang (str): Language ('english' or 'hebrew')
         text (str): Text to encrypt
         keyword (str): Keyword for encryption
+        backend (str): 'python' (default) or 'numpy' for the vectorized path
     
     Returns:
         str: Encrypted text
     """
-    alphabet = get_alphabet(lang)
-    if alphabet is None:
-        return text  # Return original text if language not supported
-    
-    if not keyword:
-        return text  # Return original text if no keyword provided
-    
-    # Clean the keyword to only include valid alphabet characters
-    clean_keyword = ''.join([char.lower() for char in keyword if char.lower() in alphabet])
-    if not clean_keyword:
-        return text  # Return original text if keyword has no valid characters
-    
-    result = ""
-   
+    if backend not in ("python", "numpy"):
+        raise ValueError(f"Unknown backend: {backend!r}")
+
+    cipher = get_cipher(lang, keyword)
+    if not cipher.shifts:
+        return text  # Unsupported language or no valid keyword characters
     
-    return result
+    if backend == "numpy" and array_backend.supports_alphabet(cipher.alphabet):
+        return array_backend.shift_text(cipher.alphabet, text, cipher.shifts)
+    return cipher.encrypt(text)
 
 
-def vigenere_decrypt(lang, text, keyword):
+def vigenere_decrypt(lang, text, keyword, backend="python"):
     """
     Decrypt text using the Vigenère cipher with a keyword.
     
@@ -41,30 +44,313 @@ def vigenere_decrypt(lang, text, keyword):
         lang (str): Language ('english' or 'hebrew')
         text (str): Text to decrypt
         keyword (str): Keyword for decryption
+        backend (str): 'python' (default) or 'numpy' for the vectorized path
     
     Returns:
         str: Decrypted text
     """
-    alphabet = get_alphabet(lang)
-    if alphabet is None:
-        return text  # Return original text if language not supported
+    if backend not in ("python", "numpy"):
+        raise ValueError(f"Unknown backend: {backend!r}")
+
+    cipher = get_cipher(lang, keyword)
+    if not cipher.shifts:
+        return text  # Unsupported language or no valid keyword characters
+    
+    if backend == "numpy" and array_backend.supports_alphabet(cipher.alphabet):
+        return array_backend.shift_text(cipher.alphabet, text, [-shift for shift in cipher.shifts])
+    return cipher.decrypt(text)
+
+
+def _transform_many(lang, texts, keyword, backend, decrypt):
+    if backend not in ("python", "numpy"):
+        raise ValueError(f"Unknown backend: {backend!r}")
+
+    texts = list(texts)
+    cipher = get_cipher(lang, keyword)
+    if not cipher.shifts:
+        return texts  # Unsupported language or no valid keyword characters
+
+    if backend == "numpy" and array_backend.supports_alphabet(cipher.alphabet):
+        shifts = [-shift for shift in cipher.shifts] if decrypt else cipher.shifts
+        return array_backend.shift_texts(cipher.alphabet, texts, shifts)
+
+    transform = cipher._transform
+    tables = cipher.decrypt_tables if decrypt else cipher.encrypt_tables
+    return [transform(text, tables)[0] for text in texts]
+
+
+def vigenere_encrypt_many(lang, texts, keyword, backend="python"):
+    """
+    Encrypt many texts with the same keyword.
     
-    if not keyword:
-        return text  # Return original text if no keyword provided
+    The keyword is compiled once for the whole batch and every text starts
+    at the beginning of the keyword, so the result is the same as calling
+    vigenere_encrypt on each text. With backend='numpy' the texts are joined
+    into one buffer and transformed in a single vectorized pass.
     
-    # Clean the keyword to only include valid alphabet characters
-    clean_keyword = ''.join([char.lower() for char in keyword if char.lower() in alphabet])
-    if not clean_keyword:
-        return text  # Return original text if keyword has no valid characters
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        texts (iterable): Texts to encrypt
+        keyword (str): Keyword for encryption
+        backend (str): 'python' (default) or 'numpy' for the vectorized path
     
-    result = ""
+    Returns:
+        list: Encrypted texts, in input order
+    """
+    return _transform_many(lang, texts, keyword, backend, decrypt=False)
+
+
+def vigenere_decrypt_many(lang, texts, keyword, backend="python"):
+    """
+    Decrypt many texts with the same keyword.
     
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        texts (iterable): Texts to decrypt
+        keyword (str): Keyword for decryption
+        backend (str): 'python' (default) or 'numpy' for the vectorized path
     
-    return result
+    Returns:
+        list: Decrypted texts, in input order
+    """
+    return _transform_many(lang, texts, keyword, backend, decrypt=True)
 
-if __name__ == "__main__":
+
+class VigenereCipher:
+    """
+    Vigenère cipher compiled for a single language and keyword.
+
+    The keyword is cleaned and mapped to one lookup table per key position
+    when the object is created, so encrypting or decrypting afterwards is a
+    single pass over the text with one dict lookup per character. The output
+    is identical to vigenere_encrypt / vigenere_decrypt.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        keyword (str): Keyword for encryption/decryption
+    """
+
+    def __init__(self, lang, keyword):
+        self.lang = lang
+        self.keyword = keyword
+        self.alphabet = get_alphabet(lang) if lang else None
+
+        self.clean_keyword = ""
+        if self.alphabet is not None and keyword:
+            self.clean_keyword = ''.join([char.lower() for char in keyword if char.lower() in self.alphabet])
+
+        self.shifts = [self.alphabet.index(char) for char in self.clean_keyword]
+        # The per-shift tables are prebuilt (and shared) by the compiled Alphabet
+        size = len(self.alphabet) if self.alphabet is not None else 0
+        self.encrypt_tables = [self.alphabet.shift_tables[shift] for shift in self.shifts]
+        self.decrypt_tables = [self.alphabet.shift_tables[-shift % size] for shift in self.shifts]
+
+    def _transform(self, text, tables, key_pos=0):
+        if not tables:
+            return text, key_pos  # Unsupported language or no valid keyword characters
+
+        period = len(tables)
+        key_pos %= period
+        result = []
+        append = result.append
+        for char in text:
+            table = tables[key_pos]
+            new_char = table.get(char)
+            if new_char is None:
+                # Rare uppercase forms (e.g. the Kelvin sign) only match through lower()
+                lower_char = char.lower()
+                if lower_char == char or lower_char not in table:
+                    append(char)
+                    continue
+                new_char = table[lower_char].upper()
+            append(new_char)
+            key_pos += 1
+            if key_pos == period:
+                key_pos = 0
+
+        return ''.join(result), key_pos
+
+    def encrypt(self, text):
+        """
+        Encrypt text with the compiled keyword.
+
+        Args:
+            text (str): Text to encrypt
+
+        Returns:
+            str: Encrypted text
+        """
+        return self._transform(text, self.encrypt_tables)[0]
+
+    def decrypt(self, text):
+        """
+        Decrypt text with the compiled keyword.
+
+        Args:
+            text (str): Text to decrypt
+
+        Returns:
+            str: Decrypted text
+        """
+        return self._transform(text, self.decrypt_tables)[0]
+
+    def encrypt_chunk(self, text, key_pos=0):
+        """
+        Encrypt one chunk of a longer text, starting at a given key position.
+
+        Args:
+            text (str): Chunk to encrypt
+            key_pos (int): Key position of the first alphabet character in the chunk
+
+        Returns:
+            tuple: (encrypted chunk, key position for the next chunk)
+        """
+        return self._transform(text, self.encrypt_tables, key_pos)
+
+    def decrypt_chunk(self, text, key_pos=0):
+        """
+        Decrypt one chunk of a longer text, starting at a given key position.
+
+        Args:
+            text (str): Chunk to decrypt
+            key_pos (int): Key position of the first alphabet character in the chunk
+
+        Returns:
+            tuple: (decrypted chunk, key position for the next chunk)
+        """
+        return self._transform(text, self.decrypt_tables, key_pos)
+
+
+DEFAULT_KEY_CACHE_SIZE = 128
+_key_schedules = OrderedDict()
+_key_cache_size = DEFAULT_KEY_CACHE_SIZE
+_key_cache_stats = {'hits': 0, 'misses': 0}
+
+
+def get_cipher(lang, keyword):
+    """
+    Get the compiled VigenereCipher for a language and keyword.
+    
+    Compiled ciphers (cleaned keyword, shifts and shift tables) are kept in
+    a bounded LRU cache keyed by (language, keyword). A cached cipher is
+    only reused while its alphabet is still the current one for the
+    language, so re-registering an alphabet never serves stale tables.
+    
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        keyword (str): Keyword for encryption/decryption
+    
+    Returns:
+        VigenereCipher: Shared cipher object (treat it as read-only)
+    """
+    key = (lang, keyword)
+    alphabet = get_alphabet(lang) if lang else None
+    cipher = _key_schedules.get(key)
+    if cipher is not None and cipher.alphabet is alphabet:
+        _key_cache_stats['hits'] += 1
+        _key_schedules.move_to_end(key)
+        return cipher
+    
+    _key_cache_stats['misses'] += 1
+    cipher = _key_schedules[key] = VigenereCipher(lang, keyword)
+    _key_schedules.move_to_end(key)
+    while len(_key_schedules) > _key_cache_size:
+        _key_schedules.popitem(last=False)
+    return cipher
+
+
+def set_key_cache_size(size):
+    """
+    Set how many compiled keywords are kept in memory (least recently used are dropped).
+    
+    Args:
+        size (int): Maximum number of cached keywords (at least 1)
+    """
+    global _key_cache_size
+    if size < 1:
+        raise ValueError("Key cache size must be at least 1")
+    _key_cache_size = size
+    while len(_key_schedules) > _key_cache_size:
+        _key_schedules.popitem(last=False)
+
+
+def key_cache_info():
+    """
+    Get statistics about the key-schedule cache.
+    
+    Returns:
+        dict: 'hits', 'misses', 'size' and 'maxsize'
+    """
+    return {**_key_cache_stats, 'size': len(_key_schedules), 'maxsize': _key_cache_size}
+
+
+def clear_key_cache():
+    """
+    Drop every cached keyword and reset the statistics.
+    """
+    _key_schedules.clear()
+    _key_cache_stats['hits'] = _key_cache_stats['misses'] = 0
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _transform_stream(transform_chunk, infile, outfile, chunk_size):
+    key_pos = 0
+    total = 0
+    while True:
+        chunk = infile.read(chunk_size)
+        if not chunk:
+            break
+        result, key_pos = transform_chunk(chunk, key_pos)
+        outfile.write(result)
+        total += len(chunk)
+    return total
+
+
+def encrypt_stream(lang, infile, outfile, keyword, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Encrypt a text file object chunk by chunk into another file object.
+
+    Only one chunk is held in memory at a time. The keyword position is
+    carried across chunk boundaries, so the output is identical to
+    vigenere_encrypt on the whole text.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        infile: Readable text file object
+        outfile: Writable text file object
+        keyword (str): Keyword for encryption
+        chunk_size (int): Number of characters to read at a time
+
+    Returns:
+        int: Number of characters processed
+    """
+    cipher = get_cipher(lang, keyword)
+    return _transform_stream(cipher.encrypt_chunk, infile, outfile, chunk_size)
+
+
+def decrypt_stream(lang, infile, outfile, keyword, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Decrypt a text file object chunk by chunk into another file object.
+
+    Args:
+        lang (str): Language ('english' or 'hebrew')
+        infile: Readable text file object
+        outfile: Writable text file object
+        keyword (str): Keyword for decryption
+        chunk_size (int): Number of characters to read at a time
+
+    Returns:
+        int: Number of characters processed
+    """
+    cipher = get_cipher(lang, keyword)
+    return _transform_stream(cipher.decrypt_chunk, infile, outfile, chunk_size)
+
+
+def _run_demo():
     # Simple example of Vigenere cipher usage
-        
+
     # English example
     print("=== English Example ===")
     original_text = "Hello World"
@@ -89,4 +375,47 @@ if __name__ == "__main__":
     print(f"Encrypted: {encrypted_heb}")
 
     decrypted_heb = vigenere_decrypt("hebrew", encrypted_heb, hebrew_keyword)
-    print(f"Decrypted: {decrypted_heb}")
\ No newline at end of file
+    print(f"Decrypted: {decrypted_heb}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Encrypt or decrypt text with the Vigenère cipher.")
+    parser.add_argument("mode", nargs="?", choices=["encrypt", "decrypt"],
+                        help="stream the input through the cipher (runs the demo if omitted)")
+    parser.add_argument("-k", "--keyword", help="keyword for encryption/decryption")
+    parser.add_argument("-l", "--lang", default="english", help="language (default: english)")
+    parser.add_argument("-i", "--input", help="input file (default: stdin)")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="characters read per chunk")
+    parser.add_argument("--mmap", action="store_true",
+                        help="memory-map the input and output files (requires --input and --output)")
+    args = parser.parse_args(argv)
+
+    if args.mode is None:
+        _run_demo()
+        return
+    if args.keyword is None:
+        parser.error("--keyword is required for encrypt/decrypt")
+
+    if args.mmap:
+        if not args.input or not args.output:
+            parser.error("--mmap requires --input and --output")
+        import mmap_cipher
+        transform_file = mmap_cipher.vigenere_encrypt_file if args.mode == "encrypt" else mmap_cipher.vigenere_decrypt_file
+        transform_file(args.lang, args.input, args.output, args.keyword)
+        return
+
+    stream = encrypt_stream if args.mode == "encrypt" else decrypt_stream
+    with ExitStack() as stack:
+        infile = sys.stdin
+        outfile = sys.stdout
+        if args.input:
+            infile = stack.enter_context(open(args.input, 'r', encoding='utf-8', newline=''))
+        if args.output:
+            outfile = stack.enter_context(open(args.output, 'w', encoding='utf-8', newline=''))
+        stream(args.lang, infile, outfile, args.keyword, chunk_size=args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
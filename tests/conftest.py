@@ -0,0 +1,30 @@
+import pytest
+import sys
+import os
+
+# Add the src directory to the Python path to import the fixtures' modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import array_backend
+import language_model
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run a test with NumPy and again with the pure Python fallbacks."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(array_backend, "is_available", lambda: False)
+    return request.param
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep language profiles and n-gram models cached in a temporary directory."""
+    monkeypatch.setenv("VIGENERE_CACHE_DIR", str(tmp_path / "cache"))
+    language_model.get_profile.cache_clear()
+    language_model.get_ngram_model.cache_clear()
+    yield tmp_path / "cache"
+    language_model.get_profile.cache_clear()
+    language_model.get_ngram_model.cache_clear()
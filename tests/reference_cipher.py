@@ -0,0 +1,54 @@
+"""
+Straightforward per-character Vigenère and Caesar ciphers used as the expected result.
+
+This is the original implementation of vigenere_encrypt/vigenere_decrypt
+and caesar_encrypt, kept independent of the compiled VigenereCipher, the
+translation tables, the key-schedule cache and the NumPy backend so the
+optimized paths are checked against something other than themselves.
+"""
+
+from alphabets import get_alphabet
+
+
+def _reference_vigenere(lang, text, keyword, sign):
+    alphabet = get_alphabet(lang)
+    if alphabet is None or not keyword:
+        return text
+    
+    # Clean the keyword to only include valid alphabet characters
+    clean_keyword = ''.join([char.lower() for char in keyword if char.lower() in alphabet])
+    if not clean_keyword:
+        return text
+    
+    key_shifts = [alphabet.index(char) for char in clean_keyword]
+    size = len(alphabet)
+    key_pos = 0
+    result = ""
+    for char in text:
+        lower_char = char.lower()
+        if lower_char in alphabet:
+            shift = key_shifts[key_pos % len(key_shifts)]
+            new_char = alphabet[(alphabet.index(lower_char) + sign * shift) % size]
+            result += new_char if char == lower_char else new_char.upper()
+            key_pos += 1  # Only alphabet characters advance the keyword
+        else:
+            result += char
+    return result
+
+
+def reference_vigenere_encrypt(lang, text, keyword):
+    """Encrypt text one character at a time."""
+    return _reference_vigenere(lang, text, keyword, 1)
+
+
+def reference_vigenere_decrypt(lang, text, keyword):
+    """Decrypt text one character at a time."""
+    return _reference_vigenere(lang, text, keyword, -1)
+
+
+def reference_caesar_encrypt(lang, text, shift):
+    """Encrypt text one character at a time with a single shift."""
+    alphabet = get_alphabet(lang)
+    if alphabet is None:
+        return text
+    return _reference_vigenere(lang, text, alphabet[shift % len(alphabet)], 1)
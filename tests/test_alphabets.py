@@ -0,0 +1,212 @@
+import pickle
+import pytest
+import sys
+import os
+
+# Add the src directory to the Python path to import alphabets
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import alphabets
+from alphabets import (
+    Alphabet,
+    alphabet_cache_info,
+    english_alphabet,
+    get_alphabet,
+    get_supported_languages,
+    hebrew_alphabet,
+    load_alphabets,
+    register_alphabet,
+    set_alphabet_cache_size,
+    unregister_alphabet,
+    validate_alphabet
+)
+from bytes_cipher import vigenere_encrypt_bytes
+from caesar_encrypt import caesar_encrypt
+from cyber_tools import frequency_analysis
+from vigenere_cipher import vigenere_encrypt, vigenere_decrypt
+
+
+EXTRA_ALPHABETS_PATH = os.path.join(os.path.dirname(__file__), '..', 'assets', 'extra_alphabets.json')
+
+
+@pytest.fixture
+def restore_alphabets():
+    """Undo alphabet registrations and cache size changes made by a test."""
+    saved = dict(alphabets.ALPHABETS)
+    yield
+    alphabets.ALPHABETS.clear()
+    alphabets.ALPHABETS.update(saved)
+    alphabets._compiled_alphabets.clear()
+    set_alphabet_cache_size(alphabets.DEFAULT_ALPHABET_CACHE_SIZE)
+
+
+class TestAlphabet:
+    """Test suite for the compiled Alphabet class."""
+    
+    def test_list_compatibility(self):
+        """Test that Alphabet behaves like the list of its characters."""
+        alphabet = get_alphabet("english")
+        assert len(alphabet) == 27
+        assert list(alphabet) == english_alphabet
+        assert alphabet == english_alphabet
+        assert alphabet[0] == 'a' and alphabet[-1] == ' '
+        assert alphabet[:3] == ['a', 'b', 'c']
+        assert 'q' in alphabet and 'Q' not in alphabet and '1' not in alphabet
+        assert alphabet.index('z') == 25
+        assert alphabet.count('a') == 1
+        assert {char: 0 for char in alphabet} == {char: 0 for char in english_alphabet}
+    
+    def test_index_missing(self):
+        """Test that index() raises ValueError like list.index."""
+        with pytest.raises(ValueError):
+            get_alphabet("english").index('A')
+        assert get_alphabet("english").get_index('A') is None
+    
+    def test_cached_instance(self):
+        """Test that get_alphabet returns the same compiled instance every time."""
+        assert get_alphabet("english") is get_alphabet("English")
+        assert get_alphabet("hebrew") is get_alphabet("hebrew")
+        assert get_alphabet("klingon") is None
+    
+    def test_immutable(self):
+        """Test that attributes cannot be changed."""
+        alphabet = get_alphabet("english")
+        with pytest.raises(AttributeError):
+            alphabet.symbols = ('a',)
+        with pytest.raises(AttributeError):
+            alphabet.extra = 1
+    
+    def test_lookup_tables(self):
+        """Test the uppercase mapping, codepoint lookup and shift tables."""
+        alphabet = get_alphabet("english")
+        assert alphabet.upper['a'] == 'A' and ' ' not in alphabet.upper
+        assert alphabet.lookup[ord('c')] == 2
+        assert alphabet.lookup[ord('C')] == -1
+        assert alphabet.lookup[len(alphabet.lookup) - 1] == -1  # Sentinel for larger codepoints
+        assert alphabet.shift_tables[3]['x'] == ' '
+        assert alphabet.shift_tables[3]['X'] == ' '
+        assert alphabet.shift_tables[1]['A'] == 'B'
+    
+    def test_hebrew_has_no_case(self):
+        """Test that Hebrew has no uppercase mapping."""
+        alphabet = get_alphabet("hebrew")
+        assert alphabet == hebrew_alphabet
+        assert alphabet.upper == {}
+        assert alphabet.shift_tables[1]['א'] == 'ב'
+    
+    def test_pickle_and_hash(self):
+        """Test that alphabets can be pickled and used as dict keys."""
+        alphabet = get_alphabet("hebrew")
+        assert pickle.loads(pickle.dumps(alphabet)) == alphabet
+        assert {alphabet: 1}[Alphabet("hebrew", hebrew_alphabet)] == 1
+
+
+class TestCustomAlphabets:
+    """Test suite for registering and loading custom alphabets."""
+    
+    def test_register_and_use(self, restore_alphabets):
+        """Test that a registered alphabet works with the cipher and analysis functions."""
+        register_alphabet("Russian", "абвгдеёжзийклмнопрстуфхцчшщъыьэюя ")
+        assert "russian" in get_supported_languages()
+        encrypted = vigenere_encrypt("russian", "Привет, мир!", "ключ")
+        assert encrypted != "Привет, мир!"
+        assert vigenere_decrypt("russian", encrypted, "ключ") == "Привет, мир!"
+        assert caesar_encrypt("russian", "абв", 1) == "бвг"
+        assert frequency_analysis("russian", "Мама")['м'] == 2
+    
+    def test_register_validation(self, restore_alphabets):
+        """Test that invalid alphabets are rejected."""
+        with pytest.raises(ValueError):
+            register_alphabet("english", "abc")  # Already registered
+        with pytest.raises(ValueError):
+            register_alphabet("", "abc")
+        for symbols in ["", "abca", "aBc", "aA", ["ab", "c"], "σς"]:
+            with pytest.raises(ValueError):
+                validate_alphabet(list(symbols) if isinstance(symbols, str) else symbols)
+        validate_alphabet(english_alphabet)
+        validate_alphabet(hebrew_alphabet)
+        for language in get_supported_languages():
+            validate_alphabet(get_alphabet(language))
+    
+    @pytest.mark.parametrize("symbols", ["abß ", "abcı "])
+    def test_register_rejects_broken_case_pairs(self, restore_alphabets, symbols):
+        """Test symbols whose uppercase form is several characters or does not lowercase back."""
+        with pytest.raises(ValueError, match="does not lowercase back"):
+            register_alphabet("broken", symbols)
+        assert "broken" not in get_supported_languages()
+    
+    def test_replace_recompiles(self, restore_alphabets):
+        """Test that replacing an alphabet drops the old compiled version."""
+        register_alphabet("tiny", "abc")
+        assert get_alphabet("tiny") == ['a', 'b', 'c']
+        register_alphabet("tiny", "abcd", replace=True)
+        assert get_alphabet("tiny") == ['a', 'b', 'c', 'd']
+        unregister_alphabet("tiny")
+        assert get_alphabet("tiny") is None
+        with pytest.raises(ValueError):
+            unregister_alphabet("english")
+    
+    def test_load_json(self, restore_alphabets):
+        """Test loading the bundled extra alphabets."""
+        loaded = load_alphabets(EXTRA_ALPHABETS_PATH)
+        assert set(loaded) == {"russian", "greek", "arabic", "digits_punctuation"}
+        assert caesar_encrypt("digits_punctuation", "0129", 1) == "123."
+        text = "مرحبا بالعالم"
+        assert vigenere_decrypt("arabic", vigenere_encrypt("arabic", text, "مفتاح"), "مفتاح") == text
+    
+    def test_load_toml(self, tmp_path, restore_alphabets):
+        """Test loading alphabets from a TOML file."""
+        path = tmp_path / "alphabets.toml"
+        path.write_text('[alphabets]\nbinary = ["0", "1"]\n', encoding="utf-8")
+        assert load_alphabets(str(path)) == ["binary"]
+        assert caesar_encrypt("binary", "0110", 1) == "1001"
+    
+    def test_load_invalid_file_registers_nothing(self, tmp_path, restore_alphabets):
+        """Test that one invalid entry stops the whole file from loading."""
+        path = tmp_path / "alphabets.json"
+        path.write_text('{"good": "abc", "bad": "aab"}', encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_alphabets(str(path))
+        assert get_alphabet("good") is None
+    
+    @pytest.mark.parametrize("replace", [False, True])
+    def test_load_rejects_names_that_normalize_alike(self, restore_alphabets, tmp_path, replace):
+        """Test that names equal after strip().lower() are caught before anything is registered."""
+        path = tmp_path / "alphabets.json"
+        path.write_text('{"Tiny": "abc", " tiny": "abcd", "other": "xyz"}', encoding="utf-8")
+        with pytest.raises(ValueError, match="more than once"):
+            load_alphabets(str(path), replace=replace)
+        assert get_alphabet("tiny") is None and get_alphabet("other") is None
+        path.write_text('{" Tiny ": "abc"}', encoding="utf-8")
+        assert load_alphabets(str(path)) == ["tiny"]
+    
+    def test_lru_bound(self, restore_alphabets):
+        """Test that the compiled alphabet cache keeps only the most recently used entries."""
+        set_alphabet_cache_size(2)
+        for name in ["one", "two", "three"]:
+            register_alphabet(name, "xyz")
+        first = get_alphabet("one")
+        get_alphabet("two")
+        get_alphabet("three")
+        info = alphabet_cache_info()
+        assert info['size'] == 2 and info['maxsize'] == 2
+        assert "one" not in alphabets._compiled_alphabets
+        assert get_alphabet("one") is not first  # Recompiled after eviction
+        assert get_alphabet("one") == first
+        with pytest.raises(ValueError):
+            set_alphabet_cache_size(0)
+    
+    def test_table_caches_follow_size(self, restore_alphabets):
+        """Test that the tables derived from alphabets are bounded by the same size."""
+        for name, symbols in [("one", "xyz"), ("two", "xy"), ("three", "x")]:
+            register_alphabet(name, symbols)
+            vigenere_encrypt_bytes(name, b"xyz xyz", "yx")
+        assert max(map(len, alphabets._table_caches)) >= 3
+        set_alphabet_cache_size(2)
+        assert max(map(len, alphabets._table_caches)) == 2
+        vigenere_encrypt_bytes("english", b"hello world", "key")
+        assert max(map(len, alphabets._table_caches)) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,90 @@
+import pytest
+import sys
+import os
+
+# Add the src directory to the Python path to import the cipher modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+pytest.importorskip("numpy")
+
+from caesar_encrypt import caesar_encrypt, caesar_encrypt_many
+from reference_cipher import reference_vigenere_decrypt, reference_vigenere_encrypt
+from vigenere_cipher import vigenere_encrypt, vigenere_decrypt, vigenere_encrypt_many, vigenere_decrypt_many
+
+
+class TestNumpyBackend:
+    """Test that the numpy backend matches the reference Python backend."""
+
+    @pytest.mark.parametrize("lang,text,keyword", [
+        ("english", "Hello World", "Key"),
+        ("english", "a b c, d1e!", "xyz"),
+        ("english", "XYZ xyz", "zzz"),
+        ("english", "the \u212aelvin sign", "key"),  # Kelvin sign lowercases to 'k'
+        ("english", "123 !@#", "key"),
+        ("english", "", "key"),
+        ("english", "hello", "123"),
+        ("hebrew", "שלום עולם! abc", "מפתח"),
+        ("unsupported", "test", "key"),
+    ])
+    def test_vigenere_matches_python(self, lang, text, keyword):
+        """Test vigenere_encrypt/vigenere_decrypt with both backends."""
+        assert vigenere_encrypt(lang, text, keyword, backend="numpy") == reference_vigenere_encrypt(
+            lang, text, keyword)
+        assert vigenere_decrypt(lang, text, keyword, backend="numpy") == reference_vigenere_decrypt(
+            lang, text, keyword)
+
+    @pytest.mark.parametrize("lang,text,shift", [
+        ("english", "Hello World!", 3),
+        ("english", "PyThOn", 5),
+        ("english", "abc", -30),
+        ("english", "xyz", 27),
+        ("hebrew", "שלום!", 1),
+        ("unsupported", "test", 5),
+    ])
+    def test_caesar_matches_python(self, lang, text, shift):
+        """Test caesar_encrypt with both backends."""
+        assert caesar_encrypt(lang, text, shift, backend="numpy") == caesar_encrypt(lang, text, shift)
+
+    def test_en_bible_matches_python(self):
+        """Test the numpy backend on a sample of the English Bible text."""
+        with open('./assets/bible_en.txt', 'r', encoding='utf-8') as file:
+            original_text = file.read(50000)
+        encrypted = vigenere_encrypt("english", original_text, "Jerusalem", backend="numpy")
+        assert encrypted == reference_vigenere_encrypt("english", original_text, "Jerusalem")
+        assert vigenere_decrypt("english", encrypted, "Jerusalem", backend="numpy") == reference_vigenere_decrypt(
+            "english", encrypted, "Jerusalem")
+
+    def test_many_matches_single(self):
+        """Test that the single-pass batch path restarts the key for every message."""
+        messages = ["Hello World", "", "123", "a b c, d1e!", "the \u212aelvin sign", "שלום abc", "x"] * 3
+        for lang, keyword in [("english", "Key"), ("hebrew", "מפתח")]:
+            assert vigenere_encrypt_many(lang, messages, keyword, backend="numpy") == [
+                reference_vigenere_encrypt(lang, text, keyword) for text in messages]
+            assert vigenere_decrypt_many(lang, messages, keyword, backend="numpy") == [
+                reference_vigenere_decrypt(lang, text, keyword) for text in messages]
+            assert caesar_encrypt_many(lang, messages, 4, backend="numpy") == [
+                caesar_encrypt(lang, text, 4) for text in messages]
+        assert vigenere_encrypt_many("english", ["", "123"], "key", backend="numpy") == ["", "123"]
+
+    def test_lone_surrogates(self):
+        """Test text with lone surrogates, e.g. read with errors='surrogateescape'."""
+        text = "Hello \udc80World\ud800!"
+        for lang, keyword in [("english", "Key"), ("hebrew", "מפתח")]:
+            encrypted = vigenere_encrypt(lang, text, keyword, backend="numpy")
+            assert encrypted == reference_vigenere_encrypt(lang, text, keyword)
+            assert vigenere_decrypt(lang, encrypted, keyword, backend="numpy") == reference_vigenere_decrypt(
+                lang, encrypted, keyword)
+            assert caesar_encrypt(lang, text, 3, backend="numpy") == caesar_encrypt(lang, text, 3)
+            assert vigenere_encrypt_many(lang, [text, "abc"], keyword, backend="numpy") == [
+                reference_vigenere_encrypt(lang, text, keyword), reference_vigenere_encrypt(lang, "abc", keyword)]
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected."""
+        with pytest.raises(ValueError):
+            vigenere_encrypt("english", "hello", "key", backend="gpu")
+        with pytest.raises(ValueError):
+            caesar_encrypt("english", "hello", 3, backend="gpu")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
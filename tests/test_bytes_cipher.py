@@ -0,0 +1,89 @@
+import mmap
+import pytest
+import sys
+import os
+
+# Add the src directory to the Python path to import the cipher modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bytes_cipher import (
+    caesar_encrypt_bytes,
+    supports_alphabet,
+    vigenere_decrypt_bytes,
+    vigenere_encrypt_bytes
+)
+from alphabets import english_alphabet, hebrew_alphabet
+from caesar_encrypt import caesar_encrypt
+from reference_cipher import reference_vigenere_decrypt, reference_vigenere_encrypt
+
+
+class TestBytesCipher:
+    """Test that the bytes functions match the str functions."""
+    
+    @pytest.mark.parametrize("text,keyword", [
+        ("Hello World", "Key"),
+        ("a b c, d1e!", "xyz"),
+        ("XYZ xyz\r\n", "zzz"),
+        ("abc", "k1e2y"),
+        ("שלום Hello 😀 World", "key"),  # Multibyte UTF-8 is copied unchanged
+        ("", "key"),
+        ("hello", ""),
+        ("hello", "123"),
+        ("!!!", "key"),
+    ])
+    def test_vigenere_matches_str(self, backend, text, keyword):
+        """Test vigenere_encrypt_bytes/vigenere_decrypt_bytes against the str functions."""
+        data = text.encode('utf-8')
+        assert vigenere_encrypt_bytes("english", data, keyword) == reference_vigenere_encrypt("english", text, keyword).encode('utf-8')
+        assert vigenere_decrypt_bytes("english", data, keyword) == reference_vigenere_decrypt("english", text, keyword).encode('utf-8')
+    
+    @pytest.mark.parametrize("shift", [0, 3, -1, 27, 100])
+    def test_caesar_matches_str(self, backend, shift):
+        """Test caesar_encrypt_bytes against caesar_encrypt."""
+        text = "Hello, World! xyz ABC שלום"
+        assert caesar_encrypt_bytes("english", text.encode('utf-8'), shift) == caesar_encrypt(
+            "english", text, shift).encode('utf-8')
+    
+    def test_en_bible_matches_str(self, backend):
+        """Test the bytes path on a sample of the English Bible text."""
+        with open('./assets/bible_en.txt', 'rb') as file:
+            data = file.read(50000)
+        text = data.decode('utf-8')
+        encrypted = vigenere_encrypt_bytes("english", data, "Jerusalem")
+        assert encrypted == reference_vigenere_encrypt("english", text, "Jerusalem").encode('utf-8')
+        assert vigenere_decrypt_bytes("english", encrypted, "Jerusalem") == reference_vigenere_decrypt(
+            "english", encrypted.decode('utf-8'), "Jerusalem").encode('utf-8')
+    
+    def test_input_types_and_output_buffers(self, backend):
+        """Test memoryview/bytearray input and writing into caller buffers, including in place."""
+        data = b"Hello World, hello bytes"
+        expected = reference_vigenere_encrypt("english", data.decode(), "key").encode()
+        out = bytearray(len(data))
+        assert vigenere_encrypt_bytes("english", memoryview(data), "key", out=out) is out
+        assert out == expected
+        buffer = bytearray(data)
+        vigenere_encrypt_bytes("english", buffer, "key", out=buffer)
+        assert buffer == expected
+        view = memoryview(bytearray(len(data)))
+        caesar_encrypt_bytes("english", data, 3, out=view)
+        assert view.tobytes() == caesar_encrypt("english", data.decode(), 3).encode()
+        mapped = mmap.mmap(-1, len(data))
+        vigenere_encrypt_bytes("english", data, "key", out=mapped)
+        assert mapped[:] == expected
+        mapped.close()
+        with pytest.raises(ValueError):
+            vigenere_encrypt_bytes("english", data, "key", out=bytearray(3))
+    
+    def test_fallbacks(self, backend):
+        """Test unsupported languages and multibyte alphabets."""
+        assert vigenere_encrypt_bytes("spanish", b"hola", "key") == b"hola"
+        out = bytearray(4)
+        assert caesar_encrypt_bytes("spanish", b"hola", 3, out=out) == b"hola"
+        with pytest.raises(ValueError):
+            vigenere_encrypt_bytes("hebrew", "שלום".encode('utf-8'), "מפתח")
+        assert supports_alphabet(english_alphabet)
+        assert not supports_alphabet(hebrew_alphabet)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
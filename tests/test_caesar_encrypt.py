@@ -1,3 +1,4 @@
+import io
 import pytest
 import sys
 import os
@@ -5,9 +6,10 @@ import os
 # Add the src directory to the Python path to import caesar_encrypt
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from caesar_encrypt import caesar_encrypt
+from caesar_encrypt import caesar_encrypt, caesar_encrypt_many, crack_caesar, encrypt_stream, decrypt_stream, main
 from cyber_tools import frequency_analysis
 from alphabets import english_alphabet, hebrew_alphabet
+from reference_cipher import reference_caesar_encrypt
 
 
 class TestFrequencyAnalysis:
@@ -358,6 +360,13 @@ class TestCaesarEncrypt:
         """Test Hebrew text with non-Hebrew characters."""
         assert caesar_encrypt("hebrew", "א1ב2ג", 1) == "ב1ג2ד"
         assert caesar_encrypt("hebrew", "שלום!", 1) == "תמזנ!"
+    
+    @pytest.mark.parametrize("lang", ["english", "hebrew"])
+    @pytest.mark.parametrize("shift", [-28, -1, 0, 3, 26, 100])
+    def test_matches_reference(self, lang, shift):
+        """Test the translate path against the original per-character loop."""
+        text = "Hello, World! xyz \u212aelvin \u0130stanbul ß שלום עולם 123\n"
+        assert caesar_encrypt(lang, text, shift) == reference_caesar_encrypt(lang, text, shift)
 
 
 # Parametrized tests for additional coverage
@@ -399,5 +408,107 @@ class TestCaesarEncryptParametrized:
         assert caesar_encrypt(lang, text, shift) == expected
 
 
+class TestCaesarMany:
+    """Test suite for caesar_encrypt_many."""
+    
+    def test_matches_single(self):
+        """Test that every message is encrypted as if on its own."""
+        messages = ["Hello World!", "", "xyz", "\u212aelvin", "שלום 123"]
+        for lang in ["english", "hebrew"]:
+            assert caesar_encrypt_many(lang, messages, 3) == [caesar_encrypt(lang, text, 3) for text in messages]
+        assert caesar_encrypt_many("english", ["abc", "XYZ"], -1) == [" ab", "WXY"]
+    
+    def test_fallbacks(self):
+        """Test unsupported languages, empty batches and unknown backends."""
+        assert caesar_encrypt_many("spanish", ["hola"], 3) == ["hola"]
+        assert caesar_encrypt_many("english", [], 3) == []
+        with pytest.raises(ValueError):
+            caesar_encrypt_many("english", ["abc"], 3, backend="gpu")
+
+
+class TestCrackCaesar:
+    """Test suite for recovering the Caesar shift without a crib."""
+    
+    @pytest.mark.parametrize("shift", [0, 1, 11, 26])
+    def test_recovers_shift_english(self, shift):
+        """Test that the shift and plaintext of an English sentence are recovered."""
+        plaintext = "Meet me at the north gate at noon and bring the documents."
+        results = crack_caesar("english", caesar_encrypt("english", plaintext, shift))
+        assert results[0]['shift'] == shift
+        assert results[0]['plaintext'] == plaintext
+        assert results[0]['confidence'] > 0.99
+    
+    def test_recovers_shift_hebrew(self):
+        """Test that the shift of a Hebrew sentence is recovered."""
+        plaintext = "בראשית ברא אלהים את השמים ואת הארץ"
+        results = crack_caesar("hebrew", caesar_encrypt("hebrew", plaintext, 5))
+        assert results[0]['shift'] == 5
+        assert results[0]['plaintext'] == plaintext
+    
+    def test_ranking(self):
+        """Test that every shift is ranked once, best first, with confidences summing to 1."""
+        results = crack_caesar("english", caesar_encrypt("english", "Hello World", 3))
+        assert sorted(result['shift'] for result in results) == list(range(len(english_alphabet)))
+        scores = [result['score'] for result in results]
+        assert scores == sorted(scores, reverse=True)
+        assert sum(result['confidence'] for result in results) == pytest.approx(1.0)
+        assert all('plaintext' not in result for result in results[1:])
+    
+    def test_matches_brute_force(self):
+        """Test that the correlation scores equal scoring every decryption directly."""
+        from language_model import get_profile
+        import math
+        profile = get_profile("english")
+        ciphertext = caesar_encrypt("english", "The quick brown fox jumps over the lazy dog", 7)
+        for result in crack_caesar("english", ciphertext):
+            counts = frequency_analysis("english", caesar_encrypt("english", ciphertext, -result['shift']))
+            total = sum(counts.values())
+            expected = sum(count * math.log(profile[i]) for i, count in enumerate(counts.values())) / total
+            assert result['score'] == pytest.approx(expected)
+    
+    def test_nothing_to_crack(self):
+        """Test unsupported languages and texts without alphabet characters."""
+        assert crack_caesar("spanish", "hola") == []
+        assert crack_caesar("english", "123!?") == []
+        assert crack_caesar("english", "") == []
+
+
+class TestCaesarStream:
+    """Tests for streaming Caesar encryption over file objects."""
+    
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 1024])
+    def test_stream_matches_whole_text(self, chunk_size):
+        """Test that chunk-wise output equals caesar_encrypt on the whole text."""
+        text = "Hello, World!\nThe \u212aelvin sign and XYZ xyz 123.\n" * 5
+        outfile = io.StringIO()
+        processed = encrypt_stream("english", io.StringIO(text), outfile, 5, chunk_size=chunk_size)
+        assert processed == len(text)
+        assert outfile.getvalue() == caesar_encrypt("english", text, 5)
+    
+    def test_stream_roundtrip_hebrew(self):
+        """Test that decrypt_stream reverses encrypt_stream."""
+        text = "שלום עולם! אבג"
+        encrypted = io.StringIO()
+        encrypt_stream("hebrew", io.StringIO(text), encrypted, 4, chunk_size=3)
+        assert encrypted.getvalue() == caesar_encrypt("hebrew", text, 4)
+        decrypted = io.StringIO()
+        decrypt_stream("hebrew", io.StringIO(encrypted.getvalue()), decrypted, 4, chunk_size=3)
+        assert decrypted.getvalue() == text
+    
+    def test_stream_unsupported_language(self):
+        """Test that unsupported languages are copied unchanged."""
+        outfile = io.StringIO()
+        encrypt_stream("spanish", io.StringIO("hola"), outfile, 3)
+        assert outfile.getvalue() == "hola"
+    
+    def test_cli_encrypt_file(self, tmp_path):
+        """Test the encrypt mode of the command-line interface."""
+        input_path = tmp_path / "plain.txt"
+        output_path = tmp_path / "cipher.txt"
+        input_path.write_bytes("hello world\r\n".encode("utf-8"))
+        main(["encrypt", "--shift", "3", "-i", str(input_path), "-o", str(output_path)])
+        assert output_path.read_bytes().decode("utf-8") == "khoorczruog\r\n"  # Line endings are kept
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,172 @@
+import asyncio
+import json
+import pytest
+import sys
+import os
+
+# Add the src directory to the Python path to import the cipher modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from caesar_encrypt import caesar_encrypt
+from cipher_server import MicroBatcher, Overloaded, parse_job, run_batch, serve
+from cyber_tools import frequency_analysis
+from vigenere_cipher import vigenere_encrypt
+
+
+async def request(port, method, path, payload=None, raw_body=None):
+    """Send one request on a new connection and return (status, decoded JSON body)."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    body = raw_body if raw_body is not None else json.dumps(payload).encode('utf-8') if payload is not None else b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+                 .encode('latin-1') + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(body)
+
+
+def run_with_server(scenario, **options):
+    """Start a server on a free port, run scenario(port) against it and stop the server."""
+    async def main():
+        ready = asyncio.get_running_loop().create_future()
+        server = asyncio.create_task(serve(port=0, ready=ready, **options))
+        _, port = await ready
+        try:
+            return await scenario(port)
+        finally:
+            server.cancel()
+            try:
+                await server
+            except asyncio.CancelledError:
+                pass
+    return asyncio.run(main())
+
+
+class TestRunBatch:
+    """Test suite for running micro-batches."""
+    
+    def test_matches_single_functions(self):
+        """Test that grouped requests give the same results as the single functions."""
+        jobs = [
+            ("vigenere_encrypt", "english", "key", "Hello World"),
+            ("caesar_encrypt", "english", 3, "abc"),
+            ("vigenere_encrypt", "english", "key", "hello"),
+            ("vigenere_decrypt", "english", "key", "riivs"),
+            ("caesar_decrypt", "english", 3, "def"),
+            ("frequency", "english", True, "aab b"),
+            ("vigenere_encrypt", "hebrew", "מפתח", "שלום"),
+        ]
+        assert run_batch(jobs) == [
+            (True, vigenere_encrypt("english", "Hello World", "key")),
+            (True, caesar_encrypt("english", "abc", 3)),
+            (True, "riivs"),
+            (True, "hello"),
+            (True, "abc"),
+            (True, frequency_analysis("english", "aab b", ignore_spaces=True)),
+            (True, vigenere_encrypt("hebrew", "שלום", "מפתח")),
+        ]
+    
+    def test_errors_are_isolated(self):
+        """Test that a failing group does not fail the rest of the batch."""
+        results = run_batch([("caesar_decrypt", "english", "3", "abc"), ("caesar_encrypt", "english", 3, "abc")])
+        assert results[0][0] is False
+        assert results[1] == (True, "def")
+    
+    def test_parse_job(self):
+        """Test request validation."""
+        assert parse_job("/caesar/encrypt", b'{"text": "abc"}') == ("caesar_encrypt", "english", 3, "abc")
+        assert parse_job("/vigenere/decrypt", b'{"lang": "hebrew", "text": "x", "keyword": "k"}') == (
+            "vigenere_decrypt", "hebrew", "k", "x")
+        for body in [b'not json', b'[]', b'{"text": 5}', b'{"text": "a", "shift": "3"}', b'{"text": "a"}']:
+            with pytest.raises(ValueError):
+                parse_job("/caesar/encrypt" if b'shift' in body else "/vigenere/encrypt", body)
+
+
+class TestMicroBatcher:
+    """Test suite for the request batcher."""
+    
+    def test_batches_concurrent_requests(self):
+        """Test that concurrent requests are answered in few batches."""
+        async def main():
+            batcher = MicroBatcher(max_batch=100, max_delay=0.01)
+            batcher.start()
+            results = await asyncio.gather(*(
+                batcher.submit("caesar_encrypt", "english", 1, "a" * i) for i in range(50)))
+            await batcher.stop()
+            return results, batcher.stats
+        results, stats = asyncio.run(main())
+        assert results == ["b" * i for i in range(50)]
+        assert stats['batches'] < 5
+        assert stats['requests'] == 50
+    
+    def test_backpressure(self):
+        """Test that requests beyond max_pending are rejected."""
+        async def main():
+            batcher = MicroBatcher(max_pending=1)  # Not started, so the first request stays queued
+            first = asyncio.ensure_future(batcher.submit("caesar_encrypt", "english", 1, "a"))
+            await asyncio.sleep(0)
+            with pytest.raises(Overloaded):
+                await batcher.submit("caesar_encrypt", "english", 1, "b")
+            first.cancel()
+            return batcher.stats
+        assert asyncio.run(main())['rejected'] == 1
+
+
+class TestServer:
+    """End-to-end tests over HTTP."""
+    
+    def test_endpoints(self):
+        """Test every endpoint and the error responses."""
+        async def scenario(port):
+            return [
+                await request(port, "POST", "/vigenere/encrypt", {"text": "Hello World", "keyword": "Key"}),
+                await request(port, "POST", "/caesar/encrypt", {"lang": "english", "text": "abc", "shift": 1}),
+                await request(port, "POST", "/frequency", {"text": "aab"}),
+                await request(port, "GET", "/health"),
+                await request(port, "POST", "/unknown", {}),
+                await request(port, "GET", "/caesar/encrypt"),
+                await request(port, "POST", "/caesar/encrypt", raw_body=b'{bad json'),
+                await request(port, "POST", "/caesar/encrypt", {"text": "x" * 200}),
+                await request(port, "GET", "/stats"),
+            ]
+        responses = run_with_server(scenario, max_body=100)
+        assert responses[0] == (200, {"result": "RiivsxFsovh"})
+        assert responses[1] == (200, {"result": "bcd"})
+        assert responses[2][0] == 200 and responses[2][1]["result"]["a"] == 2
+        assert responses[3] == (200, {"status": "ok"})
+        assert [status for status, _ in responses[4:8]] == [404, 405, 400, 413]
+        assert responses[8][1]["requests"] == 3
+    
+    def test_invalid_content_length(self):
+        """Test that malformed and negative Content-Length headers are answered with 400."""
+        async def send(port, length):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(f"POST /caesar/encrypt HTTP/1.1\r\nContent-Length: {length}\r\n\r\nabc".encode('latin-1'))
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), timeout=5)
+            writer.close()
+            return int(response.split()[1])
+        
+        async def scenario(port):
+            return [await send(port, "-5"), await send(port, "five")]
+        assert run_with_server(scenario, workers=0) == [400, 400]
+    
+    @pytest.mark.parametrize("head", [
+        "GET /" + "x" * 70000 + " HTTP/1.1\r\n\r\n",
+        "GET /health HTTP/1.1\r\nX-Long: " + "x" * 70000 + "\r\n\r\n",
+    ])
+    def test_line_too_long(self, head):
+        """Test that a request line or header over the stream limit is answered with 400."""
+        async def scenario(port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(head.encode('latin-1'))
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), timeout=5)
+            writer.close()
+            return int(response.split()[1])
+        assert run_with_server(scenario, workers=0) == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
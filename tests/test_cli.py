@@ -0,0 +1,140 @@
+import json
+import pytest
+import subprocess
+import sys
+import os
+
+# Add the src directory to the Python path to import the cipher modules
+SRC = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, SRC)
+
+from caesar_encrypt import caesar_encrypt
+from cli import main
+from vigenere_cipher import vigenere_encrypt
+
+
+TEXT = "Hello, World! שלום\nThe quick brown fox jumps over the lazy dog.\n"
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / "in.txt"
+    path.write_bytes(TEXT.encode('utf-8'))
+    return path
+
+
+class TestCipherCommands:
+    """Test suite for the encrypt and decrypt subcommands."""
+
+    def test_vigenere_round_trip(self, input_file, tmp_path):
+        """Test that encrypt and decrypt match the library functions through files."""
+        encrypted = tmp_path / "enc.txt"
+        decrypted = tmp_path / "dec.txt"
+        assert main(["encrypt", "-k", "Key", "-i", str(input_file), "-o", str(encrypted)]) == 0
+        assert encrypted.read_bytes().decode('utf-8') == vigenere_encrypt('english', TEXT, "Key")
+        main(["decrypt", "-k", "Key", "-i", str(encrypted), "-o", str(decrypted)])
+        assert decrypted.read_bytes().decode('utf-8') == TEXT
+
+    def test_caesar_to_stdout(self, input_file, capsys):
+        """Test that the caesar cipher writes to stdout without an output file."""
+        main(["encrypt", "--cipher", "caesar", "-s", "5", "-i", str(input_file)])
+        assert capsys.readouterr().out == caesar_encrypt('english', TEXT, 5)
+
+    def test_mmap(self, input_file, tmp_path):
+        """Test that --mmap gives the same result as streaming."""
+        encrypted = tmp_path / "enc.txt"
+        main(["encrypt", "-k", "Key", "--mmap", "-i", str(input_file), "-o", str(encrypted)])
+        assert encrypted.read_bytes().decode('utf-8') == vigenere_encrypt('english', TEXT, "Key")
+
+    def test_missing_keyword(self, input_file):
+        """Test that the vigenere cipher requires a keyword."""
+        with pytest.raises(SystemExit):
+            main(["encrypt", "-i", str(input_file)])
+
+    def test_mmap_requires_files(self, input_file):
+        """Test that --mmap requires both an input and an output file."""
+        with pytest.raises(SystemExit):
+            main(["encrypt", "-k", "Key", "--mmap", "-i", str(input_file)])
+
+
+class TestAnalysisCommands:
+    """Test suite for the analyze and crib subcommands."""
+
+    def test_analyze_json(self, input_file, capsys):
+        """Test that analyze --json reports the frequency table and key lengths."""
+        main(["analyze", "-i", str(input_file), "--json", "--ignore-spaces", "--key-lengths", "3"])
+        report = json.loads(capsys.readouterr().out)
+        assert report['frequencies']['o'] == 6
+        assert ' ' not in report['frequencies']
+        assert len(report['key_lengths']) == 3
+
+    def test_analyze_break(self, tmp_path, capsys):
+        """Test that analyze --break recovers the keyword of a long ciphertext."""
+        with open(os.path.join(SRC, '..', 'assets', 'bible_en.txt'), 'r', encoding='utf-8') as file:
+            plaintext = file.read(20000)
+        path = tmp_path / "cipher.txt"
+        path.write_bytes(vigenere_encrypt('english', plaintext, "lemon").encode('utf-8'))
+        main(["analyze", "-i", str(path), "--break", "--json"])
+        report = json.loads(capsys.readouterr().out)
+        assert report['keys'][0]['key'] == "lemon"
+
+    def test_analyze_caesar(self, tmp_path, capsys):
+        """Test that analyze --caesar ranks the Caesar shift first."""
+        path = tmp_path / "cipher.txt"
+        path.write_bytes(caesar_encrypt('english', "Meet me at the north gate at noon.", 9).encode('utf-8'))
+        main(["analyze", "-i", str(path), "--caesar", "--json"])
+        report = json.loads(capsys.readouterr().out)
+        assert report['caesar'][0]['shift'] == 9
+        assert len(report['caesar']) == 5
+
+    def test_crib(self, tmp_path, capsys):
+        """Test that the crib subcommand prints the crib analysis."""
+        path = tmp_path / "cipher.txt"
+        path.write_bytes(vigenere_encrypt('english', "attack at dawn", "lemon").encode('utf-8'))
+        main(["crib", "-i", str(path), "--crib", "attack", "--top", "3"])
+        output = capsys.readouterr().out
+        assert "Vigenere Crib Search Analysis" in output
+        assert "lemonl" in output
+
+    def test_attack(self, tmp_path, capsys):
+        """Test that the attack subcommand ranks the keyword from the wordlist first."""
+        with open(os.path.join(SRC, '..', 'assets', 'bible_en.txt'), 'r', encoding='utf-8') as file:
+            plaintext = file.read(3000)
+        path = tmp_path / "cipher.txt"
+        path.write_bytes(vigenere_encrypt('english', plaintext, "lemon").encode('utf-8'))
+        wordlist = tmp_path / "words.txt"
+        wordlist.write_text("apple\nbanana\nlemon\ncherry\n", encoding='utf-8')
+        main(["attack", "-i", str(path), "-w", str(wordlist), "--workers", "1", "--json"])
+        results = json.loads(capsys.readouterr().out)
+        assert [result['key'] for result in results][0] == "lemon"
+        assert len(results) == 4
+
+    def test_solve(self, tmp_path, capsys):
+        """Test that the solve subcommand recovers the keyword and reports progress on stderr."""
+        with open(os.path.join(SRC, '..', 'assets', 'bible_en.txt'), 'r', encoding='utf-8') as file:
+            plaintext = file.read(300)
+        path = tmp_path / "cipher.txt"
+        path.write_bytes(vigenere_encrypt('english', plaintext, "lemon").encode('utf-8'))
+        main(["solve", "-i", str(path), "--time-budget", "1", "--seed", "0", "--json"])
+        captured = capsys.readouterr()
+        results = json.loads(captured.out)
+        assert results[0]['key'] == "lemon"
+        assert "lemon" in captured.err
+
+
+class TestLazyImports:
+    """Test suite for keeping the encryption path free of analysis imports."""
+
+    def test_encrypt_does_not_load_analysis(self):
+        """Test that importing and running the ciphers loads neither cyber_tools nor NumPy."""
+        code = (
+            "import sys; sys.path.insert(0, sys.argv[1])\n"
+            "import io, cli, vigenere_cipher, caesar_encrypt, bytes_cipher\n"
+            "sys.stdin = io.StringIO('Hello World')\n"
+            "sys.stdout = io.StringIO()\n"
+            "cli.main(['encrypt', '-k', 'key'])\n"
+            "sys.stdout = sys.__stdout__\n"
+            "print(','.join(name for name in ('cyber_tools', 'language_model', 'numpy') if name in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code, SRC], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == ""
@@ -0,0 +1,418 @@
+import io
+import pickle
+import types
+import pytest
+import sys
+import os
+
+# Add the src directory to the Python path to import cyber_tools
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from alphabets import get_alphabet, register_alphabet, unregister_alphabet
+from cyber_tools import (
+    FrequencyCounter,
+    CribMatches,
+    analyze_crib_results,
+    batch_crib_analysis,
+    batch_crib_search,
+    break_vigenere,
+    compact_crib_search,
+    estimate_key_length,
+    frequency_analysis,
+    index_of_coincidence,
+    iter_crib_search,
+    plot_frequency,
+    print_crib_analysis,
+    rank_key_lengths,
+    top_crib_fragments,
+    vigenere_crib_search
+)
+from vigenere_cipher import vigenere_encrypt
+
+
+def brute_force_crib_search(ciphertext, crib, lang):
+    """Straightforward sliding-window crib search used as the expected result."""
+    alphabet = get_alphabet(lang)
+    ciphertext = ciphertext.lower()
+    crib = crib.lower()
+    results = []
+    for i in range(len(ciphertext) - len(crib) + 1):
+        window = ciphertext[i:i + len(crib)]
+        if all(c in alphabet for c in window) and all(p in alphabet for p in crib):
+            key_fragment = ''.join(
+                alphabet[(alphabet.index(c) - alphabet.index(p)) % len(alphabet)] for c, p in zip(window, crib)
+            )
+            results.append((i, key_fragment, window))
+    return results
+
+
+@pytest.fixture(scope="module")
+def plaintext():
+    """A few thousand characters of the English Bible."""
+    with open('./assets/bible_en.txt', 'r', encoding='utf-8') as file:
+        return file.read()[5000:9000]
+
+
+class TestVigenereCribSearch:
+    """Test suite for vigenere_crib_search."""
+    
+    def test_finds_keyword(self, backend):
+        """Test that the crib reveals the key at the position it was encrypted."""
+        ciphertext = vigenere_encrypt("english", "attack at dawn", "lemon")
+        results = vigenere_crib_search(ciphertext, "attack", "english")
+        assert (0, "lemonl", ciphertext[:6].lower()) in results
+    
+    @pytest.mark.parametrize("lang,ciphertext,crib", [
+        ("english", "Hello, World! the quick brown fox", "the"),
+        ("english", "ab,cd efg-hij", "xy"),
+        ("english", "short", "longer crib"),
+        ("english", "abc", "a1"),  # Crib characters outside the alphabet never match
+        ("english", "abc", ""),
+        ("hebrew", "שלום עולם, מה שלומך?", "של"),
+    ])
+    def test_matches_brute_force(self, backend, lang, ciphertext, crib):
+        """Test the indexed search against a straightforward sliding window."""
+        assert vigenere_crib_search(ciphertext, crib, lang) == brute_force_crib_search(ciphertext, crib, lang)
+    
+    def test_unsupported_language(self, backend):
+        """Test that unsupported languages return no results."""
+        assert vigenere_crib_search("hola", "ho", "spanish") == []
+    
+    def test_lazy_results(self, backend):
+        """Test that lazy=True returns a generator with the same results."""
+        ciphertext = "the cat and the hat " * 50
+        results = vigenere_crib_search(ciphertext, "the", "english", lazy=True)
+        assert isinstance(results, types.GeneratorType)
+        assert list(results) == vigenere_crib_search(ciphertext, "the", "english")
+    
+    def test_small_blocks(self, backend):
+        """Test that results do not depend on the block size."""
+        ciphertext = "Hello, World! the quick brown fox " * 10
+        assert list(iter_crib_search(ciphertext, "fox", block_size=7)) == brute_force_crib_search(
+            ciphertext, "fox", "english")
+    
+    def test_jerusalem_asset(self, backend):
+        """Test the search on the encrypted Jerusalem history asset."""
+        with open('./assets/jeruslaem_history_encrypted.txt', 'r', encoding='utf-8') as file:
+            ciphertext = file.read()
+        assert vigenere_crib_search(ciphertext, "jerusalem", "english") == brute_force_crib_search(
+            ciphertext, "jerusalem", "english")
+
+    
+    def test_lone_surrogates(self, backend):
+        """Test ciphertexts with lone surrogates, e.g. read with errors='surrogateescape'."""
+        ciphertext = "abc\udc80 def the\ud800 the end"
+        assert vigenere_crib_search(ciphertext, "de", "english") == brute_force_crib_search(
+            ciphertext, "de", "english")
+        assert list(compact_crib_search(ciphertext, "the", "english")) == brute_force_crib_search(
+            ciphertext, "the", "english")
+        assert top_crib_fragments(ciphertext, "the", "english")['windows'] == len(
+            brute_force_crib_search(ciphertext, "the", "english"))
+        assert rank_key_lengths(ciphertext * 10, "english", 5)
+
+
+class TestBatchCribSearch:
+    """Test suite for batch_crib_search and batch_crib_analysis."""
+    
+    CRIBS = ["the", "then", "there", "and", "Jerusalem", "a", "x1", "", "the"]
+    
+    def test_matches_single_searches(self, backend):
+        """Test that each crib gets the same results as vigenere_crib_search."""
+        with open('./assets/jeruslaem_history_encrypted.txt', 'r', encoding='utf-8') as file:
+            ciphertext = file.read()
+        results = batch_crib_search(ciphertext, self.CRIBS, "english")
+        assert list(results) == list(dict.fromkeys(self.CRIBS))
+        for crib in self.CRIBS:
+            assert results[crib] == vigenere_crib_search(ciphertext, crib, "english")
+    
+    def test_hebrew_shared_prefixes(self, backend):
+        """Test cribs sharing a prefix in Hebrew."""
+        ciphertext = "שלום עולם, מה שלומך? שלום!"
+        cribs = ["של", "שלום", "שלומך"]
+        results = batch_crib_search(ciphertext, cribs, "hebrew")
+        for crib in cribs:
+            assert results[crib] == brute_force_crib_search(ciphertext, crib, "hebrew")
+    
+    def test_unsupported_language(self, backend):
+        """Test that unsupported languages give empty results for every crib."""
+        assert batch_crib_search("hola", ["ho", "la"], "spanish") == {"ho": [], "la": []}
+    
+    def test_batch_analysis(self, backend):
+        """Test per-crib and merged aggregates."""
+        ciphertext = vigenere_encrypt("english", "the theme and the end", "ab")
+        analysis = batch_crib_analysis(ciphertext, ["the", "and"], "english")
+        for crib in ["the", "and"]:
+            assert analysis['per_crib'][crib] == analyze_crib_results(analysis['results'][crib])
+        merged_total = sum(data['count'] for data in analysis['merged'].values())
+        assert merged_total == len(analysis['results']["the"]) + len(analysis['results']["and"])
+        assert analysis['merged']["aba"]['count'] >= 2  # "the" encrypted with key "ab" at even offsets
+
+
+class TestCompactCribResults:
+    """Test suite for compact_crib_search and top_crib_fragments."""
+    
+    @pytest.fixture
+    def ciphertext(self, plaintext):
+        return vigenere_encrypt("english", plaintext, "Jerusalem")
+    
+    @staticmethod
+    def expected_top(results, top_n):
+        key_counts = analyze_crib_results(results)
+        ranked = sorted(key_counts.items(), key=lambda item: item[1]['count'], reverse=True)[:top_n]
+        return [(fragment, data['count'], data['positions']) for fragment, data in ranked]
+    
+    @pytest.mark.parametrize("crib", ["the", "jerusalem", "in the beginning god", ""])
+    def test_matches_crib_search(self, ciphertext, backend, crib):
+        """Test that the compact matches iterate to the crib search results, also past the int64 packing."""
+        matches = compact_crib_search(ciphertext, crib, "english", block_size=100)
+        assert isinstance(matches, CribMatches)
+        assert list(matches) == vigenere_crib_search(ciphertext, crib, "english")
+        assert len(matches) == len(matches.positions) == len(matches.fragment_ids)
+        assert len(set(matches.fragments)) == len(matches.fragments)
+    
+    def test_compact_arrays(self, ciphertext, backend):
+        """Test that positions and fragment ids are stored as 32-bit arrays."""
+        matches = compact_crib_search(ciphertext, "the", "english")
+        for values in (matches.positions, matches.fragment_ids):
+            assert values.itemsize == 4
+    
+    def test_hebrew(self, backend):
+        """Test a Hebrew crib search."""
+        ciphertext = vigenere_encrypt("hebrew", "שלום עולם, שלום לכולם ושלום עליכם", "אבג")
+        assert list(compact_crib_search(ciphertext, "שלום", "hebrew")) == brute_force_crib_search(
+            ciphertext, "שלום", "hebrew")
+    
+    def test_unsupported_language(self, backend):
+        """Test that unsupported languages give no matches."""
+        assert len(compact_crib_search("hola", "ho", "spanish")) == 0
+        assert top_crib_fragments("hola", "ho", "spanish") == {'windows': 0, 'unique': 0, 'top': []}
+    
+    def test_counts_and_top_fragments(self, ciphertext, backend):
+        """Test the aggregates of the compact matches against analyze_crib_results."""
+        matches = compact_crib_search(ciphertext, "and", "english")
+        key_counts = analyze_crib_results(vigenere_crib_search(ciphertext, "and", "english"))
+        assert dict(zip(matches.fragments, matches.counts())) == {
+            fragment: data['count'] for fragment, data in key_counts.items()}
+        top = [(entry['fragment'], entry['count'], entry['positions']) for entry in matches.top_fragments(5)]
+        assert top == self.expected_top(vigenere_crib_search(ciphertext, "and", "english"), 5)
+        assert matches.positions_of("not a fragment") == []
+    
+    @pytest.mark.parametrize("crib", ["the", "jerusalem", "in the beginning god"])
+    def test_top_crib_fragments(self, ciphertext, backend, crib):
+        """Test the streaming top-k aggregation across block boundaries."""
+        results = vigenere_crib_search(ciphertext, crib, "english")
+        analysis = top_crib_fragments(ciphertext, crib, "english", top_n=8, max_positions=3, block_size=97)
+        assert analysis['windows'] == len(results)
+        assert analysis['unique'] == len(analyze_crib_results(results))
+        top = [(entry['fragment'], entry['count'], entry['positions']) for entry in analysis['top']]
+        assert top == [(fragment, count, positions[:3])
+                       for fragment, count, positions in self.expected_top(results, 8)]
+    
+    def test_print_crib_analysis(self, ciphertext, backend, capsys):
+        """Test that the printed analysis ranks the fragments like analyze_crib_results."""
+        print_crib_analysis(ciphertext, "the", "english", top_n=3)
+        output = capsys.readouterr().out
+        results = vigenere_crib_search(ciphertext, "the", "english")
+        assert f"Total possible positions: {len(results)}" in output
+        for fragment, count, positions in self.expected_top(results, 3):
+            line = f"{fragment:<20} {count:<10} {', '.join(map(str, positions[:5]))}"
+            assert line in output
+        print_crib_analysis("123", "the", "english")
+        assert "No matches found for the crib." in capsys.readouterr().out
+
+
+class TestKeyLengthEstimation:
+    """Test suite for Kasiski / index of coincidence key length estimation."""
+    
+    def test_index_of_coincidence(self):
+        """Test the IoC of simple count vectors."""
+        assert index_of_coincidence([2, 0, 0]) == 1.0
+        assert index_of_coincidence([1, 1, 0]) == 0.0
+        assert index_of_coincidence([1]) == 0.0
+    
+    @pytest.mark.parametrize("keyword", ["x", "ab", "key", "lemon", "jerusalem", "abcdefghijklmnopq"])
+    def test_recovers_key_length(self, backend, plaintext, keyword):
+        """Test that the keyword length is ranked first, ahead of its multiples."""
+        ciphertext = vigenere_encrypt("english", plaintext, keyword)
+        assert estimate_key_length(ciphertext, "english") == len(keyword)
+    
+    def test_hebrew_key_length(self, backend):
+        """Test key length estimation on Hebrew ciphertext."""
+        plaintext = "בראשית ברא אלהים את השמים ואת הארץ והארץ היתה תהו ובהו וחשך על פני תהום " * 10
+        ciphertext = vigenere_encrypt("hebrew", plaintext, "מפתח")
+        assert estimate_key_length(ciphertext, "hebrew") == 4
+    
+    def test_ranking_fields(self, backend, plaintext):
+        """Test the structure of the ranking."""
+        ranked = rank_key_lengths(vigenere_encrypt("english", plaintext, "lemon"), "english", max_length=12)
+        assert sorted(candidate['length'] for candidate in ranked) == list(range(1, 13))
+        assert all(set(candidate) == {'length', 'score', 'ioc', 'kasiski'} for candidate in ranked)
+        assert ranked[0]['score'] == max(candidate['score'] for candidate in ranked)
+    
+    def test_short_or_unsupported(self, backend):
+        """Test inputs too short to analyze and unsupported languages."""
+        assert estimate_key_length("a", "english") is None
+        assert rank_key_lengths("hola", "spanish") == []
+
+
+class TestBreakVigenere:
+    """Test suite for automatic key recovery with break_vigenere."""
+    
+    def test_jerusalem_asset(self, backend):
+        """Test that the key of the encrypted Jerusalem history asset is recovered."""
+        with open('./assets/jeruslaem_history_encrypted.txt', 'r', encoding='utf-8') as file:
+            ciphertext = file.read()
+        best = break_vigenere(ciphertext, "english")[0]
+        assert best['key'] == "himmelfarb"
+        assert best['plaintext'].startswith("Jewish History of jerusalem")
+    
+    @pytest.mark.parametrize("keyword", ["lemon", "jerusalem", "abcdefghijklmnopq"])
+    def test_recovers_keyword(self, backend, plaintext, keyword):
+        """Test key recovery on encrypted Bible text."""
+        ciphertext = vigenere_encrypt("english", plaintext, keyword)
+        results = break_vigenere(ciphertext, "english")
+        assert results[0]['key'] == keyword
+        assert results[0]['length'] == len(keyword)
+        assert [result['score'] for result in results] == sorted(result['score'] for result in results)
+    
+    def test_unsupported_or_empty(self, backend):
+        """Test unsupported languages and texts without alphabet characters."""
+        assert break_vigenere("hola", "spanish") == []
+        assert break_vigenere("123!", "english") == []
+
+
+class TestFrequencyAnalysisEngine:
+    """Test that frequency_analysis counts exactly like counting text.lower()."""
+    
+    @staticmethod
+    def lowered_counts(lang, text, ignore_spaces=False):
+        alphabet = get_alphabet(lang)
+        expected = {char: 0 for char in alphabet}
+        for char in text.lower():
+            if char in alphabet:
+                expected[char] += 1
+        if ignore_spaces:
+            expected.pop(' ')
+        return expected
+    
+    @pytest.mark.parametrize("lang,text", [
+        ("english", "Hello, World!"),
+        ("english", "\u212aelvin and \u0130stanbul"),  # Kelvin sign -> 'k', dotted I -> 'i' + combining dot
+        ("english", "\U0001F600 emoji and 123"),
+        ("english", "abc \udc80 surrogate \U0010FFFF"),  # Lone surrogate and the highest codepoint
+        ("english", ""),
+        ("hebrew", "שלום עולם! ABC"),
+    ])
+    def test_matches_lowered_counting(self, backend, lang, text):
+        """Test unusual characters against counting the lowercased text."""
+        assert frequency_analysis(lang, text) == self.lowered_counts(lang, text)
+        assert frequency_analysis(lang, text, ignore_spaces=True) == self.lowered_counts(lang, text, True)
+    
+    def test_en_bible(self, backend):
+        """Test both engines on the full English Bible."""
+        with open('./assets/bible_en.txt', 'r', encoding='utf-8') as file:
+            text = file.read()
+        assert frequency_analysis("english", text) == self.lowered_counts("english", text)
+
+
+class TestFrequencyCounter:
+    """Test suite for the incremental FrequencyCounter."""
+    
+    TEXT = "Hello, World! The quick brown fox jumps over the lazy dog.\n" * 20
+    
+    def test_chunks_match_frequency_analysis(self, backend):
+        """Test that chunked updates equal frequency_analysis on the whole text."""
+        counter = FrequencyCounter("english")
+        for start in range(0, len(self.TEXT), 37):
+            counter.update(self.TEXT[start:start + 37])
+        assert counter.to_dict() == frequency_analysis("english", self.TEXT)
+
+    @pytest.fixture
+    def greek(self):
+        """Register a Greek alphabet with 'σ' but without the final form 'ς'."""
+        register_alphabet("greek", "αβγδεζηθικλμνξοπρστυφχψω ")
+        yield "greek"
+        unregister_alphabet("greek")
+
+    @pytest.mark.parametrize("text, sigmas", [
+        ("ΑΣΑ", 1), ("ΑΣ ΑΣ", 0), ("ΟΔΟΣ ΣΑΣ", 1), ("ΑΣΣ", 1), ("Σ Α'Σ' Α", 1),
+    ])
+    def test_chunk_boundary_at_capital_sigma(self, backend, greek, text, sigmas):
+        """Test that a capital sigma lowercases by its neighbours across chunks."""
+        expected = frequency_analysis("greek", text)
+        assert expected["σ"] == sigmas
+        for split in range(len(text) + 1):
+            counter = FrequencyCounter("greek")
+            counter.update(text[:split])
+            assert counter.to_dict() == frequency_analysis("greek", text[:split])
+            counter.update(text[split:])
+            assert counter.to_dict() == expected
+            merged = FrequencyCounter("greek") + counter
+            assert merged == counter
+
+    @pytest.mark.parametrize("text", [
+        "αΣα", "αΣΣ", "ΣΣα", "ΣΣΣ", "Σ", "ΟΔΟΣ ΣΑΣ, ΕΙΣ ΤΟΝ ΚΟΣΜΟΝ. Ο'Σ'Σ' ΣΑ",
+    ])
+    def test_one_character_at_a_time(self, backend, greek, text):
+        """Test that every cut matches frequency_analysis, not just one."""
+        counter = FrequencyCounter("greek")
+        for char in text:
+            counter.update(char)
+        assert counter.to_dict() == frequency_analysis("greek", text)
+
+    def test_ignore_spaces(self, backend):
+        """Test that ignore_spaces behaves like frequency_analysis."""
+        counter = FrequencyCounter("hebrew", ignore_spaces=True)
+        counter.update("שלום עולם")
+        assert counter.to_dict() == frequency_analysis("hebrew", "שלום עולם", ignore_spaces=True)
+        assert counter.total == 8
+    
+    def test_merge(self, backend):
+        """Test that counters built separately can be added together."""
+        first = FrequencyCounter("english")
+        first.update(self.TEXT[:500])
+        second = FrequencyCounter("english")
+        second.update(self.TEXT[500:])
+        merged = first + second
+        assert merged.to_dict() == frequency_analysis("english", self.TEXT)
+        assert first.to_dict() == frequency_analysis("english", self.TEXT[:500])  # + does not modify operands
+        first += second
+        assert first == merged
+    
+    def test_merge_pickled(self, backend):
+        """Test that counters survive pickling, as when returned from worker processes."""
+        counter = FrequencyCounter("english")
+        counter.update(self.TEXT)
+        assert pickle.loads(pickle.dumps(counter)) == counter
+    
+    def test_merge_different_languages(self):
+        """Test that counters for different languages cannot be merged."""
+        with pytest.raises(ValueError):
+            FrequencyCounter("english") + FrequencyCounter("hebrew")
+        with pytest.raises(TypeError):
+            FrequencyCounter("english") + {'a': 1}
+    
+    def test_update_stream(self, backend):
+        """Test counting a file object chunk by chunk."""
+        counter = FrequencyCounter("english")
+        counter.update_stream(io.StringIO(self.TEXT), chunk_size=10)
+        assert counter.to_dict() == frequency_analysis("english", self.TEXT)
+    
+    def test_plot_matches_plot_frequency(self, capsys):
+        """Test that plot() prints the same chart as plot_frequency."""
+        plot_frequency("english", self.TEXT, "Title", ignore_spaces=True)
+        expected = capsys.readouterr().out
+        counter = FrequencyCounter("english", ignore_spaces=True)
+        counter.update(self.TEXT)
+        counter.plot("Title")
+        assert capsys.readouterr().out == expected
+    
+    def test_unsupported_language(self):
+        """Test that unsupported languages give an empty dict like frequency_analysis."""
+        counter = FrequencyCounter("spanish")
+        counter.update("hola")
+        assert counter.to_dict() == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
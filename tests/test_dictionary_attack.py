@@ -0,0 +1,121 @@
+import pytest
+import random
+import sys
+import os
+
+# Add the src directory to the Python path to import the cipher modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import array_backend
+import language_model
+from dictionary_attack import _PrefixScorer, dictionary_attack, read_wordlist
+from language_model import encode_text, get_ngram_model
+from vigenere_cipher import get_cipher, vigenere_decrypt, vigenere_encrypt
+
+
+@pytest.fixture(scope="module")
+def plaintext():
+    """A few thousand characters of the English Bible."""
+    with open('./assets/bible_en.txt', 'r', encoding='utf-8') as file:
+        return file.read()[5000:8000]
+
+
+@pytest.fixture(scope="module")
+def words():
+    """Random candidate keywords, with the real keyword among them."""
+    rng = random.Random(0)
+    words = [''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=rng.randint(3, 10))) for _ in range(5000)]
+    words.insert(3210, "Jerusalem")
+    return words
+
+
+class TestDictionaryAttack:
+    """Test suite for dictionary_attack."""
+    
+    def test_finds_keyword(self, plaintext, words, backend):
+        """Test that the real keyword ranks first and its full decryption is returned."""
+        ciphertext = vigenere_encrypt("english", plaintext, "Jerusalem")
+        results = dictionary_attack(ciphertext, words, top_n=5, workers=1, chunk_size=1000)
+        assert len(results) == 5
+        assert results[0]['key'] == "Jerusalem"
+        assert results[0]['plaintext'] == vigenere_decrypt("english", ciphertext, "Jerusalem")
+        assert results[0]['score'] > results[1]['score'] + 1
+        assert results[0]['prefix_score'] > results[1]['prefix_score']
+    
+    def test_wordlist_file_in_process_pool(self, plaintext, words, tmp_path):
+        """Test streaming the candidates from a wordlist file through worker processes."""
+        path = tmp_path / "words.txt"
+        path.write_text("\n".join(words[:2000] + ["", "  "] + words[2000:]) + "\n", encoding="utf-8")
+        assert list(read_wordlist(str(path))) == words
+        
+        ciphertext = vigenere_encrypt("english", plaintext, "Jerusalem")
+        results = dictionary_attack(ciphertext, read_wordlist(str(path)), top_n=3, workers=2, chunk_size=700)
+        assert results[0]['key'] == "Jerusalem"
+    
+    def test_equivalent_keys_appear_once(self, plaintext):
+        """Test that keywords that decrypt to the same text are reported once."""
+        ciphertext = vigenere_encrypt("english", plaintext, "lemon")
+        results = dictionary_attack(ciphertext, ["LEMONlemon", "le-mon", "lemon", "apple"], workers=1)
+        assert [result['key'] for result in results] == ["LEMONlemon", "apple"]
+    
+    def test_nothing_to_attack(self, words):
+        """Test unsupported languages, empty inputs and invalid arguments."""
+        assert dictionary_attack("hola", words, lang="spanish", workers=1) == []
+        assert dictionary_attack("123!?", words, workers=1) == []
+        assert dictionary_attack("some text", [], workers=1) == []
+        assert dictionary_attack("some text", ["123", "!?"], workers=1) == []
+        with pytest.raises(ValueError):
+            dictionary_attack("some text", words, top_n=0)
+    
+    def test_hebrew_unigram_fallback(self, monkeypatch):
+        """Test that Hebrew is attacked with the built-in unigram model when there is no corpus."""
+        monkeypatch.setitem(language_model.CORPORA, "hebrew", "/nonexistent/bible_he.txt")
+        plaintext = "בראשית ברא אלהים את השמים ואת הארץ והארץ היתה תהו ובהו וחשך על פני תהום" * 3
+        ciphertext = vigenere_encrypt("hebrew", plaintext, "ירושלים")
+        results = dictionary_attack(ciphertext, ["שלום", "ירושלים", "אבג", "תורה"], lang="hebrew", workers=1)
+        assert results[0]['key'] == "ירושלים"
+
+
+class TestPrefixScorer:
+    """Test suite for cleaning and scoring candidate keywords."""
+    
+    @pytest.fixture
+    def scorer(self, plaintext):
+        ciphertext = vigenere_encrypt("english", plaintext, "Jerusalem")
+        return _PrefixScorer("english", [int(index) for index in encode_text("english", ciphertext)[:64]], 5)
+    
+    def test_clean_matches_cipher(self, scorer):
+        """Test that keywords are cleaned exactly like the cipher cleans them."""
+        for word in ["Jerusalem", "New York", "r2-d2", "Kelvin", "ÉCOLE", "abcabc", "aa"]:
+            shifts = get_cipher("english", word).shifts
+            key = scorer.clean(word)
+            assert shifts == [ord(char) for char in key] * (len(shifts) // max(len(key), 1))
+        assert scorer.clean("abcabc") == "\x00\x01\x02"
+        assert scorer.clean("1234") == ""
+    
+    def test_log_likelihood_and_early_abort(self, scorer, backend):
+        """Test the prefix score against the n-gram model, and that a bound stops scoring."""
+        key = scorer.clean("Jerusalem")
+        plain = [(symbol - ord(key[i % len(key)])) % scorer.size for i, symbol in enumerate(scorer.prefix)]
+        expected = get_ngram_model("english").log_likelihood(plain)
+        assert scorer.log_likelihood(key, len(plain)) == pytest.approx(expected)
+        assert scorer.log_likelihood(key, len(plain), bound=expected + 1) is None
+    
+    def test_backends_agree(self, scorer, words, monkeypatch):
+        """Test that the NumPy and pure Python scorers keep the same candidates."""
+        pytest.importorskip("numpy")
+        expected = sorted(scorer.score_words(words, float('-inf')))
+        monkeypatch.setattr(array_backend, "is_available", lambda: False)
+        result = sorted(_PrefixScorer("english", scorer.prefix, 5).score_words(words, float('-inf')))
+        assert [entry[2] for entry in result] == [entry[2] for entry in expected]
+        assert [entry[0] for entry in result] == pytest.approx([entry[0] for entry in expected])
+    
+    def test_threshold_drops_candidates(self, scorer, words):
+        """Test that candidates below the threshold are not returned."""
+        results = scorer.score_words(words, float('-inf'))
+        best = max(total for total, _, _ in results)
+        assert [word for _, _, word in scorer.score_words(words, best)] == ["Jerusalem"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,94 @@
+import pytest
+import sys
+import os
+
+# Add the src directory to the Python path to import the cipher modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import caesar_encrypt
+import cyber_tools
+import instrumentation
+import vigenere_cipher
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    """Leave instrumentation disabled and empty after every test."""
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    """Test suite for the opt-in instrumentation layer."""
+    
+    def test_disabled_by_default(self):
+        """Test that nothing is wrapped unless instrumentation is enabled."""
+        original = vigenere_cipher.vigenere_encrypt
+        assert not instrumentation.is_enabled()
+        instrumentation.enable()
+        assert vigenere_cipher.vigenere_encrypt is not original
+        assert vigenere_cipher.vigenere_encrypt.__wrapped__ is original
+        instrumentation.disable()
+        assert vigenere_cipher.vigenere_encrypt is original
+        assert not instrumentation.is_enabled()
+    
+    def test_records_calls(self):
+        """Test call counts, input sizes and timings."""
+        with instrumentation.instrumented():
+            vigenere_cipher.vigenere_encrypt("english", "hello world", "key")
+            vigenere_cipher.vigenere_encrypt("english", "abc", "key")
+            caesar_encrypt.caesar_encrypt_many("english", ["abc", "de"], 3)
+            cyber_tools.frequency_analysis("english", text="hello")
+        vigenere_cipher.vigenere_encrypt("english", "not recorded", "key")
+        
+        functions = instrumentation.get_stats()['functions']
+        encrypt = functions['vigenere_cipher.vigenere_encrypt']
+        assert encrypt['calls'] == 2
+        assert encrypt['chars'] == 14
+        assert encrypt['seconds'] >= encrypt['max_seconds'] > 0
+        assert encrypt['chars_per_second'] > 0
+        assert functions['vigenere_cipher.get_cipher']['calls'] == 2  # Called through the module
+        assert functions['caesar_encrypt.caesar_encrypt_many']['chars'] == 5
+        assert functions['cyber_tools.frequency_analysis']['chars'] == 5
+        assert 'vigenere_cipher.vigenere_decrypt' not in functions
+        
+        instrumentation.reset()
+        assert instrumentation.get_stats()['functions'] == {}
+    
+    def test_cache_stats(self):
+        """Test that cache counters are included."""
+        caches = instrumentation.get_stats()['caches']
+        assert set(caches) == {'alphabet', 'key_schedule'}
+        assert {'hits', 'misses', 'size', 'maxsize'} <= set(caches['key_schedule'])
+    
+    def test_exceptions_are_recorded_and_raised(self):
+        """Test that a failing call is still counted and its exception propagates."""
+        with instrumentation.instrumented():
+            with pytest.raises(ValueError):
+                vigenere_cipher.vigenere_encrypt("english", "abc", "key", backend="gpu")
+        assert instrumentation.get_stats()['functions']['vigenere_cipher.vigenere_encrypt']['calls'] == 1
+    
+    def test_prometheus_export(self):
+        """Test the Prometheus text format."""
+        with instrumentation.instrumented():
+            vigenere_cipher.vigenere_encrypt("english", "hello", "key")
+        text = instrumentation.to_prometheus()
+        assert '# TYPE vigenere_calls_total counter' in text
+        assert 'vigenere_calls_total{function="vigenere_cipher.vigenere_encrypt"} 1' in text
+        assert 'vigenere_input_chars_total{function="vigenere_cipher.vigenere_encrypt"} 5' in text
+        assert 'vigenere_cache_hits_total{cache="key_schedule"}' in text
+        assert text.endswith('\n')
+    
+    def test_profile_and_trace_memory(self):
+        """Test the cProfile and tracemalloc hooks."""
+        result, report = instrumentation.profile(vigenere_cipher.vigenere_encrypt, "english", "hello" * 100, "key")
+        assert result == vigenere_cipher.vigenere_encrypt("english", "hello" * 100, "key")
+        assert '_transform' in report
+        result, memory = instrumentation.trace_memory(cyber_tools.frequency_analysis, "english", "hello")
+        assert result['l'] == 2
+        assert memory['peak'] >= 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
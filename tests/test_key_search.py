@@ -0,0 +1,123 @@
+import pytest
+import random
+import sys
+import os
+
+# Add the src directory to the Python path to import the cipher modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import language_model
+from key_search import _KeySearch, solve_vigenere
+from language_model import encode_text, get_ngram_model
+from vigenere_cipher import vigenere_decrypt, vigenere_encrypt
+
+
+def is_rotation(key, keyword):
+    return len(key) == len(keyword) and key in keyword + keyword
+
+
+@pytest.fixture(scope="module")
+def paragraphs():
+    """Paragraphs of the encrypted Jerusalem history asset (keyword 'himmelfarb')."""
+    with open('./assets/jeruslaem_history_encrypted.txt', 'r', encoding='utf-8') as file:
+        return [paragraph for paragraph in file.read().split('\n\n') if len(paragraph) > 100]
+
+
+@pytest.fixture(scope="module")
+def plaintext():
+    """A short passage of the English Bible."""
+    with open('./assets/bible_en.txt', 'r', encoding='utf-8') as file:
+        return file.read()[5000:5200]
+
+
+class TestKeySearch:
+    """Test suite for the incremental fitness and the hill climbing of one key length."""
+    
+    @pytest.fixture
+    def search(self, plaintext):
+        ciphertext = vigenere_encrypt("english", plaintext, "lemon")
+        return _KeySearch(get_ngram_model("english"), list(encode_text("english", ciphertext)), 5)
+    
+    def test_fitness_matches_model(self, search, backend):
+        """Test that the fitness of a key is the model log-likelihood of its decryption."""
+        key = [3, 1, 4, 1, 5]
+        plain = search.decrypt(key)
+        assert search.fitness(plain) == pytest.approx(get_ngram_model("english").log_likelihood(list(plain)))
+    
+    def test_column_scores_are_incremental_fitness(self, search, backend):
+        """Test that column score differences equal the full fitness differences."""
+        rng = random.Random(0)
+        key = [rng.randrange(search.size) for _ in range(search.length)]
+        base = search.fitness(search.decrypt(key))
+        for j in range(search.length):
+            scores = search.column_scores(search.decrypt(key), j)
+            for shift in (0, 7, 26):
+                changed = key[:j] + [shift] + key[j + 1:]
+                expected = search.fitness(search.decrypt(changed)) - base
+                assert scores[shift] - scores[key[j]] == pytest.approx(expected)
+    
+    def test_climb_improves(self, search, backend):
+        """Test that climbing never lowers the fitness and ends in a local optimum."""
+        key = [0] * search.length
+        fitness, climbed = search.climb(key)
+        assert fitness >= search.fitness(search.decrypt(key))
+        assert search.climb(climbed) == (pytest.approx(fitness), climbed)
+    
+    def test_search_recovers_key(self, search, backend):
+        """Test that a short search recovers the key of a 200 character text."""
+        fitness, key, climbs = search.search(random.Random(1), 0.5)
+        assert key == [ord(char) - ord('a') for char in "lemon"]
+        assert climbs >= 1
+
+
+class TestSolveVigenere:
+    """Test suite for solve_vigenere."""
+    
+    def test_paragraphs_of_asset(self, paragraphs):
+        """Test that individual paragraphs, too short for break_vigenere, are solved."""
+        pytest.importorskip("numpy")
+        for paragraph in paragraphs[:3]:
+            best = solve_vigenere(paragraph, time_budget=1.0, seed=0)[0]
+            assert is_rotation(best['key'], "himmelfarb")
+            assert best['plaintext'] == vigenere_decrypt("english", paragraph, best['key'])
+    
+    def test_best_so_far_callback(self, plaintext, backend):
+        """Test that the callback reports ever better keys, ending with the returned one."""
+        reports = []
+        ciphertext = vigenere_encrypt("english", plaintext, "lemon")
+        results = solve_vigenere(ciphertext, key_lengths=[3, 5, 7], time_budget=0.5, seed=0, callback=reports.append)
+        assert results[0]['key'] == "lemon"
+        scores = [report['score'] for report in reports]
+        assert scores == sorted(scores) and len(set(scores)) == len(scores)
+        assert reports[-1]['key'] == "lemon" and reports[-1]['score'] == pytest.approx(results[0]['score'])
+        assert [result['score'] for result in results] == sorted((result['score'] for result in results), reverse=True)
+    
+    def test_repeated_key_is_reduced(self, plaintext):
+        """Test that a key length that is a multiple of the real one gives the real keyword."""
+        ciphertext = vigenere_encrypt("english", plaintext, "lemon")
+        results = solve_vigenere(ciphertext, key_lengths=[10], time_budget=0.3, seed=0)
+        assert results[0]['key'] == "lemon" and results[0]['length'] == 5
+    
+    def test_parallel_workers(self, plaintext):
+        """Test the search in worker processes."""
+        ciphertext = vigenere_encrypt("english", plaintext, "lemon")
+        results = solve_vigenere(ciphertext, key_lengths=[4, 5, 6], time_budget=0.5, workers=2, seed=0)
+        assert results[0]['key'] == "lemon"
+    
+    def test_hebrew_unigram_fallback(self, monkeypatch):
+        """Test that Hebrew without a corpus is searched with the unigram model."""
+        monkeypatch.setitem(language_model.CORPORA, "hebrew", "/nonexistent/bible_he.txt")
+        plaintext = "בראשית ברא אלהים את השמים ואת הארץ והארץ היתה תהו ובהו וחשך על פני תהום" * 4
+        ciphertext = vigenere_encrypt("hebrew", plaintext, "שלום")
+        results = solve_vigenere(ciphertext, "hebrew", key_lengths=[4], time_budget=0.1)
+        assert results[0]['key'] == "שלום"
+    
+    def test_nothing_to_solve(self):
+        """Test unsupported languages and texts without alphabet characters."""
+        assert solve_vigenere("hola", "spanish") == []
+        assert solve_vigenere("123!?", "english") == []
+        assert solve_vigenere("abc", "english", key_lengths=[5]) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
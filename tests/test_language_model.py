@@ -0,0 +1,192 @@
+import json
+import math
+import pytest
+import sys
+import os
+
+# Add the src directory to the Python path to import language_model
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import array_backend
+import language_model
+from alphabets import english_alphabet, hebrew_alphabet
+from cyber_tools import frequency_analysis
+from vigenere_cipher import vigenere_encrypt
+
+
+class TestLetterCounts:
+    """Tests for corpus letter counts and their on-disk cache."""
+    
+    def test_counts_match_frequency_analysis(self, tmp_path, monkeypatch, cache_dir):
+        """Test that counts come from frequency_analysis and are written to the cache."""
+        corpus = tmp_path / "corpus.txt"
+        corpus.write_text("Hello World, hello!", encoding="utf-8")
+        monkeypatch.setitem(language_model.CORPORA, "english", str(corpus))
+        
+        counts = language_model.get_letter_counts("english")
+        assert counts == frequency_analysis("english", "Hello World, hello!")
+        
+        with open(cache_dir / "english_unigram.json", encoding="utf-8") as file:
+            cached = json.load(file)
+        assert cached['corpus_hash'] == language_model.corpus_hash(str(corpus))
+        assert cached['counts'] == [counts[char] for char in english_alphabet]
+    
+    def test_cache_is_used(self, tmp_path, monkeypatch, cache_dir):
+        """Test that a cache entry with a matching hash is used instead of recounting."""
+        corpus = tmp_path / "corpus.txt"
+        corpus.write_text("abc", encoding="utf-8")
+        monkeypatch.setitem(language_model.CORPORA, "english", str(corpus))
+        language_model.get_letter_counts("english")
+        
+        cache_file = cache_dir / "english_unigram.json"
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        cached['counts'] = [7] * len(english_alphabet)
+        cache_file.write_text(json.dumps(cached), encoding="utf-8")
+        assert language_model.get_letter_counts("english")['a'] == 7
+    
+    def test_cache_invalidated_when_corpus_changes(self, tmp_path, monkeypatch):
+        """Test that changing the corpus changes the counts."""
+        corpus = tmp_path / "corpus.txt"
+        corpus.write_text("aaa", encoding="utf-8")
+        monkeypatch.setitem(language_model.CORPORA, "english", str(corpus))
+        assert language_model.get_letter_counts("english")['a'] == 3
+        corpus.write_text("aaaaa b", encoding="utf-8")
+        assert language_model.get_letter_counts("english")['a'] == 5
+    
+    def test_builtin_hebrew_counts(self, monkeypatch):
+        """Test the built-in Hebrew counts when no Hebrew corpus is available."""
+        monkeypatch.setitem(language_model.CORPORA, "hebrew", "/nonexistent/bible_he.txt")
+        counts = language_model.get_letter_counts("hebrew")
+        assert list(counts) == hebrew_alphabet
+    
+    def test_unsupported_language(self):
+        """Test that unsupported languages have no counts or profile."""
+        assert language_model.get_letter_counts("spanish") is None
+        assert language_model.get_profile("spanish") is None
+
+
+class TestProfile:
+    """Tests for the smoothed reference profile."""
+    
+    def test_profile_is_distribution(self):
+        """Test that the profile sums to 1 and has no zero entries."""
+        profile = language_model.get_profile("english")
+        assert len(profile) == len(english_alphabet)
+        assert sum(profile) == pytest.approx(1.0)
+        assert min(profile) > 0
+        # Space and 'e' are the most common symbols in English text
+        assert profile[english_alphabet.index(' ')] > profile[english_alphabet.index('e')] > profile[
+            english_alphabet.index('z')]
+
+
+class TestNGramModel:
+    """Tests for the n-gram counts, their binary cache and log-likelihood scoring."""
+    
+    @pytest.fixture
+    def corpus(self, tmp_path, monkeypatch):
+        path = tmp_path / "corpus.txt"
+        path.write_text("The cat sat on the mat.\nThe dog sat on the log.", encoding="utf-8")
+        monkeypatch.setitem(language_model.CORPORA, "english", str(path))
+        return path
+    
+    def test_encode_text(self):
+        """Test that encoding lowercases and drops characters outside the alphabet."""
+        assert list(language_model.encode_text("english", "Ab, c!")) == [0, 1, 26, 2]
+        assert language_model.encode_text("spanish", "abc") is None
+    
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_counts_match_brute_force(self, corpus, monkeypatch, numpy):
+        """Test the n-gram counts against counting every window of the encoded corpus."""
+        if numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(array_backend, "is_available", lambda: False)
+        model = language_model.get_ngram_model("english")
+        indices = list(language_model.encode_text("english", corpus.read_text(encoding="utf-8")))
+        size = len(english_alphabet)
+        for order in range(1, 4):
+            expected = [0] * size ** order
+            for i in range(len(indices) - order + 1):
+                code = 0
+                for index in indices[i:i + order]:
+                    code = code * size + index
+                expected[code] += 1
+            assert list(model.counts[order - 1]) == expected
+    
+    def test_cache_is_written_and_used(self, corpus, cache_dir):
+        """Test that the counts are stored as binary arrays and read back instead of recounting."""
+        language_model.get_ngram_model("english")
+        meta = json.loads((cache_dir / "english_ngrams.json").read_text(encoding="utf-8"))
+        assert meta['corpus_hash'] == language_model.corpus_hash(str(corpus))
+        trigram_file = cache_dir / "english_3gram.bin"
+        assert trigram_file.stat().st_size == 8 * len(english_alphabet) ** 3
+        
+        unigram_file = cache_dir / "english_1gram.bin"
+        unigram_file.write_bytes((7).to_bytes(8, sys.byteorder) * len(english_alphabet))
+        language_model.get_ngram_model.cache_clear()
+        assert list(language_model.get_ngram_model("english", 1).counts[0]) == [7] * len(english_alphabet)
+    
+    def test_cache_invalidated_when_corpus_changes(self, corpus):
+        """Test that changing the corpus recounts the n-grams."""
+        assert language_model.get_ngram_model("english").counts[0][0] == 4
+        corpus.write_text("aaaa", encoding="utf-8")
+        language_model.get_ngram_model.cache_clear()
+        model = language_model.get_ngram_model("english")
+        assert model.counts[0][0] == 4 and model.counts[2][0] == 2
+    
+    def test_damaged_cache_is_rebuilt(self, corpus, cache_dir):
+        """Test that a truncated array file is recounted."""
+        expected = list(language_model.get_ngram_model("english").counts[1])
+        (cache_dir / "english_2gram.bin").write_bytes(b"\0" * 10)
+        language_model.get_ngram_model.cache_clear()
+        assert list(language_model.get_ngram_model("english").counts[1]) == expected
+    
+    def test_conditional_probabilities_sum_to_one(self, corpus):
+        """Test that every context has a proper smoothed distribution of next characters."""
+        model = language_model.get_ngram_model("english")
+        size = model.size
+        for table in model.log_probabilities:
+            table = list(table)
+            for start in range(0, len(table), size * 37):
+                assert sum(math.exp(value) for value in table[start:start + size]) == pytest.approx(1.0)
+    
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_log_likelihood_is_chain_rule(self, corpus, monkeypatch, numpy):
+        """Test that the log-likelihood adds the conditional probability of every character."""
+        if numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(array_backend, "is_available", lambda: False)
+        model = language_model.get_ngram_model("english")
+        indices = list(language_model.encode_text("english", "the cat"))
+        size = model.size
+        expected = 0.0
+        for i in range(len(indices)):
+            context = indices[max(0, i - 2):i + 1]
+            code = 0
+            for index in context:
+                code = code * size + index
+            expected += model.log_probabilities[len(context) - 1][code]
+        assert model.log_likelihood(indices) == pytest.approx(expected)
+        assert model.score(indices) == pytest.approx(expected / len(indices))
+        assert model.score([]) == float('-inf')
+    
+    def test_plaintext_scores_higher_than_ciphertext(self):
+        """Test that English scores higher than its Vigenère encryption under the Bible model."""
+        model = language_model.get_ngram_model("english")
+        plaintext = "And God said, Let there be light: and there was light."
+        assert model.score_text(plaintext) > model.score_text(vigenere_encrypt("english", plaintext, "lemon")) + 1
+    
+    def test_without_corpus(self, monkeypatch):
+        """Test that only the unigram model of the built-in counts exists without a corpus."""
+        monkeypatch.setitem(language_model.CORPORA, "hebrew", "/nonexistent/bible_he.txt")
+        assert language_model.get_ngram_model("hebrew") is None
+        unigram = language_model.get_ngram_model("hebrew", 1)
+        assert list(unigram.counts[0]) == [language_model.BUILTIN_COUNTS["hebrew"][char] for char in hebrew_alphabet]
+        assert language_model.get_ngram_model("spanish") is None
+        with pytest.raises(ValueError):
+            language_model.get_ngram_model("english", 4)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
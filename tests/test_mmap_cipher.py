@@ -0,0 +1,143 @@
+import pytest
+import sys
+import os
+
+# Add the src directory to the Python path to import the cipher modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from caesar_encrypt import caesar_encrypt
+import caesar_encrypt as caesar_module
+from mmap_cipher import (
+    caesar_decrypt_file,
+    caesar_encrypt_file,
+    iter_windows,
+    utf8_boundary,
+    vigenere_decrypt_file,
+    vigenere_encrypt_file
+)
+from reference_cipher import reference_vigenere_decrypt, reference_vigenere_encrypt
+import vigenere_cipher as vigenere_module
+
+
+MIXED_TEXT = "שלום עולם! Hello, World.\r\nThe Kelvin sign and 😀 emoji.\n" * 50
+
+
+def write_text(path, text):
+    path.write_bytes(text.encode('utf-8'))
+    return str(path)
+
+
+def read_text(path):
+    return path.read_bytes().decode('utf-8')
+
+
+class TestWindows:
+    """Test suite for splitting UTF-8 buffers at character boundaries."""
+    
+    def test_utf8_boundary(self):
+        """Test that offsets inside multibyte characters move back to the character start."""
+        data = "aש😀".encode('utf-8')  # 1 + 2 + 4 bytes
+        assert [utf8_boundary(data, pos) for pos in range(len(data))] == [0, 1, 1, 3, 3, 3, 3]
+    
+    @pytest.mark.parametrize("window_size", [1, 2, 3, 5, 64])
+    def test_windows_decode(self, window_size):
+        """Test that every window is valid UTF-8 and the windows cover the buffer."""
+        data = MIXED_TEXT[:200].encode('utf-8')
+        windows = list(iter_windows(data, len(data), window_size))
+        assert windows[0][0] == 0 and windows[-1][1] == len(data)
+        assert all(end == next_start for (_, end), (next_start, _) in zip(windows, windows[1:]))
+        assert ''.join(data[start:end].decode('utf-8') for start, end in windows) == MIXED_TEXT[:200]
+
+
+class TestMappedFiles:
+    """Test suite for memory-mapped file encryption."""
+    
+    @pytest.mark.parametrize("lang", ["english", "hebrew"])
+    @pytest.mark.parametrize("window_size", [7, 100, 4096])
+    def test_vigenere_matches_reference(self, tmp_path, lang, window_size):
+        """Test that the mapped output equals vigenere_encrypt/vigenere_decrypt on the whole text."""
+        source = write_text(tmp_path / "plain.txt", MIXED_TEXT)
+        written = vigenere_encrypt_file(lang, source, str(tmp_path / "enc.txt"), "מפתח key", window_size=window_size)
+        encrypted = read_text(tmp_path / "enc.txt")
+        assert encrypted == reference_vigenere_encrypt(lang, MIXED_TEXT, "מפתח key")
+        assert written == len(encrypted.encode('utf-8'))
+        vigenere_decrypt_file(lang, str(tmp_path / "enc.txt"), str(tmp_path / "dec.txt"), "מפתח key",
+                              window_size=window_size)
+        assert read_text(tmp_path / "dec.txt") == reference_vigenere_decrypt(lang, encrypted, "מפתח key")
+    
+    def test_output_grows(self, tmp_path):
+        """Test Hebrew text whose encrypted form is longer in bytes than the input."""
+        text = " " * 10000  # Spaces (1 byte) encrypt to Hebrew letters (2 bytes)
+        source = write_text(tmp_path / "plain.txt", text)
+        vigenere_encrypt_file("hebrew", source, str(tmp_path / "enc.txt"), "מפתח", window_size=512)
+        assert read_text(tmp_path / "enc.txt") == reference_vigenere_encrypt("hebrew", text, "מפתח")
+        assert (tmp_path / "enc.txt").stat().st_size == 20000
+        # Growth that starts in the middle of the text
+        text = "abc" * 1000 + " " * 5000
+        source = write_text(tmp_path / "plain.txt", text)
+        assert vigenere_encrypt_file("hebrew", source, str(tmp_path / "enc.txt"), "מפתח", window_size=512) == 13000
+        assert read_text(tmp_path / "enc.txt") == reference_vigenere_encrypt("hebrew", text, "מפתח")
+    
+    def test_caesar(self, tmp_path):
+        """Test Caesar encryption and decryption through memory maps."""
+        source = write_text(tmp_path / "plain.txt", MIXED_TEXT)
+        for lang in ["english", "hebrew"]:
+            caesar_encrypt_file(lang, source, str(tmp_path / "enc.txt"), 5, window_size=64)
+            assert read_text(tmp_path / "enc.txt") == caesar_encrypt(lang, MIXED_TEXT, 5)
+            caesar_decrypt_file(lang, str(tmp_path / "enc.txt"), str(tmp_path / "dec.txt"), 5)
+            assert read_text(tmp_path / "dec.txt") == caesar_encrypt(lang, caesar_encrypt(lang, MIXED_TEXT, 5), -5)
+    
+    def test_in_place(self, tmp_path):
+        """Test in-place encryption when the byte length does not change."""
+        text = "Hello World, this is a test.\n" * 200
+        path = write_text(tmp_path / "data.txt", text)
+        assert vigenere_encrypt_file("english", path, None, "key", window_size=100) == len(text)
+        encrypted = read_text(tmp_path / "data.txt")
+        assert encrypted == reference_vigenere_encrypt("english", text, "key")
+        vigenere_decrypt_file("english", path, None, "key")
+        assert read_text(tmp_path / "data.txt") == reference_vigenere_decrypt("english", encrypted, "key")
+    
+    def test_in_place_rejects_size_change(self, tmp_path):
+        """Test that in-place mode leaves the file untouched when the size would change."""
+        path = write_text(tmp_path / "data.txt", "שלום עולם")
+        with pytest.raises(ValueError):
+            vigenere_encrypt_file("hebrew", path, None, "מפתח")
+        assert read_text(tmp_path / "data.txt") == "שלום עולם"
+    
+    def test_output_is_input(self, tmp_path):
+        """Test that writing to the input file itself transforms it in place instead of truncating it."""
+        text = "hello world, this is a test.\n" * 200
+        path = write_text(tmp_path / "data.txt", text)
+        assert vigenere_encrypt_file("english", path, path, "key", window_size=100) == len(text)
+        assert read_text(tmp_path / "data.txt") == reference_vigenere_encrypt("english", text, "key")
+        
+        hebrew = write_text(tmp_path / "hebrew.txt", "שלום עולם")
+        with pytest.raises(ValueError):
+            vigenere_encrypt_file("hebrew", hebrew, hebrew, "מפתח")
+        assert read_text(tmp_path / "hebrew.txt") == "שלום עולם"
+        
+        vigenere_module.main(["decrypt", "-k", "key", "-i", path, "-o", path, "--mmap"])
+        assert read_text(tmp_path / "data.txt") == text
+    
+    def test_empty_and_unsupported(self, tmp_path):
+        """Test empty files and unsupported languages."""
+        empty = write_text(tmp_path / "empty.txt", "")
+        assert vigenere_encrypt_file("english", empty, str(tmp_path / "out.txt"), "key") == 0
+        assert read_text(tmp_path / "out.txt") == ""
+        source = write_text(tmp_path / "plain.txt", "hello")
+        caesar_encrypt_file("klingon", source, str(tmp_path / "out.txt"), 3)
+        assert read_text(tmp_path / "out.txt") == "hello"
+    
+    def test_cli(self, tmp_path):
+        """Test the --mmap option of the command-line entry points."""
+        source = write_text(tmp_path / "plain.txt", MIXED_TEXT)
+        vigenere_module.main(["encrypt", "-k", "key", "-i", source, "-o", str(tmp_path / "v.txt"), "--mmap"])
+        assert read_text(tmp_path / "v.txt") == reference_vigenere_encrypt("english", MIXED_TEXT, "key")
+        caesar_module.main(["encrypt", "-s", "4", "-i", source, "-o", str(tmp_path / "c.txt"), "--mmap"])
+        assert read_text(tmp_path / "c.txt") == caesar_encrypt("english", MIXED_TEXT, 4)
+        with pytest.raises(SystemExit):
+            vigenere_module.main(["encrypt", "-k", "key", "-i", source, "--mmap"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,69 @@
+import io
+import pytest
+import sys
+import os
+
+# Add the src directory to the Python path to import parallel_cipher
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from alphabets import english_alphabet
+from parallel_cipher import (
+    count_alphabet_chars,
+    segment_key_phases,
+    split_segments,
+    transform_stream_parallel,
+    vigenere_decrypt_parallel,
+    vigenere_encrypt_parallel
+)
+from reference_cipher import reference_vigenere_decrypt, reference_vigenere_encrypt
+
+
+SAMPLE_TEXT = "Hello, World!\n12 Drummers drumming; 11 pipers piping...\n" * 40
+
+
+class TestKeyPhases:
+    """Tests for segment splitting and key phase computation."""
+    
+    def test_count_alphabet_chars(self):
+        """Test that only characters that advance the keyword are counted."""
+        assert count_alphabet_chars(english_alphabet, "Hi, there!") == 8  # letters and the space
+        assert count_alphabet_chars(english_alphabet, "123!?") == 0
+    
+    def test_segment_key_phases(self):
+        """Test that phases account for characters that do not advance the key."""
+        segments = split_segments("ab,c!d", 2)
+        assert segments == ["ab", ",c", "!d"]
+        assert segment_key_phases(english_alphabet, segments, 3) == [0, 2, 0]
+
+
+class TestParallelCipher:
+    """Test that parallel encryption matches the sequential functions."""
+    
+    @pytest.mark.parametrize("segment_size", [1, 7, 100, 100000])
+    def test_encrypt_matches_sequential(self, segment_size):
+        """Test vigenere_encrypt_parallel against vigenere_encrypt."""
+        result = vigenere_encrypt_parallel("english", SAMPLE_TEXT, "secret", workers=2, segment_size=segment_size)
+        assert result == reference_vigenere_encrypt("english", SAMPLE_TEXT, "secret")
+    
+    def test_decrypt_matches_sequential(self):
+        """Test vigenere_decrypt_parallel against vigenere_decrypt."""
+        result = vigenere_decrypt_parallel("hebrew", "שלום עולם, מה שלומך? 123 " * 20, "מפתח",
+                                           workers=2, segment_size=13)
+        assert result == reference_vigenere_decrypt("hebrew", "שלום עולם, מה שלומך? 123 " * 20, "מפתח")
+    
+    def test_fallbacks(self):
+        """Test that unsupported languages and empty keywords return the text unchanged."""
+        assert vigenere_encrypt_parallel("spanish", "hola", "key", workers=2) == "hola"
+        assert vigenere_encrypt_parallel("english", "hello", "123", workers=2) == "hello"
+    
+    def test_stream_matches_sequential(self):
+        """Test that transform_stream_parallel writes the same output in order."""
+        outfile = io.StringIO()
+        processed = transform_stream_parallel("english", io.StringIO(SAMPLE_TEXT), outfile, "secret",
+                                              workers=2, segment_size=50)
+        assert processed == len(SAMPLE_TEXT)
+        assert outfile.getvalue() == reference_vigenere_encrypt("english", SAMPLE_TEXT, "secret")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
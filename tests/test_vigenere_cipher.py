@@ -1,3 +1,4 @@
+import io
 import pytest
 import sys
 import os
@@ -5,9 +6,21 @@ import os
 # Add the src directory to the Python path to import vigenere_cipher
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from reference_cipher import reference_vigenere_decrypt, reference_vigenere_encrypt
 from vigenere_cipher import (
     vigenere_encrypt, 
-    vigenere_decrypt
+    vigenere_decrypt,
+    vigenere_encrypt_many,
+    vigenere_decrypt_many,
+    VigenereCipher,
+    get_cipher,
+    clear_key_cache,
+    key_cache_info,
+    set_key_cache_size,
+    DEFAULT_KEY_CACHE_SIZE,
+    encrypt_stream,
+    decrypt_stream,
+    main
 )
 
 
@@ -171,5 +184,172 @@ class TestVigenereParametrized:
         assert decrypted == text
 
 
+class TestVigenereCipher:
+    """Test that the compiled VigenereCipher matches the per-character reference cipher."""
+    
+    @pytest.mark.parametrize("lang,text,keyword", [
+        ("english", "Hello World", "Key"),
+        ("english", "a b c, d1e!", "xyz"),
+        ("english", "XYZ xyz", "zzz"),
+        ("english", "abc", "k1e2y"),
+        ("english", "the \u212aelvin sign", "key"),  # Kelvin sign lowercases to 'k'
+        ("hebrew", "שלום עולם!", "מפתח"),
+        ("english", "hello", ""),
+        ("english", "hello", "123"),
+        ("unsupported", "test", "key"),
+    ])
+    def test_matches_reference(self, lang, text, keyword):
+        """Test encryption and decryption against the reference cipher."""
+        assert vigenere_encrypt(lang, text, keyword) == reference_vigenere_encrypt(lang, text, keyword)
+        assert vigenere_decrypt(lang, text, keyword) == reference_vigenere_decrypt(lang, text, keyword)
+        cipher = VigenereCipher(lang, keyword)
+        assert cipher.encrypt(text) == reference_vigenere_encrypt(lang, text, keyword)
+        assert cipher.decrypt(text) == reference_vigenere_decrypt(lang, text, keyword)
+    
+    def test_reference_known_outputs(self):
+        """Test the reference cipher itself against known outputs."""
+        assert reference_vigenere_encrypt("english", "Hello World", "Key") == "RiivsxFsovh"
+        assert reference_vigenere_encrypt("english", "a1b2c", "xyz") == "x1z2a"
+        assert reference_vigenere_decrypt("english", "riivs", "key") == "hello"
+    
+    def test_reusable(self):
+        """Test that one compiled cipher can be used for many messages."""
+        cipher = VigenereCipher("english", "key")
+        assert cipher.encrypt("hello") == "riivs"
+        assert cipher.encrypt("hello") == "riivs"
+        assert cipher.decrypt("riivs") == "hello"
+    
+    def test_en_bible_matches_reference(self):
+        """Test the compiled cipher on a sample of the English Bible text."""
+        with open('./assets/bible_en.txt', 'r', encoding='utf-8') as file:
+            original_text = file.read(20000)
+        cipher = VigenereCipher("english", "Jerusalem")
+        encrypted = cipher.encrypt(original_text)
+        assert encrypted == reference_vigenere_encrypt("english", original_text, "Jerusalem")
+        assert vigenere_encrypt("english", original_text, "Jerusalem") == encrypted
+        assert cipher.decrypt(encrypted) == reference_vigenere_decrypt("english", encrypted, "Jerusalem")
+
+
+class TestVigenereMany:
+    """Test suite for the batch encryption functions."""
+    
+    MESSAGES = ["Hello World", "", "a1b2c", "XYZ xyz", "the \u212aelvin sign", "123 !@#", "hello"]
+    
+    def test_matches_single(self):
+        """Test that every message is encrypted as if on its own."""
+        encrypted = vigenere_encrypt_many("english", self.MESSAGES, "Key")
+        assert encrypted == [reference_vigenere_encrypt("english", text, "Key") for text in self.MESSAGES]
+        assert vigenere_decrypt_many("english", encrypted, "Key") == [
+            reference_vigenere_decrypt("english", text, "Key") for text in encrypted]
+        assert encrypted[0] == "RiivsxFsovh"
+    
+    def test_fallbacks(self):
+        """Test unsupported languages, empty keywords and empty batches."""
+        assert vigenere_encrypt_many("spanish", ["hola"], "key") == ["hola"]
+        assert vigenere_encrypt_many("english", ["hello"], "123") == ["hello"]
+        assert vigenere_encrypt_many("english", [], "key") == []
+        assert vigenere_encrypt_many("english", iter(["hello"]), "key") == ["riivs"]
+        with pytest.raises(ValueError):
+            vigenere_encrypt_many("english", ["hello"], "key", backend="gpu")
+
+
+class TestVigenereStream:
+    """Tests for streaming Vigenère encryption over file objects."""
+    
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1024])
+    def test_stream_matches_whole_text(self, chunk_size):
+        """Test that chunk-wise output equals vigenere_encrypt on the whole text."""
+        # Punctuation and digits do not advance the keyword, so chunk boundaries
+        # must carry the key position rather than the character count
+        text = "Hello, World!\n12 Drummers drumming; 11 pipers...\n" * 5
+        outfile = io.StringIO()
+        processed = encrypt_stream("english", io.StringIO(text), outfile, "secret", chunk_size=chunk_size)
+        assert processed == len(text)
+        assert outfile.getvalue() == reference_vigenere_encrypt("english", text, "secret")
+    
+    @pytest.mark.parametrize("chunk_size", [1, 5, 1024])
+    def test_decrypt_stream_matches_whole_text(self, chunk_size):
+        """Test that chunk-wise decryption equals vigenere_decrypt on the whole text."""
+        text = vigenere_encrypt("hebrew", "שלום עולם, מה שלומך? 123 אבג", "מפתח")
+        outfile = io.StringIO()
+        decrypt_stream("hebrew", io.StringIO(text), outfile, "מפתח", chunk_size=chunk_size)
+        assert outfile.getvalue() == reference_vigenere_decrypt("hebrew", text, "מפתח")
+    
+    def test_chunk_key_position(self):
+        """Test that encrypt_chunk returns the key position for the next chunk."""
+        cipher = VigenereCipher("english", "key")
+        first, key_pos = cipher.encrypt_chunk("he, ", 0)
+        second, key_pos = cipher.encrypt_chunk("llo", key_pos)
+        assert first + second == reference_vigenere_encrypt("english", "he, llo", "key")
+        assert key_pos == 0  # 6 alphabet characters with a 3-letter key
+    
+    def test_cli_roundtrip_file(self, tmp_path):
+        """Test the encrypt and decrypt modes of the command-line interface."""
+        plain_path = tmp_path / "plain.txt"
+        cipher_path = tmp_path / "cipher.txt"
+        result_path = tmp_path / "result.txt"
+        plain_path.write_text("hello, world\n", encoding="utf-8")
+        main(["encrypt", "-k", "key", "-i", str(plain_path), "-o", str(cipher_path), "--chunk-size", "4"])
+        assert cipher_path.read_text(encoding="utf-8") == reference_vigenere_encrypt(
+            "english", "hello, world\n", "key")
+        main(["decrypt", "-k", "key", "-i", str(cipher_path), "-o", str(result_path)])
+        assert result_path.read_text(encoding="utf-8") == "hello, world\n"
+
+
+class TestKeyScheduleCache:
+    """Test suite for the (language, keyword) key-schedule cache."""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        clear_key_cache()
+        yield
+        set_key_cache_size(DEFAULT_KEY_CACHE_SIZE)
+        clear_key_cache()
+    
+    def test_hits_and_misses(self):
+        """Test that repeated calls with the same keyword reuse the compiled cipher."""
+        assert vigenere_encrypt("english", "hello", "key") == "riivs"
+        assert vigenere_decrypt("english", "riivs", "key") == "hello"
+        assert vigenere_encrypt("english", "world", "abc") == "wptle"
+        info = key_cache_info()
+        assert info['hits'] == 1
+        assert info['misses'] == 2
+        assert info['size'] == 2
+        assert get_cipher("english", "key") is get_cipher("english", "key")
+    
+    def test_lru_bound(self):
+        """Test that the least recently used keywords are dropped."""
+        set_key_cache_size(2)
+        first = get_cipher("english", "one")
+        get_cipher("english", "two")
+        get_cipher("english", "one")
+        get_cipher("english", "three")  # Evicts "two"
+        assert key_cache_info()['size'] == 2
+        assert get_cipher("english", "one") is first
+        misses = key_cache_info()['misses']
+        get_cipher("english", "two")
+        assert key_cache_info()['misses'] == misses + 1
+        with pytest.raises(ValueError):
+            set_key_cache_size(0)
+    
+    def test_unsupported_and_empty_keywords(self):
+        """Test that fallbacks still return the original text when served from the cache."""
+        for _ in range(2):
+            assert vigenere_encrypt("spanish", "hola", "key") == "hola"
+            assert vigenere_encrypt("english", "hello", "123") == "hello"
+            assert vigenere_decrypt("english", "hello", "") == "hello"
+    
+    def test_alphabet_replaced(self):
+        """Test that re-registering an alphabet does not reuse stale shift tables."""
+        from alphabets import register_alphabet, unregister_alphabet
+        register_alphabet("tiny", "abc")
+        try:
+            assert vigenere_encrypt("tiny", "abc", "b") == "bca"
+            register_alphabet("tiny", "abcd", replace=True)
+            assert vigenere_encrypt("tiny", "abc", "b") == "bcd"
+        finally:
+            unregister_alphabet("tiny")
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file